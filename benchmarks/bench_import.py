@@ -0,0 +1,52 @@
+#!/usr/bin/env python
+# licensed under the BSD 2-clause license
+
+"""Measure the cost of ``import http_status`` with ``python -X importtime``.
+
+Each measurement runs in a fresh interpreter with bytecode caching enabled,
+after a warm-up run, and the best of several runs is reported. Run from the repository root::
+
+    $ python benchmarks/bench_import.py
+"""
+
+import os
+import re
+import subprocess
+import sys
+
+SRC = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src')
+RUNS = 15
+
+CASES = (
+    ('import http_status', 'import http_status'),
+    ('... and load descriptions', 'import http_status; http_status.description'),
+    ('... and import wire', 'import http_status; http_status.wire'),
+)
+
+_line = re.compile(r'import time:\s+(\d+) \|\s+(\d+) \|(\s*)(\S+)')
+
+
+def import_time(statement):
+    """Return the cumulative microseconds spent importing http_status modules for statement."""
+    env = dict(os.environ)
+    env.pop('PYTHONDONTWRITEBYTECODE', None)
+    output = subprocess.run([sys.executable, '-X', 'importtime', '-c', statement], cwd=SRC, env=env,
+                            stderr=subprocess.PIPE, check=True).stderr.decode()
+    total = 0
+    for match in _line.finditer(output):
+        self_us, cumulative_us, indent, module = match.groups()
+        # count top-level http_status imports only, their cumulative time includes children
+        if module.split('.')[0] == 'http_status' and len(indent) == 1:
+            total += int(cumulative_us)
+    return total
+
+
+def main():
+    for label, statement in CASES:
+        import_time(statement)
+        best = min(import_time(statement) for _ in range(RUNS))
+        print('{:<28} {:7d} us'.format(label, best))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,61 @@
+#!/usr/bin/env python
+# licensed under the BSD 2-clause license
+
+"""Measure how http_status.logs.count_files() scales with the number of processes.
+
+Writes a synthetic access log to a temporary directory and counts it with
+1, 2, 4, ... processes up to the CPU count. Run from the repository root::
+
+    $ python benchmarks/bench_logs_parallel.py [lines]
+"""
+
+import multiprocessing
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from http_status import logs  # noqa: E402
+
+CODES = [200] * 80 + [304] * 8 + [404] * 6 + [499, 500, 502, 503, 301, 429, 777]
+LINE = ('10.0.{}.{} - - [10/Oct/2014:13:55:36 +0000] "GET /items/{} HTTP/1.1" {} 612 "-" '
+        '"Mozilla/5.0 (X11; Linux x86_64)"\n')
+
+
+def write_log(path, lines):
+    """Write a synthetic combined-format log."""
+    rng = random.Random(0)
+    with open(path, 'w') as handle:
+        for index in range(lines):
+            handle.write(LINE.format(index % 256, index % 200, index, rng.choice(CODES)))
+
+
+def main():
+    lines = int(sys.argv[1]) if len(sys.argv) > 1 else 2000000
+    directory = tempfile.mkdtemp()
+    try:
+        path = os.path.join(directory, 'access.log')
+        write_log(path, lines)
+        megabytes = os.path.getsize(path) / 1e6
+        print('{} lines, {:.0f} MB'.format(lines, megabytes))
+
+        processes, baseline = 1, None
+        while processes <= multiprocessing.cpu_count():
+            start = time.time()
+            aggregator = logs.count_files([path], processes=processes, size=8 * 1024 * 1024)
+            elapsed = time.time() - start
+            assert aggregator.total == lines
+            baseline = baseline or elapsed
+            print('{:3d} processes {:7.2f} s {:8.1f} MB/s  speedup {:.2f}x'.format(
+                processes, elapsed, megabytes / elapsed, baseline / elapsed))
+            processes *= 2
+    finally:
+        shutil.rmtree(directory)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,40 @@
+#!/usr/bin/env python
+# licensed under the BSD 2-clause license
+
+"""Compare the size and speed of pickling lists of Status against encode_statuses().
+
+Run from the repository root::
+
+    $ python benchmarks/bench_pickle.py
+"""
+
+import os
+import pickle
+import random
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from http_status import Status, encode_statuses, decode_statuses  # noqa: E402
+
+CODES = [200, 201, 204, 301, 302, 304, 400, 401, 403, 404, 429, 500, 502, 503, 504]
+SIZE = 100000
+
+
+def main():
+    rng = random.Random(0)
+    codes = [rng.choice(CODES) for _ in range(SIZE)]
+    for label, statuses in (('Status()', [Status(code) for code in codes]),
+                            ('Status.of()', [Status.of(code) for code in codes])):
+        for name, dumps, loads in (('pickle', lambda items: pickle.dumps(items, pickle.HIGHEST_PROTOCOL), pickle.loads),
+                                   ('encode_statuses', encode_statuses, decode_statuses)):
+            data = dumps(statuses)
+            encode = min(timeit.repeat(lambda: dumps(statuses), number=1, repeat=3))
+            decode = min(timeit.repeat(lambda: loads(data), number=1, repeat=3))
+            print('{:<12} {:<16} {:8d} bytes {:7.1f} ns/item dump {:7.1f} ns/item load'.format(
+                label, name, len(data), encode / SIZE * 1e9, decode / SIZE * 1e9))
+
+
+if __name__ == '__main__':
+    main()
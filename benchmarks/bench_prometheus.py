@@ -0,0 +1,83 @@
+#!/usr/bin/env python
+# licensed under the BSD 2-clause license
+
+"""Measure the time to render a Prometheus scrape as routes and codes grow.
+
+Compares MetricsRenderer on its first scrape, on later scrapes where 1% of
+the series changed, and plain string formatting of every line.
+
+Run from the repository root::
+
+    $ python benchmarks/bench_prometheus.py
+"""
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from http_status import name  # noqa: E402
+from http_status.prometheus import MetricsRenderer  # noqa: E402
+
+CODES = sorted(name)
+
+
+def make_routes(routes, codes):
+    """Return {route: {code: count}} with the given numbers of routes and codes."""
+    return dict(('/route/{}'.format(index), dict((code, index + code) for code in CODES[:codes]))
+                for index in range(routes))
+
+
+def naive(routes):
+    """Format every line of a scrape from scratch."""
+    lines = ['# TYPE http_route_responses_total counter\n']
+    for route, counts in sorted(routes.items()):
+        for code, count in counts.items():
+            lines.append('http_route_responses_total{{route="{}",class="{}xx",code="{}",reason="{}"}} {}\n'.format(
+                route, code // 100, code, name[code], count))
+    return ''.join(lines).encode('utf-8')
+
+
+def scrape(renderer, routes):
+    renderer.begin()
+    for route, counts in sorted(routes.items()):
+        renderer.counter('http_route_responses_total', counts, labels={'route': route})
+    renderer.finish().release()
+
+
+def touch(routes, step):
+    """Change the counts of 1% of the series."""
+    for counts in routes.values():
+        for code in list(counts)[step % 100::100]:
+            counts[code] += 1
+
+
+def best(function, number):
+    """Return the best time of calling function, in milliseconds."""
+    return min(timeit.repeat(function, number=number, repeat=5)) / number * 1e3
+
+
+def main():
+    print('{:>7} {:>6} {:>8} {:>12} {:>12} {:>12}'.format('routes', 'codes', 'series', 'naive ms', 'first ms',
+                                                       'steady ms'))
+    for routes_count, codes_count in ((10, 10), (100, 10), (100, len(CODES)), (1000, len(CODES))):
+        routes = make_routes(routes_count, codes_count)
+        number = max(1, 20000 // (routes_count * codes_count))
+        naive_ms = best(lambda: naive(routes), number)
+        first_ms = best(lambda: scrape(MetricsRenderer(), routes), number)
+        renderer = MetricsRenderer()
+        scrape(renderer, routes)
+        steps = iter(range(10 ** 9))
+
+        def steady():
+            touch(routes, next(steps))
+            scrape(renderer, routes)
+
+        steady_ms = best(steady, number) - best(lambda: touch(routes, next(steps)), number)
+        print('{:>7} {:>6} {:>8} {:>12.3f} {:>12.3f} {:>12.3f}'.format(
+            routes_count, codes_count, routes_count * codes_count, naive_ms, first_ms, steady_ms))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,94 @@
+#!/usr/bin/env python
+# licensed under the BSD 2-clause license
+
+"""Simulate a client calling an upstream that fails for a minute, with and without a CircuitBreaker.
+
+Prints, for every 10 seconds of simulated time, the requests sent to the
+upstream and the requests shed by the breaker, then the time allow() and
+record() add to each request and the time a RetryClassifier decision takes
+compared with an if-chain.
+
+Run from the repository root::
+
+    $ python benchmarks/bench_retry.py
+"""
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from http_status.retry import CircuitBreaker, RetryClassifier  # noqa: E402
+
+RATE = 200
+DURATION = 180
+OUTAGE = (60, 120)
+
+
+def upstream(now):
+    """Return the status of a response at a simulated time: 503s during the outage."""
+    return 503 if OUTAGE[0] <= now < OUTAGE[1] else 200
+
+
+class Clock(object):
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def simulate(breaker, clock):
+    """Return a list of (sent, shed) per 10 seconds of simulated traffic."""
+    periods = [[0, 0] for index in range(DURATION // 10)]
+    for index in range(DURATION * RATE):
+        clock.now = now = index / float(RATE)
+        period = periods[int(now) // 10]
+        if breaker is not None and not breaker.allow():
+            period[1] += 1
+            continue
+        period[0] += 1
+        if breaker is not None:
+            breaker.record(upstream(now))
+    return periods
+
+
+def if_chain(code, retry_after):
+    if code in (502, 503, 504):
+        return True
+    elif code == 429 and retry_after is not None:
+        return True
+    elif code == 408:
+        return True
+    return False
+
+
+def main():
+    clock = Clock()
+    without = simulate(None, clock)
+    clock = Clock()
+    breaker = CircuitBreaker(clock=clock, reset_timeout=5.0)
+    shed = simulate(breaker, clock)
+    print('{:>8} {:>16} {:>16} {:>10}'.format('seconds', 'sent, no breaker', 'sent, breaker', 'shed'))
+    for index, ((plain, _), (sent, dropped)) in enumerate(zip(without, shed)):
+        print('{:>8} {:>16} {:>16} {:>10}'.format('{}-{}'.format(index * 10, index * 10 + 10), plain, sent, dropped))
+    print('failed requests sent: {} without the breaker, {} with it'.format(
+        (OUTAGE[1] - OUTAGE[0]) * RATE, sum(sent for sent, _ in shed[OUTAGE[0] // 10:OUTAGE[1] // 10])))
+
+    number = 200000
+    breaker = CircuitBreaker()
+    allow = breaker.allow
+    record = breaker.record
+    elapsed = min(timeit.repeat(lambda: allow() and record(200), number=number, repeat=5)) / number * 1e9
+    baseline = min(timeit.repeat(lambda: True and None, number=number, repeat=5)) / number * 1e9
+    print('allow() and record(200): {:.1f} ns per request'.format(elapsed - baseline))
+
+    decision = RetryClassifier().decisions
+    table = min(timeit.repeat(lambda: decision[503] & 1, number=number, repeat=5)) / number * 1e9
+    chain = min(timeit.repeat(lambda: if_chain(408, None), number=number, repeat=5)) / number * 1e9
+    print('decision table: {:.1f} ns, if-chain to 408: {:.1f} ns'.format(table - baseline, chain - baseline))
+
+
+if __name__ == '__main__':
+    main()
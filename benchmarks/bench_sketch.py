@@ -0,0 +1,69 @@
+#!/usr/bin/env python
+# licensed under the BSD 2-clause license
+
+"""Compare StatusSketch with exact per-path counters on high-cardinality paths.
+
+Counts Zipf-distributed paths, most of them seen once, and prints the memory
+of each, how many of the true top 20 paths producing 5xx the sketch finds,
+its largest overestimate, and the time to add a response and to merge two
+sketches.
+
+Run from the repository root::
+
+    $ python benchmarks/bench_sketch.py [responses]
+"""
+
+import os
+import pickle
+import random
+import sys
+import timeit
+from collections import Counter
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from http_status.sketch import StatusSketch  # noqa: E402
+
+CODES = (200,) * 90 + (404,) * 5 + (500, 502, 503, 503, 429)
+
+
+def main():
+    responses = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    generator = random.Random(1)
+    traffic = [('/users/{}/orders/{}'.format(int(generator.paretovariate(1.0)), generator.randrange(10 ** 6)),
+                generator.choice(CODES)) for index in range(responses // 2)]
+    traffic += [('/items/{}'.format(int(generator.paretovariate(1.1))), generator.choice(CODES))
+                for index in range(responses - len(traffic))]
+    generator.shuffle(traffic)
+
+    exact = Counter()
+    for path, code in traffic:
+        exact[path, code] += 1
+    errors = Counter()
+    for (path, code), count in exact.items():
+        if code >= 500:
+            errors[path] += count
+    heaviest = set(path for path, count in errors.most_common(20))
+    print('{} responses, {} distinct (path, code) pairs'.format(responses, len(exact)))
+    print('exact counters: {} bytes pickled'.format(len(pickle.dumps(exact, 2))))
+
+    for sketch in (StatusSketch(), StatusSketch.from_error(0.0002, 0.01)):
+        for path, code in traffic:
+            sketch.add(path, code)
+        found = set(path for path, estimate in sketch.top('5xx', 20))
+        print('\nsketch of {}x{}: {} bytes pickled'.format(sketch.width, sketch.depth, len(pickle.dumps(sketch, 2))))
+        print('top 20 paths producing 5xx found: {}/20'.format(len(heaviest & found)))
+        print('largest overestimate: {} (bound {:.0f})'.format(
+            max(sketch.estimate(path, code) - count for (path, code), count in exact.items()),
+            2.72 / sketch.width * sketch.total))
+
+        number = 20000
+        add_us = min(timeit.repeat(lambda: sketch.add('/users/1/orders/1', 503), number=number, repeat=3))
+        print('add: {:.2f} us'.format(add_us / number * 1e6))
+        other = pickle.loads(pickle.dumps(sketch, 2))
+        merge_ms = min(timeit.repeat(lambda: sketch + other, number=3, repeat=3)) / 3 * 1e3
+        print('merge: {:.1f} ms'.format(merge_ms))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,83 @@
+#!/usr/bin/env python
+# licensed under the BSD 2-clause license
+
+"""Compare ErrorRateTracker with a deque of (time, code) tuples.
+
+Records an hour of responses at the given rate, then times recording and
+evaluating a 1 hour and 5 minute burn-rate alert.
+
+Run from the repository root::
+
+    $ python benchmarks/bench_slo.py [requests per second]
+"""
+
+import collections
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from http_status.slo import ErrorRateTracker  # noqa: E402
+
+CODES = (200,) * 97 + (404, 503, 499)
+
+
+class DequeTracker(object):
+    """The usual approach: every response as a (time, code) tuple, expired from the left."""
+
+    def __init__(self, window=3600):
+        self.window = window
+        self.events = collections.deque()
+
+    def record(self, code, now):
+        self.events.append((now, code))
+        while self.events[0][0] <= now - self.window:
+            self.events.popleft()
+
+    def error_ratio(self, seconds, now):
+        start = now - seconds
+        total = bad = 0
+        for time, code in reversed(self.events):
+            if time <= start:
+                break
+            total += 1
+            if code >= 500:
+                bad += 1
+        return float(bad) / total if total else 0.0
+
+    def firing(self, now):
+        return self.error_ratio(3600, now) >= 0.0144 and self.error_ratio(300, now) >= 0.0144
+
+
+class NoTracker(object):
+    """Measures the cost of the benchmark loop itself."""
+
+    def record(self, code, now):
+        pass
+
+    def firing(self, now):
+        pass
+
+
+def main():
+    rate = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    step = 1.0 / rate
+    responses = 3600 * rate
+    for label, tracker in (('loop overhead', NoTracker()), ('deque of tuples', DequeTracker()),
+                           ('ErrorRateTracker', ErrorRateTracker())):
+        for index in range(responses):
+            tracker.record(CODES[index % 100], index * step)
+        clock = [responses * step]
+
+        def record():
+            clock[0] += step
+            tracker.record(503, clock[0])
+
+        record_ns = min(timeit.repeat(record, number=100000, repeat=5)) / 100000 * 1e9
+        firing_us = min(timeit.repeat(lambda: tracker.firing(now=clock[0]), number=10, repeat=5)) / 10 * 1e6
+        print('{:<18} record {:8.1f} ns   evaluate alerts {:12.1f} us'.format(label, record_ns, firing_us))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,64 @@
+#!/usr/bin/env python
+# licensed under the BSD 2-clause license
+
+"""Compare Status objects against plain ints as dict keys, sort keys and indexes.
+
+Run from the repository root::
+
+    $ python benchmarks/bench_status_int.py
+"""
+
+import os
+import random
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from http_status import Status, _name_table  # noqa: E402
+
+CODES = [200, 201, 204, 301, 302, 304, 400, 401, 403, 404, 429, 500, 502, 503, 504]
+SIZE = 10000
+
+
+def count(keys):
+    """Count keys in a dict, the way a per-code metric would."""
+    counts = {}
+    for key in keys:
+        counts[key] = counts.get(key, 0) + 1
+    return counts
+
+
+def lookup(keys, table):
+    """Look every key up in a dict keyed by plain ints."""
+    for key in keys:
+        table[key]
+
+
+def index(keys):
+    """Index the name table with every key."""
+    for key in keys:
+        _name_table[key]
+
+
+def main():
+    rng = random.Random(0)
+    ints = [rng.choice(CODES) for _ in range(SIZE)]
+    workloads = (
+        ('int', ints),
+        ('Status.of()', [Status.of(code) for code in ints]),
+        ('Status()', [Status(code) for code in ints]),
+    )
+    table = dict((code, code) for code in CODES)
+
+    for name, func in (('dict count', count),
+                       ('dict lookup', lambda keys: lookup(keys, table)),
+                       ('sort', sorted),
+                       ('table index', index)):
+        for label, keys in workloads:
+            per_item = min(timeit.repeat(lambda: func(keys), number=20, repeat=5)) / 20 / SIZE
+            print('{:<12} {:<12} {:8.1f} ns/item'.format(name, label, per_item * 1e9))
+
+
+if __name__ == '__main__':
+    main()
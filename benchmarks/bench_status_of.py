@@ -0,0 +1,45 @@
+#!/usr/bin/env python
+# licensed under the BSD 2-clause license
+
+"""Compare building a new Status per lookup against the interned Status.of().
+
+Run from the repository root::
+
+    $ python benchmarks/bench_status_of.py
+"""
+
+import os
+import sys
+import timeit
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from http_status import Status  # noqa: E402
+
+CODES = [200, 201, 204, 301, 302, 304, 400, 401, 403, 404, 429, 500, 502, 503, 504]
+NUMBER = 200000
+
+
+def allocated(func):
+    """Return the bytes still held after calling func for every code in CODES."""
+    tracemalloc.start()
+    held = [func(code) for code in CODES]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del held
+    return size
+
+
+def main():
+    Status.of(200)  # build the interned table up front
+
+    for label, func in (('Status(code)', Status), ('Status.of(code)', Status.of)):
+        per_call = min(timeit.repeat(lambda: [func(code).name for code in CODES], number=NUMBER // len(CODES),
+                                     repeat=5)) / NUMBER
+        print('{:<18} {:8.1f} ns/lookup {:6d} bytes held for {} objects'.format(
+            label, per_call * 1e9, allocated(func), len(CODES)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,53 @@
+#!/usr/bin/env python
+# licensed under the BSD 2-clause license
+
+"""Compare the old two-step dict lookup against the dense lookup tables.
+
+Run from the repository root::
+
+    $ python benchmarks/bench_tables.py
+"""
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+import http_status  # noqa: E402
+from http_status import Status  # noqa: E402
+
+CODES = [200, 201, 204, 301, 302, 304, 400, 401, 403, 404, 429, 480, 500, 502, 503, 504]
+NUMBER = 500000
+
+
+def dict_lookup(code, table=dict(http_status.name), fail='No HTTP Name'):
+    """The lookup Status.name did before the dense tables."""
+    if code in table:
+        return table[code]
+    return fail
+
+
+def table_lookup(code, table=http_status._name_table, fail='No HTTP Name'):
+    """The lookup Status.name does now."""
+    value = table[code]
+    if value is None:
+        return fail
+    return value
+
+
+def main():
+    statuses = [Status(code) for code in CODES]
+    cases = (
+        ('dict lookup', lambda: [dict_lookup(code) for code in CODES]),
+        ('table lookup', lambda: [table_lookup(code) for code in CODES]),
+        ('Status.name', lambda: [s.name for s in statuses]),
+        ('Status.description', lambda: [s.description for s in statuses]),
+    )
+    for label, func in cases:
+        per_call = min(timeit.repeat(func, number=NUMBER // len(CODES), repeat=5)) / NUMBER
+        print('{:<20} {:8.1f} ns/lookup'.format(label, per_call * 1e9))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+#!/usr/bin/env python
+# licensed under the BSD 2-clause license
+
+"""Compare validate_http_code() against the previous int()-based version, per input type.
+
+Run from the repository root::
+
+    $ python benchmarks/bench_validate.py
+"""
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from http_status import InvalidHttpCode, validate_http_code  # noqa: E402
+
+NUMBER = 500000
+
+
+def old_validate_http_code(http_code, minimum=100, maximum=599, strict=True, default_http_code=0):
+    """validate_http_code() as it was before the fast paths."""
+    try:
+        http_code = int(http_code)
+    except:
+        if strict:
+            raise InvalidHttpCode('[{}] {}  is not a valid integer'.format(http_code, type(http_code)))
+        else:
+            return default_http_code
+
+    if http_code < minimum:
+        if strict:
+            raise InvalidHttpCode('{} is below minimum HTTP status code {}'.format(http_code, minimum))
+        else:
+            return default_http_code
+    elif http_code > maximum:
+        if strict:
+            raise InvalidHttpCode('{} is above maximum HTTP status code {}'.format(http_code, maximum))
+        else:
+            return default_http_code
+    return http_code
+
+
+CASES = (
+    ('int', 404, True),
+    ('str', '404', True),
+    ('bytes', b'404', True),
+    ('bytearray', bytearray(b'404'), True),
+    ('memoryview', memoryview(b'HTTP/1.1 404 Not Found')[9:12], True),
+    ('invalid int, non-strict', 777, False),
+    ('invalid bytes, non-strict', b'4x4', False),
+)
+
+
+def main():
+    for label, code, strict in CASES:
+        timings = []
+        for func in (old_validate_http_code, validate_http_code):
+            try:
+                func(code, strict=strict)
+            except Exception:
+                timings.append(None)
+                continue
+            timings.append(min(timeit.repeat(lambda: func(code, strict=strict), number=NUMBER, repeat=5)) / NUMBER)
+        old, new = ['{:7.1f} ns'.format(t * 1e9) if t is not None else '   error' for t in timings]
+        print('{:<26} old {}  new {}'.format(label, old, new))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,64 @@
+#!/usr/bin/env python
+# licensed under the BSD 2-clause license
+
+"""Compare wire.parse_status_line() against a naive split/decode parser.
+
+Run from the repository root::
+
+    $ python benchmarks/bench_wire_parse.py
+"""
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+import http_status  # noqa: E402
+from http_status import wire  # noqa: E402
+
+NUMBER = 200000
+RESPONSE = (b'HTTP/1.1 502 Bad Gateway\r\nServer: nginx\r\nContent-Type: text/html\r\n'
+            b'Content-Length: 157\r\nConnection: keep-alive\r\n\r\n' + b'x' * 157)
+PIPELINED = RESPONSE * 64
+
+
+def naive_parse(data, offset=0):
+    """Decode and split the first line, the way the parser is usually written by hand."""
+    line = data[offset:data.index(b'\n', offset)].decode('latin-1').rstrip('\r')
+    protocol, code, reason = line.split(' ', 2)
+    code = http_status.validate_http_code(code)
+    major, minor = protocol[5:].split('.')
+    return code, (int(major), int(minor)), http_status.name.get(code) == reason
+
+
+def naive_scan(data):
+    """Decode the head of every response into a dict of headers, and skip its body by Content-Length."""
+    results = []
+    offset = 0
+    while offset < len(data):
+        end = data.index(b'\r\n\r\n', offset)
+        lines = data[offset:end].decode('latin-1').split('\r\n')
+        headers = dict((name.strip().lower(), value.strip())
+                       for name, value in (line.split(':', 1) for line in lines[1:]))
+        results.append((offset,) + naive_parse(data, offset))
+        offset = end + 4 + int(headers.get('content-length', 0))
+    return results
+
+
+def main():
+    view = memoryview(RESPONSE)
+    cases = (
+        ('naive split/decode', lambda: naive_parse(RESPONSE), NUMBER),
+        ('parse_status_line bytes', lambda: wire.parse_status_line(RESPONSE), NUMBER),
+        ('parse_status_line memoryview', lambda: wire.parse_status_line(view), NUMBER),
+        ('naive scan, 64 responses', lambda: naive_scan(PIPELINED), NUMBER // 100),
+        ('scan_status_lines, 64 responses', lambda: list(wire.scan_status_lines(PIPELINED)), NUMBER // 100),
+    )
+    for label, func, number in cases:
+        per_call = min(timeit.repeat(func, number=number, repeat=5)) / number
+        print('{:<34} {:10.1f} ns/call'.format(label, per_call * 1e9))
+
+
+if __name__ == '__main__':
+    main()
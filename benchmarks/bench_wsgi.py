@@ -0,0 +1,61 @@
+#!/usr/bin/env python
+# licensed under the BSD 2-clause license
+
+"""Measure the time StatusMiddleware adds to each WSGI request.
+
+Run from the repository root::
+
+    $ python benchmarks/bench_wsgi.py
+"""
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from http_status.wsgi import StatusMiddleware  # noqa: E402
+
+NUMBER = 200000
+BODY = [b'ok']
+HEADERS = [('Content-Type', 'text/plain')]
+
+
+def app(environ, start_response):
+    start_response('200 OK', HEADERS)
+    return BODY
+
+
+def routed_app(environ, start_response):
+    environ['http_status.route'] = '/users/<id>'
+    start_response('200 OK', HEADERS)
+    return BODY
+
+
+def mismatched_app(environ, start_response):
+    start_response('200 Fine', HEADERS)
+    return BODY
+
+
+def start_response(status, headers, exc_info=None):
+    pass
+
+
+def per_request(wsgi_app):
+    """Return the best time per request of calling wsgi_app, in nanoseconds."""
+    environ = {}
+    return min(timeit.repeat(lambda: wsgi_app(environ, start_response), number=NUMBER, repeat=5)) / NUMBER * 1e9
+
+
+def main():
+    baseline = per_request(app)
+    print('{:<24} {:8.1f} ns/request'.format('bare app', baseline))
+    for label, wrapped in (('middleware', StatusMiddleware(app)),
+                           ('middleware with route', StatusMiddleware(routed_app)),
+                           ('middleware mismatched', StatusMiddleware(mismatched_app))):
+        elapsed = per_request(wrapped)
+        print('{:<24} {:8.1f} ns/request, {:+.1f} ns added'.format(label, elapsed, elapsed - baseline))
+
+
+if __name__ == '__main__':
+    main()
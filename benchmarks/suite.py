@@ -0,0 +1,148 @@
+#!/usr/bin/env python
+# licensed under the BSD 2-clause license
+
+"""Benchmark suite for the hot paths of http_status, with JSON results.
+
+Run the suite and save the results::
+
+    $ python benchmarks/suite.py run -o before.json
+
+Then, after a change::
+
+    $ python benchmarks/suite.py run -o after.json
+    $ python benchmarks/suite.py compare before.json after.json --threshold 10
+
+``compare`` exits with status 1 if any benchmark got slower by more than the
+threshold, in percent.
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+SETUP = '''
+from http_status import Status, NoneStatus, validate_http_code
+status = Status(404)
+undefined = Status(480)
+nonstrict = Status(404, strict=False)
+interned = Status.of(404)
+view = memoryview(b'HTTP/1.1 404 Not Found')[9:12]
+status.description
+'''
+
+# name: statement, timed against SETUP
+BENCHMARKS = (
+    ('Status() strict', 'Status(404)'),
+    ('Status() non-strict', 'Status(404, strict=False)'),
+    ('Status() non-strict invalid', 'Status(9999, strict=False)'),
+    ('Status.of()', 'Status.of(404)'),
+    ('NoneStatus()', 'NoneStatus(404)'),
+    ('code reassignment', 'status.code = 503'),
+    ('code reassignment non-strict', 'nonstrict.code = 503'),
+    ('name hit', 'status.name'),
+    ('name fail', 'undefined.name'),
+    ('name interned', 'interned.name'),
+    ('description hit', 'status.description'),
+    ('description fail', 'undefined.description'),
+    ('validate_http_code int', 'validate_http_code(404)'),
+    ('validate_http_code str', "validate_http_code('404')"),
+    ('validate_http_code bytes', "validate_http_code(b'404')"),
+    ('validate_http_code memoryview', 'validate_http_code(view)'),
+    ('validate_http_code float', 'validate_http_code(404.0)'),
+    ('validate_http_code invalid non-strict', 'validate_http_code(9999, strict=False)'),
+    ('validate_http_code garbage non-strict', "validate_http_code('4x4', strict=False)"),
+    ('__unicode__', 'status.__unicode__()'),
+    ('__unicode__ verbose', 'status.__unicode__(verbose=True)'),
+    ('__unicode__ undefined', 'undefined.__unicode__()'),
+)
+
+
+def measure(statement, repeat, target_time):
+    """Return per-op timings in nanoseconds, one for each of repeat runs."""
+    timer = timeit.Timer(statement, SETUP)
+    number, _ = timer.autorange()
+    number = max(1, int(number * target_time / 0.2))
+    return [elapsed / number * 1e9 for elapsed in timer.repeat(repeat=repeat, number=number)]
+
+
+def run(args):
+    """Run the benchmarks and write the results as JSON."""
+    results = {}
+    for name, statement in BENCHMARKS:
+        if args.filter and args.filter not in name:
+            continue
+        runs = measure(statement, args.repeat, args.time)
+        results[name] = {'ns_per_op': min(runs), 'runs': runs}
+        print('{:<40} {:9.1f} ns'.format(name, min(runs)), file=sys.stderr)
+
+    data = {
+        'python': platform.python_implementation() + ' ' + platform.python_version(),
+        'platform': platform.platform(),
+        'results': results,
+    }
+    if args.output == '-':
+        json.dump(data, sys.stdout, indent=2, sort_keys=True)
+        sys.stdout.write('\n')
+    else:
+        with open(args.output, 'w') as handle:
+            json.dump(data, handle, indent=2, sort_keys=True)
+    return 0
+
+
+def compare(args):
+    """Compare two result files, returning 1 if anything regressed past the threshold."""
+    with open(args.baseline) as handle:
+        baseline = json.load(handle)['results']
+    with open(args.current) as handle:
+        current = json.load(handle)['results']
+
+    regressed = []
+    for name in sorted(set(baseline) | set(current)):
+        if name not in baseline or name not in current:
+            print('{:<40} only in {}'.format(name, args.baseline if name in baseline else args.current))
+            continue
+        before = baseline[name]['ns_per_op']
+        after = current[name]['ns_per_op']
+        change = (after - before) / before * 100
+        flag = ''
+        if change > args.threshold:
+            regressed.append(name)
+            flag = '  REGRESSION'
+        print('{:<40} {:9.1f} ns -> {:9.1f} ns {:+7.1f}%{}'.format(name, before, after, change, flag))
+
+    if regressed:
+        print('{} benchmark(s) slower by more than {}%'.format(len(regressed), args.threshold))
+        return 1
+    return 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark suite for http_status.')
+    commands = parser.add_subparsers(dest='command')
+    commands.required = True
+
+    run_parser = commands.add_parser('run', help='run the benchmarks')
+    run_parser.add_argument('-o', '--output', default='-', help='JSON file to write, default stdout')
+    run_parser.add_argument('-r', '--repeat', type=int, default=5, help='timing runs per benchmark, best is used')
+    run_parser.add_argument('-t', '--time', type=float, default=0.2, help='target seconds per timing run')
+    run_parser.add_argument('-k', '--filter', help='only run benchmarks whose name contains this')
+    run_parser.set_defaults(func=run)
+
+    compare_parser = commands.add_parser('compare', help='compare two result files')
+    compare_parser.add_argument('baseline')
+    compare_parser.add_argument('current')
+    compare_parser.add_argument('--threshold', type=float, default=10.0,
+                                help='percent slowdown counted as a regression (default: 10)')
+    compare_parser.set_defaults(func=compare)
+
+    args = parser.parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -83,11 +83,83 @@ This can be changed by passing arguments ``name_fail`` and
     'Nothing at all'
 
 The class ``NoneStatus`` is exactly the same as Status, but ``name_fail``
-and ``description_fail`` both default to None."""
+and ``description_fail`` both default to None.
+
+For hot paths, ``Status.of()`` and ``NoneStatus.of()`` return shared, immutable
+instances instead of building a new object for every call::
+
+    >>> from http_status import Status
+    >>> s = Status.of(404)
+    >>> s is Status.of(404)
+    True
+    >>> s.name
+    'Not Found'
+    >>> s.code = 405
+    Traceback (most recent call last):
+      ...
+    AttributeError: Status instances returned by of() are immutable
+
+Status objects can also answer common questions about their code, each with
+a single table lookup::
+
+    >>> from http_status import Status
+    >>> s = Status(308)
+    >>> s.cacheable, s.may_have_body, s.retryable, s.preserves_method, s.is_error
+    (True, True, False, True, False)
+
+The table behind them, ``http_status.status_flags``, holds bits such as
+``http_status.CACHEABLE`` for every code.
+
+Status objects compare, hash and index like their code, so they can be used
+in place of ints, as dict keys or sorted::
+
+    >>> from http_status import Status
+    >>> Status(404) == 404
+    True
+    >>> {404: 'missing'}[Status.of(404)]
+    'missing'
+
+Instances from ``Status.of()`` are ``int`` subclasses, so they do all of this
+at the speed of a plain int."""
 
 __author__ = 'Daniel Oaks <daniel@danieloaks.net>, Chad Nelson'
 
-import six
+import sys
+
+if sys.version_info[0] == 2:
+    from . import six
+    _u = six.u
+    _int_types = six.integer_types
+else:
+    def _u(text):
+        return text
+    _int_types = (int,)
+
+try:
+    from types import MappingProxyType
+except ImportError:
+    # Python 2 has no mapping proxy, use a minimal read-only view instead
+    from collections import Mapping
+
+    class MappingProxyType(Mapping):
+        """Read-only view of a dict."""
+        def __init__(self, mapping):
+            self._mapping = mapping
+
+        def __getitem__(self, key):
+            return self._mapping[key]
+
+        def __iter__(self):
+            return iter(self._mapping)
+
+        def __len__(self):
+            return len(self._mapping)
+
+        def __contains__(self, key):
+            return key in self._mapping
+
+        def __repr__(self):
+            return 'mappingproxy({!r})'.format(self._mapping)
 
 # Source 1: Hypertext Transfer Protocol -- HTTP/1.1 RFC 2616 Fielding, et al.
 #           http://www.w3.org/Protocols/rfc2616/rfc2616-sec10.html
@@ -95,7 +167,7 @@ import six
 # Source of the status code and description is assumed to be Source 1 unless otherwise noted.
 
 # Names of HTTP status codes.
-name = {
+_name_dict = {
     # Informational.
     100: 'Continue',
     101: 'Switching Protocols',
@@ -179,145 +251,420 @@ name = {
     511: 'Network Authentication'       # RFC 6585
 }
 
-# Descriptions of HTTP status codes.
-description = {
-    # Informational.
-    100: 'Continue with the request.',
-    101: 'Server is switching to a different protocol.',
-    102: 'Server has received and is processing the request, but no response is available yet.',
 
-    # Success
-    200: 'Request was successful.',
-    201: 'Request was successful, and a new resource has been created.',
-    202: 'Request has been accepted but not yet acted upon.',
-    203: 'Request was successful, but server is returning information that may be from another source.',
-    204: 'There is no content to send for this request, but the headers may be useful.',
-    205: 'Server successfully processed the request, but is not returning any content.',
-    206: 'Download is separated into multiple streams, due to range header.',
-    207: 'Message body that follows is an XML message and can contain a number of separate response codes.',
-    208: ('Response is a representation of the result of one or more instance-manipulations applied to the current ' +
-          'instance.'),
-    226: ('The server has fulfilled a GET request for the resource, and the response is a representation of the ' +
-          'result of one or more instance-manipulations applied to the current instance.'),
-
-    # Redirection.
-    300: 'Request has more than one possible response.',
-    301: 'URI of this resource has changed.',
-    302: 'URI of this resource has changed, temporarily.',
-    303: 'Client should get this resource from another URI.',
-    304: 'Response has not been modified, client can continue to use a cached version.',
-    305: 'Requested resource may only be accessed through a given proxy.',
-    306: 'No longer used. Requested resource may only be accessed through a given proxy.',
-    307: 'URI of this resource has changed, temporarily. Use the same HTTP method to access it.',
-    308: 'The request, and all future requests should be repeated using another URI.',
+# Size of the dense lookup tables below, every code from 0 to 599.
+_table_size = 600
 
-    # Client Error.
-    400: 'Server could not understand the request, due to invalid syntax.',
-    401: 'Authentication is needed to access the given resource.',
-    402: 'Some form of payment is needed to access the given resource.',
-    403: 'Client does not have rights to access the content.',
-    404: 'Server cannot find requested resource.',
-    405: 'Server has disabled this request method and cannot be used.',
-    406: 'Requested resource is only capable of generating content not acceptable according to the Accept headers sent.',
-    407: 'Authentication by a proxy is needed to access the given resource.',
-    408: 'Server would like to shut down this unused connection.',
-    409: 'Request could not be processed because of conflict in the request, such as an edit conflict.',
-    410: 'Requested content has been delected from the server',
-    411: 'Server requires the Content-Length header to be defined.',
-    412: 'Client has indicated preconditions in its headers which the server does not meet.',
-    413: 'Request entity is larger than limits defined by server.',
-    414: 'URI requested by the client is too long for the server to handle.',
-    415: 'Media format of the requested data is not supported by the server.',
-    416: "Range specified by the Range header in the request can't be fulfilled.",
-    417: "Expectation indicated by the Expect header can't be met by the server.",
-    418: 'HTCPCP server is a teapot; the resulting entity body may be short and stout.',
-    422: 'Request was well-formed but was unable to be followed due to semantic errors.',
-    423: 'Resource that is being accessed is locked.',
-    424: 'Request failed due to failure of a previous request (e.g. a PROPPATCH).',
-    #425: ('unordered_collection', 'unordered'),
-    426: 'Client should switch to a different protocol such as TLS/1.0.',
-    428: 'Origin server requires the request to be conditional.',
-    429: 'User has sent too many requests in a given amount of time.',
-    431: 'Server rejected the request because either a header, or all the headers collectively, are too large.',
-    440: 'Your session has expired. (Microsoft)',
-    444: 'Server has returned no information to the client and closed the connection (Ngnix).',
-    449: 'Request should be retried after performing the appropriate action (Microsoft).',
-    450: 'Windows Parental Controls are turned on and are blocking access to the given webpage.',
-    451: ('You attempted to access a Legally-restricted Resource. This could be due to censorship or ' +
-          'government-mandated blocked access.'),
-    494: 'Nginx internal code',
-    495: 'SSL client certificate error occurred. (Nginx)',
-    496: 'Client did not provide certificate (Nginx)',
-    497: 'Plain HTTP request sent to HTTPS port. (Nginx)',
-    499: 'Connection has been closed by client while the server is still processing its request (Nginx).',
 
-    # Server Error.
-    500: "Server has encountered a situation it doesn't know how to handle.",
-    501: 'Request method is not supported by the server and cannot be handled.',
-    502: 'Server, while working as a gateway to get a response needed to handle the request, got an invalid response.',
-    503: 'Server is not yet ready to handle the request.',
-    504: 'Server is acting as a gateway and cannot get a response in time.',
-    505: 'HTTP version used in the request is not supported by the server.',
-    506: 'Transparent content negotiation for the request results in a circular reference.',
-    507: 'Server is unable to store the representation needed to complete the request.',
-    508: 'The server detected an infinite loop while processing the request',
-    #509: 'This status code, while used by many servers, is not specified in any RFCs.',
-    510: 'Further extensions to the request are required for the server to fulfill it.',
-    511: 'The client needs to authenticate to gain network access.'
+def _build_table(entries):
+    """Return a tuple indexed by code, holding None for codes without an entry."""
+    table = [None] * _table_size
+    for code, value in entries.items():
+        table[code] = value
+    return tuple(table)
+
+
+# Dense table used by Status, so a lookup is a single index with None as the fail sentinel.
+_name_table = _build_table(_name_dict)
+
+# Public, read-only view of the table above.
+name = MappingProxyType(_name_dict)
+
+# Bits of status_flags, what a code says about its response.
+CACHEABLE = 1           # heuristically cacheable by default, RFC 9110 section 15.1
+MAY_HAVE_BODY = 2       # the response may carry content
+RETRYABLE = 4           # the request may succeed if retried
+PRESERVES_METHOD = 8    # a redirect that must keep the request method
+ERROR = 16              # a client or server error, 4xx or 5xx
+
+_cacheable_codes = (200, 203, 204, 206, 300, 301, 308, 404, 405, 410, 414, 501)
+_retryable_codes = (408, 429, 502, 503, 504)
+_method_preserving_codes = (307, 308)
+
+
+def _code_table(codes, exclude=()):
+    """Return a tuple of 600 booleans, True for the given codes and class labels such as '5xx', except exclude."""
+    table = [False] * _table_size
+    for entry in codes:
+        if entry in ('1xx', '2xx', '3xx', '4xx', '5xx'):
+            first = int(entry[0]) * 100
+            table[first:first + 100] = [True] * 100
+        else:
+            table[validate_http_code(entry)] = True
+    for entry in exclude:
+        table[validate_http_code(entry)] = False
+    return tuple(table)
+
+
+def _build_flags():
+    """Return a tuple indexed by code of each code's flags, 0 for codes below 100."""
+    table = [0] * _table_size
+    for code in range(100, _table_size):
+        if code >= 200 and code not in (204, 205, 304):
+            table[code] |= MAY_HAVE_BODY
+        if code >= 400:
+            table[code] |= ERROR
+    for codes, flag in ((_cacheable_codes, CACHEABLE),
+                        (_retryable_codes, RETRYABLE),
+                        (_method_preserving_codes, PRESERVES_METHOD)):
+        for code in codes:
+            assert code in _name_dict
+            table[code] |= flag
+    return tuple(table)
+
+
+# Flags of every code, so each question about a code is an index and a bitwise and.
+status_flags = _build_flags()
+
+
+def _load_descriptions():
+    """Load the descriptions, setting description, _description_dict and _description_table.
+
+    Descriptions are only needed by some users, so on Python 3.7 and later
+    they're loaded on first access through the module __getattr__ below.
+    Returns _description_table.
+    """
+    global description, _description_dict, _description_table
+    from ._descriptions import description as _description_dict
+    _description_table = _build_table(_description_dict)
+    description = MappingProxyType(_description_dict)
+    return _description_table
+
+
+# Submodules that ``http_status.<name>`` imports on first access.
+_lazy_submodules = frozenset(('asgi', 'batch', 'bodies', 'counter', 'logs', 'prometheus', 'reasons', 'registry',
+                               'retry', 'shared', 'sketch', 'slo', 'wire', 'wsgi'))
+
+# Public names defined in submodules, {name: submodule}, imported on first access.
+_lazy_attributes = {
+    'StatusCounter': 'counter',
 }
 
 
+def __getattr__(attr):
+    """Load descriptions, submodules and their public names on first access."""
+    if attr in ('description', '_description_dict', '_description_table'):
+        _load_descriptions()
+        return globals()[attr]
+    if attr in _lazy_submodules:
+        import importlib
+        return importlib.import_module('.' + attr, __name__)
+    if attr in _lazy_attributes:
+        import importlib
+        value = getattr(importlib.import_module('.' + _lazy_attributes[attr], __name__), attr)
+        globals()[attr] = value
+        return value
+    raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, attr))
+
+
+def _load_lazy_attributes():
+    """Import every name in _lazy_attributes, for Pythons without module __getattr__."""
+    for attr in _lazy_attributes:
+        __getattr__(attr)
+
+
+# Pre-rendered Status.__unicode__() results, (short, verbose) tuples indexed by code, built on first use.
+_unicode_cache = None
+
+
+def _build_unicode_cache():
+    """Build and return _unicode_cache, holding None for codes without a name or description."""
+    global _unicode_cache
+    descriptions = _description_table if '_description_table' in globals() else _load_descriptions()
+    short = [None] * _table_size
+    verbose = [None] * _table_size
+    for code, code_name in enumerate(_name_table):
+        if code_name is None:
+            continue
+        short[code] = _u('HTTP {} {}'.format(code, code_name))
+        if descriptions[code] is not None:
+            verbose[code] = _u('HTTP {} {}: {}'.format(code, code_name, descriptions[code]))
+    _unicode_cache = (tuple(short), tuple(verbose))
+    return _unicode_cache
+
+
+# (wire.hpack_statuses, wire.qpack_statuses), looked up on first use so importing stays cheap.
+_wire_fields = None
+
+
+def _load_wire_fields():
+    """Import wire, and return and keep _wire_fields."""
+    global _wire_fields
+    from .wire import hpack_statuses, qpack_statuses
+    _wire_fields = (hpack_statuses, qpack_statuses)
+    return _wire_fields
+
+
 class InvalidHttpCode(Exception):
     pass
 
 
-def validate_http_code(http_code, minimum=100, maximum=599, strict=True, default_http_code=0):
-    """Make sure http_code is valid. If strict, throw, else just return default_http_code."""
+# Codes from 100 to 599 as str and bytes, for parsing codes without int().
+_digit_codes = dict(zip([str(code) for code in range(100, 600)], range(100, 600)))
+_digit_codes.update([(key.encode('ascii'), code) for key, code in _digit_codes.items()])
+
+# Types validate_http_code() parses through _digit_codes. Buffers such as memoryview go through int().
+_digit_types = frozenset((str, bytes, type(u'')))
+
+
+def validate_http_code(http_code, minimum=100, maximum=599, strict=True, default_http_code=0, snapshot=None):
+    """Make sure http_code is valid. If strict, throw, else just return default_http_code.
+
+    If a ``registry.Snapshot`` is given, the code must also be one of its codes.
+    """
+    if snapshot is not None:
+        return snapshot.validate(http_code, minimum, maximum, strict, default_http_code)
+    # fast paths for ints and three digit strings such as b'404'
+    code_type = type(http_code)
+    if code_type is int:
+        if minimum <= http_code <= maximum:
+            return http_code
+        if not strict:
+            return default_http_code
+    elif code_type in _digit_types:
+        code = _digit_codes.get(http_code)
+        if code is not None and minimum <= code <= maximum:
+            return code
+
+    if not strict:
+        return _validate_http_code_quiet(http_code, minimum, maximum, default_http_code)
+
     try:
         http_code = int(http_code)
     except:
-        if strict:
-            raise InvalidHttpCode('[{}] {}  is not a valid integer'.format(http_code, type(http_code)))
-        else:
-            return default_http_code
+        raise InvalidHttpCode('[{}] {}  is not a valid integer'.format(http_code, type(http_code)))
 
     if http_code < minimum:
-        if strict:
-            raise InvalidHttpCode('{} is below minimum HTTP status code {}'.format(http_code, minimum))
-        else:
-            return default_http_code
+        raise InvalidHttpCode('{} is below minimum HTTP status code {}'.format(http_code, minimum))
     elif http_code > maximum:
-        if strict:
-            raise InvalidHttpCode('{} is above maximum HTTP status code {}'.format(http_code, maximum))
-        else:
-            return default_http_code
+        raise InvalidHttpCode('{} is above maximum HTTP status code {}'.format(http_code, maximum))
     return http_code
 
 
-class Status(object):
+def _validate_http_code_quiet(http_code, minimum, maximum, default_http_code):
+    """Non-strict slow path of validate_http_code(), which never formats an error message."""
+    try:
+        http_code = int(http_code)
+    except:
+        return default_http_code
+    if http_code < minimum or http_code > maximum:
+        return default_http_code
+    return http_code
+
+
+class _StatusBase(object):
+    """Behaviour shared by Status and the interned instances of Status.of(), without any per-instance state."""
+    __slots__ = ()
+
+    # registry.Snapshot used for validation, names and descriptions, None for the built-in tables
+    snapshot = None
+
+    @classmethod
+    def of(cls, code):
+        """Return the shared, immutable instance of this class for the given code.
+
+        Instances are built once per class for every code from 100 to 599, with
+        their name and description already resolved. Codes are always validated
+        strictly, invalid ones raise InvalidHttpCode.
+
+        Instances are built by calling ``cls(code)``, so subclasses using of()
+        must accept being created with only a code.
+        """
+        # called on an interned instance or its type
+        cls = getattr(cls, '_public_class', cls)
+        try:
+            return _interned[cls][code]
+        except (KeyError, TypeError):
+            pass
+        table = _interned.get(cls)
+        if table is None:
+            table = _interned.setdefault(cls, _build_interned(cls))
+        return table[validate_http_code(code)]
+
+    def __unicode__(self, verbose=False):
+        """
+        __unicode__(verbose=True) returns:  HTTP <code> <name>: <description>
+        __unicode__(verbose=False) returns: HTTP <code> <name>
+        """
+        if self.snapshot is None:
+            short, full = _unicode_cache or _build_unicode_cache()
+            rendered = (full if verbose else short)[self._code]
+            if rendered is not None:
+                return rendered
+        if verbose:
+            return _u('HTTP {} {}: {}'.format(self.code, self.name, self.description))
+        else:
+            return _u('HTTP {} {}'.format(self.code, self.name))
+
+    # Status compares, hashes and indexes like its code, so Status(404) == 404 and
+    # {404: ...}[Status(404)] works. Comparisons with anything else than a Status are
+    # those of the code, as for the int Status.of() instances, so Status(404) == 404.0.
+
+    def __eq__(self, other):
+        if isinstance(other, _StatusBase):
+            return self._code == other._code
+        return self._code == other
+
+    def __ne__(self, other):
+        if isinstance(other, _StatusBase):
+            return self._code != other._code
+        return self._code != other
+
+    def __lt__(self, other):
+        if isinstance(other, _StatusBase):
+            return self._code < other._code
+        return self._code < other
+
+    def __le__(self, other):
+        if isinstance(other, _StatusBase):
+            return self._code <= other._code
+        return self._code <= other
+
+    def __gt__(self, other):
+        if isinstance(other, _StatusBase):
+            return self._code > other._code
+        return self._code > other
+
+    def __ge__(self, other):
+        if isinstance(other, _StatusBase):
+            return self._code >= other._code
+        return self._code >= other
+
+    def __int__(self):
+        return self._code
+
+    def __reduce_ex__(self, protocol):
+        """Pickle Status and NoneStatus with default settings as their 2-byte packed form."""
+        packed = _pack_status(self)
+        if packed is None:
+            reduced = object.__reduce_ex__(self, protocol)
+            if len(reduced) > 2 and isinstance(reduced[2], dict) and '_hashed' in reduced[2]:
+                # copies and unpickled statuses aren't in any set or dict yet
+                state = dict(reduced[2])
+                del state['_hashed']
+                reduced = reduced[:2] + (state,) + reduced[3:]
+            return reduced
+        return unpack_status, (packed,)
+
+    def __index__(self):
+        return self._code
+
+    @property
+    def name(self):
+        """Return the name of the current status code as a string."""
+        snapshot = self.snapshot
+        value = (_name_table if snapshot is None else snapshot.name_table)[self._code]
+        if value is None:
+            return self.name_fail
+        return value
+
+    @property
+    def hpack(self):
+        """Return the HPACK encoded :status field of the current status code, as bytes."""
+        return (_wire_fields or _load_wire_fields())[0][self._code]
+
+    @property
+    def qpack(self):
+        """Return the QPACK encoded :status field line of the current status code, as bytes."""
+        return (_wire_fields or _load_wire_fields())[1][self._code]
+
+    @property
+    def flags(self):
+        """Return the status_flags bits of the current status code."""
+        return status_flags[self._code]
+
+    @property
+    def cacheable(self):
+        """Return whether responses with this code are cacheable by default."""
+        return bool(status_flags[self._code] & CACHEABLE)
+
+    @property
+    def may_have_body(self):
+        """Return whether responses with this code may carry content."""
+        return bool(status_flags[self._code] & MAY_HAVE_BODY)
+
+    @property
+    def retryable(self):
+        """Return whether a request that got this code may succeed if retried."""
+        return bool(status_flags[self._code] & RETRYABLE)
+
+    @property
+    def preserves_method(self):
+        """Return whether this code is a redirect that must keep the request method."""
+        return bool(status_flags[self._code] & PRESERVES_METHOD)
+
+    @property
+    def is_error(self):
+        """Return whether this code is a client or server error."""
+        return bool(status_flags[self._code] & ERROR)
+
+    @property
+    def description(self):
+        """Return the description of the current status code as a string."""
+        snapshot = self.snapshot
+        try:
+            value = (_description_table if snapshot is None else snapshot.description_table)[self._code]
+        except NameError:
+            # descriptions haven't been loaded yet
+            value = _load_descriptions()[self._code]
+        if value is None:
+            return self.description_fail
+        return value
+
+
+class _StatusMeta(type):
+    """Metaclass of Status, so the interned instances of Status.of() are instances of their public class."""
+
+    def __instancecheck__(cls, instance):
+        public = getattr(type(instance), '_public_class', None)
+        if public is not None:
+            return issubclass(public, cls)
+        return type.__instancecheck__(cls, instance)
+
+    def __subclasscheck__(cls, subclass):
+        public = getattr(subclass, '_public_class', None)
+        if public is not None:
+            return issubclass(public, cls)
+        return type.__subclasscheck__(cls, subclass)
+
+
+def _with_metaclass(meta, *bases):
+    """Return a temporary base class that creates a class with meta and bases, like six.with_metaclass()."""
+    class metaclass(meta):
+        def __new__(mcs, name, this_bases, namespace):
+            return meta(name, bases, namespace)
+    return type.__new__(metaclass, 'temporary_class', (), {})
+
+
+class Status(_with_metaclass(_StatusMeta, _StatusBase)):
     """
     Holds an HTTP status code, and provides an easy way to access its name and description.
     code must be a positive integer from 100 to 599.
+
+    If a ``registry.Snapshot`` is given, names and descriptions come from it,
+    and code must be one of its codes.
     """
+
     def __init__(self,
                  code=200,
                  name_fail='No HTTP Name',
                  description_fail='No HTTP Description',
-                 strict=True):
+                 strict=True,
+                 snapshot=None):
         self.strict = strict
+        if snapshot is not None:
+            self.snapshot = snapshot
         self.code = code
         self.name_fail = name_fail
         self.description_fail = description_fail
 
-    def __unicode__(self, verbose=False):
-        """
-        __unicode__(verbose=True) returns:  HTTP <code> <name>: <description>
-        __unicode__(verbose=False) returns: HTTP <code> <name>
-        """
-        if verbose:
-            return six.u('HTTP {} {}: {}'.format(self.code, self.name, self.description))
-        else:
-            return six.u('HTTP {} {}'.format(self.code, self.name))
+    # set once hashed, after which the code can't change, so the status can't get lost in a set or dict
+    _hashed = False
+
+    def __hash__(self):
+        self._hashed = True
+        # the hash of a small int is the int itself
+        return self._code
 
     @property
     def code(self):
@@ -326,25 +673,245 @@ class Status(object):
 
     @code.setter
     def code(self, http_code):
-        """Set our HTTP code."""
-        self._code = validate_http_code(http_code, strict=self.strict)
+        """Set our HTTP code, unless the status has been hashed."""
+        if self._hashed:
+            raise AttributeError("can't change the code of a Status that has been hashed, use a copy")
+        self._code = validate_http_code(http_code, strict=self.strict, snapshot=self.snapshot)
+
+
+class NoneStatus(Status):
+    """Holds an HTTP status code, and provides an easy way to access its name and description."""
+    def __init__(self, code=200, name_fail=None, description_fail=None, snapshot=None):
+        Status.__init__(self, code, name_fail, description_fail, snapshot=snapshot)
+
+
+class _Interned(object):
+    """Mixin for the immutable instances handed out by Status.of().
+
+    Interned classes derive from int and _StatusBase, not from their public
+    class, so instances have no __dict__: the code is the int value, and
+    everything else is held by the class.
+    """
+    __slots__ = ()
+
+    _code = property(int.__int__)
+    code = property(int.__int__, doc='Return our HTTP code.')
+
+    def __setattr__(self, attr, value):
+        raise AttributeError('{} instances returned by of() are immutable'.format(type(self).__name__))
+
+    def __delattr__(self, attr):
+        raise AttributeError('{} instances returned by of() are immutable'.format(type(self).__name__))
+
+    def __reduce__(self):
+        """Pickle and copy as a call to of(), so the shared instance comes back."""
+        return _unpickle_interned, (self._public_class, self._code)
 
     @property
     def name(self):
         """Return the name of the current status code as a string."""
-        if self.code in name:
-            return name[self.code]
-        return self.name_fail
+        return self._names[self]
 
     @property
     def description(self):
         """Return the description of the current status code as a string."""
-        if self.code in description:
-            return description[self.code]
-        return self.description_fail
+        return self._descriptions[self]
 
 
-class NoneStatus(Status):
-    """Holds an HTTP status code, and provides an easy way to access its name and description."""
-    def __init__(self, code=200, name_fail=None, description_fail=None):
-        Status.__init__(self, code, name_fail, description_fail)
+# Interned instances, {Status subclass: {code: instance}}, built on first use of of().
+_interned = {}
+
+# Attributes set by Status.__init__ besides the code, copied onto interned classes.
+_status_attrs = ('strict', 'name_fail', 'description_fail')
+
+# Attributes of Status subclasses not copied onto their interned classes.
+_skipped_attrs = frozenset(('__dict__', '__weakref__', '__init__', '__module__', '__qualname__', '__doc__'))
+
+
+def _unpickle_interned(cls, code):
+    """Return the interned instance of cls for code, used when unpickling."""
+    return cls.of(code)
+
+
+# Bits of the packed form of a Status, a 16-bit int with the code in the low 10 bits.
+_PACK_CODE = 0x3ff
+_PACK_NON_STRICT = 1 << 10
+_PACK_NONE_STATUS = 1 << 11
+_PACK_INTERNED = 1 << 12
+
+# Flag bits of each class pack_status() handles, their interned classes are added by _build_interned().
+_pack_flags = {}
+
+# {flag bits: (class, state)}, state being the __dict__ of a packable instance, without its _code.
+_pack_states = {}
+
+
+def _pack_status(status):
+    """Return the packed form of a Status, or None if it has settings packing can't hold."""
+    flags = _pack_flags.get(type(status))
+    if flags is None:
+        return None
+    if not flags & _PACK_INTERNED:
+        state = status.__dict__
+        if '_hashed' in state:
+            state = dict(state)
+            del state['_hashed']
+        if not state.get('strict', True):
+            flags |= _PACK_NON_STRICT
+        # the state must hold exactly the defaults, apart from the code
+        if len(state) != 4 or '_code' not in state or state != dict(_pack_states[flags][1], _code=state['_code']):
+            return None
+    return status._code | flags
+
+
+def pack_status(status):
+    """Return a Status or NoneStatus as a 16-bit int holding its code and flags.
+
+    Plain ints are packed as the Status.of() instance for that code. Raises
+    ValueError for subclasses, other fail strings, snapshots or extra
+    attributes, which the packed form can't hold.
+    """
+    if isinstance(status, _int_types) and not isinstance(status, Status):
+        return validate_http_code(status) | _PACK_INTERNED
+    packed = _pack_status(status)
+    if packed is None:
+        raise ValueError('{!r} has settings that can\'t be packed'.format(status))
+    return packed
+
+
+def unpack_status(packed):
+    """Return the Status for a value from pack_status(), the same object for interned ones."""
+    code = packed & _PACK_CODE
+    if packed & _PACK_INTERNED:
+        return (NoneStatus if packed & _PACK_NONE_STATUS else Status).of(code)
+    try:
+        cls, state = _pack_states[packed & ~_PACK_CODE]
+    except KeyError:
+        raise ValueError('{} is not a packed status'.format(packed))
+    if not 100 <= code <= 599 and (code or not packed & _PACK_NON_STRICT):
+        raise InvalidHttpCode('{} is not a valid HTTP status code'.format(code))
+    status = object.__new__(cls)
+    status.__dict__.update(state, _code=code)
+    return status
+
+
+def encode_statuses(statuses):
+    """Return a list of statuses or ints as bytes, two little-endian bytes each."""
+    # imported here, as array imports collections, most of the cost of importing this module
+    from array import array
+    pack = pack_status
+    packed = array('H', [pack(status) for status in statuses])
+    if sys.byteorder == 'big':
+        packed.byteswap()
+    return packed.tobytes() if hasattr(packed, 'tobytes') else packed.tostring()
+
+
+def decode_statuses(data):
+    """Return the list of statuses from the output of encode_statuses()."""
+    from array import array
+    packed = array('H')
+    if hasattr(packed, 'frombytes'):
+        packed.frombytes(data)
+    else:
+        packed.fromstring(bytes(data))
+    if sys.byteorder == 'big':
+        packed.byteswap()
+    # interned Status instances are by far the most common, look them up directly
+    interned = _interned.get(Status) or _interned.setdefault(Status, _build_interned(Status))
+    unpack = unpack_status
+    return [interned.get(value ^ _PACK_INTERNED) or unpack(value) for value in packed]
+
+
+def _build_interned(cls):
+    """Build the table of interned instances for the given Status subclass."""
+    # build regular instances so subclasses keep their own defaults, names and descriptions
+    templates = [cls(code) for code in range(100, 600)]
+    namespace = {}
+    # methods of subclasses, which aren't bases of the interned class
+    for klass in reversed(cls.__mro__[:cls.__mro__.index(Status)]):
+        namespace.update((attr, value) for attr, value in vars(klass).items() if attr not in _skipped_attrs)
+    namespace.update((attr, getattr(templates[0], attr)) for attr in _status_attrs)
+    namespace.update({
+        '__slots__': (),
+        '__module__': cls.__module__,
+        '__doc__': cls.__doc__,
+        '__repr__': object.__repr__,
+        '__str__': object.__str__,
+        '_public_class': cls,
+        '_names': (None,) * 100 + tuple(template.name for template in templates),
+        '_descriptions': (None,) * 100 + tuple(template.description for template in templates),
+    })
+    # interned instances are ints, so comparing, hashing and indexing with them run at int speed
+    interned_cls = type(cls.__name__, (_Interned, int, _StatusBase), namespace)
+    if cls in _pack_flags:
+        _pack_flags[interned_cls] = _pack_flags[cls] | _PACK_INTERNED
+    return dict((code, int.__new__(interned_cls, code)) for code in range(100, 600))
+
+
+for _cls, _flags in ((Status, 0), (NoneStatus, _PACK_NONE_STATUS)):
+    _pack_flags[_cls] = _flags
+    for _strict, _strict_flag in ((True, 0), (False, _PACK_NON_STRICT)):
+        _state = dict(_cls().__dict__, strict=_strict)
+        del _state['_code']
+        _pack_states[_flags | _strict_flag] = (_cls, _state)
+del _cls, _flags, _strict, _strict_flag, _state
+
+
+
+class _Owner(object):
+    """Held only by the thread-local storage of a thread, so it dies when the thread exits."""
+    __slots__ = ('__weakref__',)
+
+
+def _on_exit(states_ref, state):
+    """Return a weakref callback folding the state of an exited thread into a _ThreadStates."""
+    def callback(owner_ref):
+        states = states_ref()
+        if states is not None:
+            states._exited(owner_ref, state)
+    return callback
+
+
+class _ThreadStates(object):
+    """The per-thread states of a counter, such as arrays of counts, so threads count without a lock.
+
+    The state of a thread is folded into ``base`` with ``fold(base, state)``
+    once the thread exits, so threads that come and go don't pile up. Read
+    ``base`` and ``live`` holding ``lock``.
+    """
+
+    def __init__(self, fold):
+        import threading
+        # reentrant, as a state may be folded whenever its owner is garbage collected
+        self.lock = threading.RLock()
+        self.fold = fold
+        # the folded states of the exited threads, None until one exited
+        self.base = None
+        # {weakref to the owner in a thread's local storage: state}, for the threads alive
+        self.live = {}
+
+    def register(self, local, state):
+        """Track the state of the calling thread, tying it to local, the threading.local holding it."""
+        import weakref
+        local.owner = _Owner()
+        ref = weakref.ref(local.owner, _on_exit(weakref.ref(self), state))
+        with self.lock:
+            self.live[ref] = state
+
+    def _exited(self, ref, state):
+        """Fold the state of a thread that exited into base."""
+        with self.lock:
+            del self.live[ref]
+            self.base = state if self.base is None else self.fold(self.base, state)
+
+    def states(self):
+        """Return the states of the threads alive, then base if a thread exited, must be called holding lock."""
+        states = list(self.live.values())
+        if self.base is not None:
+            states.append(self.base)
+        return states
+
+if sys.version_info < (3, 7):
+    # no module __getattr__, load everything up front
+    _load_descriptions()
+    _load_lazy_attributes()
@@ -0,0 +1,198 @@
+#!/usr/bin/env python
+# licensed under the BSD 2-clause license
+
+"""ASGI middleware recording response latency histograms by status class and code.
+
+Wrap any ASGI application, such as a Starlette or FastAPI one::
+
+    >>> from http_status.asgi import StatusLatencyMiddleware
+    >>> app = StatusLatencyMiddleware(app)
+
+    >>> histograms = app.histograms.snapshot()
+    >>> histograms.count('5xx'), histograms.quantile(503, 0.99)
+    (12, 0.2293)
+
+Latencies go into log-linear histograms: 16 linear buckets for each power of
+two microseconds, so every bucket is within about 6% of the latencies in it.
+There is one histogram per status class, and one per code in ``codes``,
+429, 499, 502, 503 and 504 by default. Codes outside 100 to 599 go to an
+``'invalid'`` histogram instead of failing.
+
+Recording is a few array increments, it allocates nothing and takes no lock.
+Each histogram set belongs to one event loop. Snapshots are copies that can
+be pickled, sent between worker processes and merged.
+
+Requires Python 3.
+"""
+
+import asyncio
+import time
+from array import array
+
+from . import validate_http_code
+
+# Buckets per histogram: 16 linear buckets below 16us, then 16 per power of two up to 2 ** 37us, about 38 hours.
+_sub_buckets = 16
+_max_shift = 32
+_buckets = (_max_shift + 2) * _sub_buckets
+_max_micros = (1 << (_max_shift + 5)) - 1
+
+# Codes with their own histogram by default.
+default_codes = (429, 499, 502, 503, 504)
+
+# Labels of the first rows, the invalid codes then one per status class.
+_class_labels = ('invalid', '1xx', '2xx', '3xx', '4xx', '5xx')
+
+
+def _bucket(seconds):
+    """Return the bucket index of a latency in seconds."""
+    micros = int(seconds * 1000000)
+    if micros < _sub_buckets:
+        return micros if micros > 0 else 0
+    if micros > _max_micros:
+        micros = _max_micros
+    shift = micros.bit_length() - 5
+    return (shift + 1) * _sub_buckets + (micros >> shift) - _sub_buckets
+
+
+def _bucket_bounds(bucket):
+    """Return the (lowest, highest) latency in seconds of a bucket."""
+    if bucket < _sub_buckets:
+        return bucket / 1000000.0, (bucket + 1) / 1000000.0
+    shift = bucket // _sub_buckets - 1
+    mantissa = bucket % _sub_buckets + _sub_buckets
+    return (mantissa << shift) / 1000000.0, ((mantissa + 1) << shift) / 1000000.0
+
+
+class LatencyHistograms(object):
+    """Log-linear latency histograms for each status class and a few specific codes."""
+
+    def __init__(self, codes=default_codes):
+        self.codes = tuple(validate_http_code(code) for code in codes)
+        self.labels = _class_labels + self.codes
+        self._counts = array('Q', [0]) * (len(self.labels) * _buckets)
+        self._seconds = array('d', [0.0]) * len(self.labels)
+        # offsets into _counts of the class and code rows of each code, None for codes without a row
+        class_offsets = [0] * 600
+        code_offsets = [None] * 600
+        for code in range(100, 600):
+            class_offsets[code] = code // 100 * _buckets
+        for row, code in enumerate(self.codes, len(_class_labels)):
+            code_offsets[code] = row * _buckets
+        self._class_offsets = tuple(class_offsets)
+        self._code_offsets = tuple(code_offsets)
+
+    def record(self, code, seconds):
+        """Record a response latency in seconds. Invalid codes are recorded as 'invalid'."""
+        if type(code) is not int or not 100 <= code <= 599:
+            code = validate_http_code(code, strict=False)
+        bucket = _bucket(seconds)
+        counts = self._counts
+        offset = self._class_offsets[code]
+        counts[offset + bucket] += 1
+        self._seconds[offset // _buckets] += seconds
+        offset = self._code_offsets[code]
+        if offset is not None:
+            counts[offset + bucket] += 1
+            self._seconds[offset // _buckets] += seconds
+
+    def _row(self, key):
+        """Return the row of a class label such as '5xx' or a code with its own histogram."""
+        try:
+            return self.labels.index(key)
+        except ValueError:
+            raise KeyError('no histogram for {!r}, use one of {}'.format(key, self.labels))
+
+    def buckets(self, key):
+        """Return a list of (lowest seconds, highest seconds, count) for the non-empty buckets of a histogram."""
+        start = self._row(key) * _buckets
+        counts = self._counts[start:start + _buckets]
+        return [_bucket_bounds(bucket) + (count,) for bucket, count in enumerate(counts) if count]
+
+    def count(self, key):
+        """Return the number of responses recorded in a histogram."""
+        start = self._row(key) * _buckets
+        return sum(self._counts[start:start + _buckets])
+
+    def total_seconds(self, key):
+        """Return the sum of the latencies recorded in a histogram."""
+        return self._seconds[self._row(key)]
+
+    def quantile(self, key, fraction):
+        """Return the highest latency of the bucket holding the given quantile, or None if it's empty."""
+        start = self._row(key) * _buckets
+        counts = self._counts[start:start + _buckets]
+        rank = fraction * sum(counts)
+        seen = 0
+        for bucket, count in enumerate(counts):
+            seen += count
+            if count and seen >= rank:
+                return _bucket_bounds(bucket)[1]
+        return None
+
+    def snapshot(self):
+        """Return a copy of these histograms, for reading or sending to another process."""
+        copy = LatencyHistograms(self.codes)
+        copy._counts[:] = self._counts
+        copy._seconds[:] = self._seconds
+        return copy
+
+    def merge(self, other):
+        """Add the counts of other histograms with the same codes to these ones."""
+        if other.codes != self.codes:
+            raise ValueError('cannot merge histograms of codes {} into {}'.format(other.codes, self.codes))
+        counts = self._counts
+        for index, count in enumerate(other._counts):
+            if count:
+                counts[index] += count
+        for index, seconds in enumerate(other._seconds):
+            self._seconds[index] += seconds
+
+    def __add__(self, other):
+        result = self.snapshot()
+        result.merge(other)
+        return result
+
+    def __getstate__(self):
+        return self.codes, self._counts.tobytes(), self._seconds.tobytes()
+
+    def __setstate__(self, state):
+        codes, counts, seconds = state
+        self.__init__(codes)
+        self._counts = array('Q', counts)
+        self._seconds = array('d', seconds)
+
+
+class StatusLatencyMiddleware(object):
+    """ASGI middleware recording the latency of every HTTP response into LatencyHistograms."""
+
+    def __init__(self, app, codes=default_codes, clock=time.perf_counter):
+        self.app = app
+        self.histograms = LatencyHistograms(codes)
+        self.clock = clock
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] != 'http':
+            return await self.app(scope, receive, send)
+
+        start = self.clock()
+        status = 0
+
+        async def _send(message):
+            nonlocal status
+            if message['type'] == 'http.response.start':
+                status = message['status']
+            await send(message)
+
+        try:
+            await self.app(scope, receive, _send)
+        except asyncio.CancelledError:
+            # the client went away, counted like nginx does
+            status = status or 499
+            raise
+        except Exception:
+            # the server will answer with a 500
+            status = status or 500
+            raise
+        finally:
+            self.histograms.record(status, self.clock() - start)
@@ -0,0 +1,142 @@
+#!/usr/bin/env python
+# licensed under the BSD 2-clause license
+
+"""Batch lookups over many HTTP status codes at once.
+
+With NumPy installed, integer arrays are handled with whole-array operations and
+no per-element Python calls. Plain sequences (lists, tuples, ``array.array``)
+go through a pure-Python fallback and return lists::
+
+    >>> import numpy
+    >>> import http_status
+    >>> from http_status import batch
+    >>> codes = numpy.array([200, 404, 404, 999])
+    >>> batch.status_class(codes)
+    array([2, 4, 4, 0], dtype=uint8)
+    >>> batch.valid_mask(codes)
+    array([ True,  True,  True, False])
+    >>> [batch.name_labels[i] for i in batch.name_index(codes)]
+    ['OK', 'Not Found', 'Not Found', None]
+    >>> batch.has_flag(codes, http_status.CACHEABLE)
+    array([ True,  True,  True, False])
+
+Codes are valid following ``validate_http_code`` semantics, invalid codes are
+treated as code 0: class 0, no flags, name and description index 0 (``None``), and
+counted in slot 0 of ``histogram``.
+"""
+
+from . import _name_dict, _description_dict, _table_size, status_flags as _flag_table, validate_http_code
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+def _build_labels(entries):
+    """Return the sorted unique values of entries, with None at index 0."""
+    return (None,) + tuple(sorted(set(entries.values())))
+
+
+def _build_index(entries, labels):
+    """Return a tuple mapping each code to the index of its value in labels."""
+    positions = dict((label, index) for index, label in enumerate(labels))
+    table = [0] * _table_size
+    for code, value in entries.items():
+        table[code] = positions[value]
+    return tuple(table)
+
+
+# Labels that name_index() and description_index() index into, None at index 0.
+name_labels = _build_labels(_name_dict)
+description_labels = _build_labels(_description_dict)
+
+_name_index_table = _build_index(_name_dict, name_labels)
+_description_index_table = _build_index(_description_dict, description_labels)
+_class_table = tuple(code // 100 if code >= 100 else 0 for code in range(_table_size))
+
+if numpy is not None:
+    _name_index_array = numpy.array(_name_index_table, dtype=numpy.uint8)
+    _description_index_array = numpy.array(_description_index_table, dtype=numpy.uint8)
+    _class_array = numpy.array(_class_table, dtype=numpy.uint8)
+    _flag_array = numpy.array(_flag_table, dtype=numpy.uint8)
+
+
+def _as_array(codes):
+    """Return codes as a NumPy integer array, or None to use the pure-Python path."""
+    if numpy is None or not isinstance(codes, numpy.ndarray):
+        return None
+    if not numpy.issubdtype(codes.dtype, numpy.integer):
+        raise TypeError('expected an integer array, got {}'.format(codes.dtype))
+    return codes
+
+
+def _safe_codes(codes, minimum=100, maximum=599):
+    """Return codes as valid table indexes, with invalid codes replaced by 0."""
+    return [validate_http_code(code, minimum, maximum, strict=False) for code in codes]
+
+
+def _safe_array(codes, minimum=100, maximum=599):
+    """Return the array form of _safe_codes()."""
+    return numpy.where((codes >= minimum) & (codes <= maximum), codes, 0)
+
+
+def valid_mask(codes, minimum=100, maximum=599):
+    """Return a boolean mask of which codes validate_http_code would accept."""
+    array = _as_array(codes)
+    if array is not None:
+        return (array >= minimum) & (array <= maximum)
+    return [validate_http_code(code, minimum, maximum, strict=False, default_http_code=None) is not None
+            for code in codes]
+
+
+def status_class(codes):
+    """Return the class of each code, 1 to 5 for 1xx to 5xx, or 0 for invalid codes."""
+    array = _as_array(codes)
+    if array is not None:
+        return _class_array[_safe_array(array)]
+    return [_class_table[code] for code in _safe_codes(codes)]
+
+
+def status_flags(codes):
+    """Return the status_flags bits of each code, 0 for invalid codes."""
+    array = _as_array(codes)
+    if array is not None:
+        return _flag_array[_safe_array(array)]
+    return [_flag_table[code] for code in _safe_codes(codes)]
+
+
+def has_flag(codes, flag):
+    """Return a boolean mask of which codes have any of the given status_flags bits, e.g. ``CACHEABLE``."""
+    array = _as_array(codes)
+    if array is not None:
+        return (_flag_array[_safe_array(array)] & flag) != 0
+    return [bool(_flag_table[code] & flag) for code in _safe_codes(codes)]
+
+
+def name_index(codes):
+    """Return, for each code, the index of its name in name_labels."""
+    array = _as_array(codes)
+    if array is not None:
+        return _name_index_array[_safe_array(array)]
+    return [_name_index_table[code] for code in _safe_codes(codes)]
+
+
+def description_index(codes):
+    """Return, for each code, the index of its description in description_labels."""
+    array = _as_array(codes)
+    if array is not None:
+        return _description_index_array[_safe_array(array)]
+    return [_description_index_table[code] for code in _safe_codes(codes)]
+
+
+def histogram(codes):
+    """Return per-code counts, indexed by code from 0 to 599. Invalid codes are counted at 0."""
+    array = _as_array(codes)
+    if array is not None:
+        # bincount refuses unsigned 64-bit input, so cast to the native index type
+        return numpy.bincount(_safe_array(array).ravel().astype(numpy.intp), minlength=_table_size)
+    counts = [0] * _table_size
+    for code in _safe_codes(codes):
+        counts[code] += 1
+    return counts
@@ -0,0 +1,152 @@
+#!/usr/bin/env python
+# licensed under the BSD 2-clause license
+
+"""Error response bodies, rendered, hashed and compressed once per code.
+
+``ErrorBodyCache`` renders the body for a code and format the first time
+it's asked for, and keeps the bytes with their length, a strong ETag and the
+response headers, so an error storm costs a dict lookup per response::
+
+    >>> from http_status.bodies import ErrorBodyCache
+    >>> cache = ErrorBodyCache()
+    >>> body = cache.get(404, 'json')
+    >>> bytes(body.body)
+    b'{"code": 404, "name": "Not Found", "description": "Server cannot find requested resource."}'
+    >>> body.headers
+    (('Content-Type', 'application/json'), ('Content-Length', '91'), ('ETag', '"77aec66c7420e3659bca3b3e63f6fca1eb11565c"'))
+
+Bodies are read-only ``memoryview``\\s, ready to write to a socket. Asking for
+``encoding='gzip'`` (or ``'br'``, if the ``brotli`` package is installed)
+returns a precompressed variant with its own ETag and headers.
+
+Formats are ``'html'`` and ``'json'`` by default. ``set_template()`` adds a
+format or replaces its template, either a ``str.format()`` template with the
+fields ``code``, ``name`` and ``description``, or a function taking a Status
+and returning text. Cached bodies are only dropped when a template or the
+snapshot of names and descriptions changes.
+"""
+
+import gzip
+import hashlib
+import io
+import json
+from collections import OrderedDict
+
+try:
+    from html import escape
+except ImportError:
+    from cgi import escape
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+from . import _name_table, Status, validate_http_code
+
+default_html_template = (
+    '<!DOCTYPE html>\n'
+    '<html><head><title>{code} {name}</title></head>\n'
+    '<body><h1>{code} {name}</h1><p>{description}</p></body></html>\n'
+)
+
+
+def default_json_template(status):
+    """Render a status as a JSON object with its code, name and description."""
+    return json.dumps(OrderedDict((('code', status.code), ('name', status.name),
+                                   ('description', status.description))))
+
+
+def _gzip(data):
+    """Return data gzipped, with a zero timestamp so the same data always gives the same bytes."""
+    output = io.BytesIO()
+    with gzip.GzipFile(fileobj=output, mode='wb', mtime=0) as compressed:
+        compressed.write(data)
+    return output.getvalue()
+
+
+# Compressors by content coding.
+compressors = {'gzip': _gzip}
+if brotli is not None:
+    compressors['br'] = brotli.compress
+
+
+class ErrorBody(object):
+    """One rendered error body, with everything needed to send it."""
+    __slots__ = ('body', 'content_length', 'content_type', 'content_encoding', 'etag', 'headers')
+
+    def __init__(self, data, content_type, content_encoding=None):
+        self.body = memoryview(data)
+        self.content_length = len(data)
+        self.content_type = content_type
+        self.content_encoding = content_encoding
+        self.etag = '"{}"'.format(hashlib.sha1(data).hexdigest())
+        headers = [('Content-Type', content_type), ('Content-Length', str(len(data))), ('ETag', self.etag)]
+        if content_encoding is not None:
+            headers.append(('Content-Encoding', content_encoding))
+        self.headers = tuple(headers)
+
+
+class ErrorBodyCache(object):
+    """Rendered error bodies, built on first use for each code, format and encoding."""
+
+    def __init__(self, snapshot=None):
+        self.snapshot = snapshot
+        self._templates = {
+            'html': (default_html_template, 'text/html; charset=utf-8'),
+            'json': (default_json_template, 'application/json'),
+        }
+        self._bodies = {}
+
+    def set_template(self, format, template, content_type):
+        """Add or replace the template of a format, dropping its cached bodies."""
+        self._templates[format] = (template, content_type)
+        self._bodies = dict((key, body) for key, body in self._bodies.items() if key[1] != format)
+
+    def set_snapshot(self, snapshot):
+        """Render names and descriptions from a registry.Snapshot, dropping every cached body."""
+        self.snapshot = snapshot
+        self._bodies = {}
+
+    def get(self, code, format='html', encoding=None):
+        """Return the ErrorBody for a code, format and content coding such as 'gzip'."""
+        try:
+            return self._bodies[code, format, encoding]
+        except (KeyError, TypeError):
+            pass
+        code = validate_http_code(code, snapshot=self.snapshot)
+        key = (code, format, encoding)
+        body = self._bodies.get(key)
+        if body is None:
+            body = self._bodies[key] = self._build(code, format, encoding)
+        return body
+
+    def _build(self, code, format, encoding):
+        """Render, and if asked compress, the body for a code."""
+        try:
+            template, content_type = self._templates[format]
+        except KeyError:
+            raise ValueError('no error body template for format {!r}'.format(format))
+        if encoding is not None:
+            try:
+                compress = compressors[encoding]
+            except KeyError:
+                raise ValueError('unsupported content coding {!r}'.format(encoding))
+            return ErrorBody(compress(self.get(code, format).body.tobytes()), content_type, encoding)
+
+        status = Status(code, snapshot=self.snapshot)
+        if callable(template):
+            text = template(status)
+        else:
+            text = template.format(code=code, name=escape(status.name), description=escape(status.description))
+        return ErrorBody(text.encode('utf-8'), content_type)
+
+    def warm(self, codes=None, formats=None, encodings=(None,)):
+        """Build bodies up front, by default for every named 4xx and 5xx code in every format."""
+        if codes is None:
+            names = _name_table if self.snapshot is None else self.snapshot.name_table
+            codes = [code for code in range(400, 600) if names[code] is not None]
+        for code in codes:
+            for format in formats or list(self._templates):
+                for encoding in encodings:
+                    self.get(code, format, encoding)
@@ -0,0 +1,229 @@
+#!/usr/bin/env python
+# licensed under the BSD 2-clause license
+
+"""Compact, thread-safe counts of HTTP status codes.
+
+``StatusCounter`` keeps one 64-bit slot for every valid code from 100 to 599,
+so counting is an index instead of a hash, and an empty counter costs the same
+as a full one::
+
+    >>> from http_status import StatusCounter
+    >>> counter = StatusCounter()
+    >>> counter.add(200)
+    >>> counter.add(404, 3)
+    >>> list(counter)
+    [(200, 'OK', 1), (404, 'Not Found', 3)]
+    >>> counter.classes()
+    {'2xx': 1, '4xx': 3}
+
+Each thread counts into its own slots, which reads merge together, so adding
+never takes a lock and threads never write to the same memory, with or
+without the GIL. The slots of a thread are folded into shared ones when it
+exits. Subtracting and clearing record an offset under a lock instead of
+touching other threads' slots, so they never lose concurrent adds.
+"""
+
+import operator
+import struct
+import threading
+from array import array
+
+from . import _name_table, _ThreadStates, validate_http_code, InvalidHttpCode
+
+# Codes counted, the same bounds validate_http_code() uses by default.
+minimum = 100
+maximum = 599
+_slots = maximum - minimum + 1
+
+# Serialized form: a header of magic and entry count, then (code, count) pairs for non-zero codes.
+_magic = b'HSC1'
+_header = struct.Struct('<4sH')
+_entry = struct.Struct('<HQ')
+
+
+def _empty():
+    """Return a zeroed array of counts."""
+    return array('Q', [0]) * _slots
+
+
+def _add(total, counts):
+    """Return the sum of two arrays of counts."""
+    return array('Q', map(operator.add, total, counts))
+
+
+class _Shard(threading.local):
+    """Per-thread counts of a StatusCounter, None until the thread first adds to it."""
+    counts = None
+
+
+class StatusCounter(object):
+    """Counts of HTTP status codes from 100 to 599, safe to add to from many threads."""
+    __slots__ = ('_lock', '_shards', '_local', '_offset')
+
+    def __init__(self, counts=None):
+        self._shards = _ThreadStates(_add)
+        self._lock = self._shards.lock
+        self._local = _Shard()
+        # subtracted from the sum of the shards by subtract() and clear(), None until then
+        self._offset = None
+        if counts is not None:
+            self.update(counts)
+
+    def _shard(self):
+        """Return the counts of the calling thread, creating them on first use."""
+        local = self._local
+        if local.counts is None:
+            counts = _empty()
+            self._shards.register(local, counts)
+            local.counts = counts
+        return local.counts
+
+    def add(self, code, count=1):
+        """Count the given status code, raising InvalidHttpCode for invalid ones."""
+        if type(code) is not int or not minimum <= code <= maximum:
+            code = validate_http_code(code, minimum, maximum)
+        if count < 0:
+            raise ValueError('cannot add a negative count of {}, use subtract()'.format(count))
+        counts = self._local.counts
+        if counts is None:
+            counts = self._shard()
+        counts[code - minimum] += count
+
+    def update(self, codes):
+        """Count every code in an iterable of codes, or add the counts of a StatusCounter or mapping."""
+        if isinstance(codes, StatusCounter):
+            self.merge(codes)
+        elif hasattr(codes, 'items'):
+            for code, count in codes.items():
+                self.add(code, count)
+        else:
+            for code in codes:
+                self.add(code)
+
+    def merge(self, other):
+        """Add the counts of another StatusCounter to this one."""
+        counts = self._shard()
+        for index, count in enumerate(other.counts()):
+            if count:
+                counts[index] += count
+
+    def subtract(self, other):
+        """Subtract the counts of another StatusCounter, stopping at zero."""
+        theirs = other.counts()
+        with self._lock:
+            if self._offset is None:
+                self._offset = _empty()
+            offset = self._offset
+            for index, count in enumerate(self._sum()):
+                if theirs[index]:
+                    offset[index] += min(theirs[index], count - offset[index])
+
+    def clear(self):
+        """Reset every count to zero."""
+        with self._lock:
+            self._offset = self._sum()
+
+    def _sum(self):
+        """Return the sum of the shards, must be called holding _lock."""
+        total = _empty()
+        for shard in self._shards.states():
+            total = _add(total, shard)
+        return total
+
+    def counts(self):
+        """Return a snapshot of the counts as an array('Q') indexed by code - 100."""
+        with self._lock:
+            total = self._sum()
+            if self._offset is not None:
+                total = array('Q', map(operator.sub, total, self._offset))
+        return total
+
+    def __getitem__(self, code):
+        """Return the count of a code."""
+        index = validate_http_code(code, minimum, maximum) - minimum
+        with self._lock:
+            count = sum(shard[index] for shard in self._shards.states())
+            if self._offset is not None:
+                count -= self._offset[index]
+        return count
+
+    def total(self):
+        """Return the sum of all counts."""
+        return sum(self.counts())
+
+    def classes(self):
+        """Return a dict of counts per status class, e.g. ``{'2xx': 1207, '4xx': 33}``."""
+        counts = self.counts()
+        classes = {}
+        for first in range(1, 6):
+            start = first * 100 - minimum
+            total = sum(counts[start:start + 100])
+            if total:
+                classes['{}xx'.format(first)] = total
+        return classes
+
+    def __iter__(self):
+        """Yield (code, name, count) for every code counted, name is None for unknown codes."""
+        for index, count in enumerate(self.counts()):
+            if count:
+                yield index + minimum, _name_table[index + minimum], count
+
+    def __add__(self, other):
+        result = StatusCounter()
+        result.merge(self)
+        result.merge(other)
+        return result
+
+    def __sub__(self, other):
+        result = StatusCounter()
+        result.merge(self)
+        result.subtract(other)
+        return result
+
+    def __iadd__(self, other):
+        self.merge(other)
+        return self
+
+    def __isub__(self, other):
+        self.subtract(other)
+        return self
+
+    def __eq__(self, other):
+        if not isinstance(other, StatusCounter):
+            return NotImplemented
+        return self.counts() == other.counts()
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+
+    __hash__ = None
+
+    def __repr__(self):
+        return 'StatusCounter({{{}}})'.format(', '.join('{}: {}'.format(code, count) for code, _, count in self))
+
+    def to_bytes(self):
+        """Return the counts in a compact binary form, readable by from_bytes()."""
+        entries = [(index + minimum, count) for index, count in enumerate(self.counts()) if count]
+        return _header.pack(_magic, len(entries)) + b''.join(_entry.pack(*entry) for entry in entries)
+
+    @classmethod
+    def from_bytes(cls, data):
+        """Return a StatusCounter from the output of to_bytes()."""
+        try:
+            magic, length = _header.unpack_from(data)
+        except struct.error:
+            raise ValueError('not a serialized StatusCounter')
+        if magic != _magic or len(data) != _header.size + length * _entry.size:
+            raise ValueError('not a serialized StatusCounter')
+        counter = cls()
+        counts = counter._shard()
+        for index in range(length):
+            code, count = _entry.unpack_from(data, _header.size + index * _entry.size)
+            if not minimum <= code <= maximum:
+                raise InvalidHttpCode('{} is not a valid HTTP status code'.format(code))
+            counts[code - minimum] += count
+        return counter
+
+    def __reduce__(self):
+        return self.__class__.from_bytes, (self.to_bytes(),)
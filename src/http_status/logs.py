@@ -0,0 +1,340 @@
+#!/usr/bin/env python
+# licensed under the BSD 2-clause license
+
+"""Count status codes in nginx and Apache access logs.
+
+Works on the combined and common log formats, where the status code is the
+field right after the quoted request line::
+
+    127.0.0.1 - - [10/Oct/2014:13:55:36 +0000] "GET / HTTP/1.1" 404 153 "-" "curl/7.37"
+
+Lines are read as bytes through generators, so memory use does not grow with
+the size of the log::
+
+    >>> from http_status import logs
+    >>> aggregator = logs.StatusAggregator()
+    >>> aggregator.feed(logs.read_lines('/var/log/nginx/access.log'))
+    >>> for code, name, count in aggregator:
+    ...     print(code, name, count)
+    200 OK 1207
+    404 Not Found 31
+    499 Client Closed Request 2
+
+To keep counting as the log grows, and across log rotation, use ``follow()``::
+
+    >>> for code in aggregator.counted(logs.follow('/var/log/nginx/access.log')):
+    ...     pass
+
+Large logs and archives can be counted over a pool of processes, splitting
+plain files into line-aligned byte ranges and giving each .gz file its own
+worker::
+
+    >>> aggregator = logs.count_files(glob.glob('/var/log/nginx/access.log*'), processes=8)
+
+It can also be run from the command line::
+
+    $ python -m http_status.logs -j 8 /var/log/nginx/access.log*
+"""
+
+import gzip
+import mmap
+import os
+import time
+from array import array
+
+from . import _name_table, _table_size, validate_http_code
+
+
+def read_lines(path):
+    """Yield the lines of a log file as bytes, decompressing .gz files."""
+    opener = gzip.open if path.endswith('.gz') else open
+    with opener(path, 'rb') as handle:
+        for line in handle:
+            yield line
+
+
+def follow(path, interval=1.0, from_start=False):
+    """Yield lines appended to a log file, like ``tail -F``.
+
+    The file is opened straight away, so lines written after this call are
+    yielded even if iteration starts later. When the file is rotated (replaced
+    by a new file) or truncated, reading starts again from the beginning of the
+    new file. Waits ``interval`` seconds between checks when no new data is
+    available. Never returns by itself.
+    """
+    handle = open(path, 'rb')
+    if not from_start:
+        handle.seek(0, os.SEEK_END)
+    return _follow(path, handle, interval)
+
+
+def _follow(path, handle, interval):
+    """Generator behind follow(), reading from the already opened handle."""
+    try:
+        inode = os.fstat(handle.fileno()).st_ino
+        partial = b''
+        while True:
+            line = handle.readline()
+            if line:
+                if line.endswith(b'\n'):
+                    yield partial + line
+                    partial = b''
+                else:
+                    partial += line
+                continue
+
+            try:
+                stat = os.stat(path)
+            except OSError:
+                # rotated away and not recreated yet
+                stat = None
+
+            if stat is not None and stat.st_ino != inode:
+                handle.close()
+                handle = open(path, 'rb')
+                inode = os.fstat(handle.fileno()).st_ino
+                partial = b''
+            elif stat is not None and stat.st_size < handle.tell():
+                handle.seek(0)
+                partial = b''
+            else:
+                time.sleep(interval)
+    finally:
+        handle.close()
+
+
+def parse_status(line):
+    """Return the status code of an access log line as an int, or 0 if it has none.
+
+    Rather than matching the whole line, this finds the end of the quoted
+    request field and reads the three digits after it.
+    """
+    start = line.find(b'"')
+    if start < 0:
+        return 0
+    end = line.find(b'" ', start + 1)
+    # Apache escapes quotes inside the request as \"
+    while end > 0 and line[end - 1:end] == b'\\':
+        end = line.find(b'" ', end + 1)
+    if end < 0:
+        return 0
+    field = line[end + 2:end + 5]
+    if len(field) != 3 or not field.isdigit() or line[end + 5:end + 6] not in (b' ', b'\n', b'\r', b''):
+        return 0
+    return validate_http_code(field, strict=False)
+
+
+def status_codes(lines):
+    """Yield the status code of each line, 0 for lines without one."""
+    for line in lines:
+        yield parse_status(line)
+
+
+class StatusAggregator(object):
+    """Running counts of status codes, with one slot per code from 0 to 599.
+
+    Slot 0 counts lines without a valid status code.
+    """
+    __slots__ = ('counts',)
+
+    def __init__(self):
+        self.counts = [0] * _table_size
+
+    def add(self, code, count=1):
+        """Count the given status code, invalid codes are counted in slot 0."""
+        self.counts[validate_http_code(code, strict=False)] += count
+
+    def merge(self, counts):
+        """Add per-code counts, a sequence indexed by code like ``counts``, to ours."""
+        own = self.counts
+        for code, count in enumerate(counts):
+            if count:
+                own[code] += count
+
+    def counted(self, lines):
+        """Count the status code of each line, yielding each code once it's counted."""
+        counts = self.counts
+        for line in lines:
+            code = parse_status(line)
+            counts[code] += 1
+            yield code
+
+    def feed(self, lines):
+        """Count the status code of every line."""
+        counts = self.counts
+        for line in lines:
+            counts[parse_status(line)] += 1
+
+    @property
+    def total(self):
+        """Return the number of lines counted."""
+        return sum(self.counts)
+
+    @property
+    def unparsed(self):
+        """Return the number of lines without a valid status code."""
+        return self.counts[0]
+
+    def class_counts(self):
+        """Return a dict of counts per status class, e.g. ``{'2xx': 1207, '4xx': 33}``."""
+        counts = self.counts
+        classes = {}
+        for first in range(1, 6):
+            total = sum(counts[first * 100:first * 100 + 100])
+            if total:
+                classes['{}xx'.format(first)] = total
+        return classes
+
+    def __iter__(self):
+        """Yield (code, name, count) for every status code seen, name is None for unknown codes."""
+        counts = self.counts
+        for code in range(100, _table_size):
+            if counts[code]:
+                yield code, _name_table[code], counts[code]
+
+
+# Default size of the byte ranges plain files are split into by count_files().
+chunk_size = 32 * 1024 * 1024
+
+
+def split_ranges(path, size=None):
+    """Return (start, end) byte ranges covering the file, each ending at a line boundary."""
+    size = size or chunk_size
+    length = os.path.getsize(path)
+    ranges = []
+    with open(path, 'rb') as handle:
+        start = 0
+        while start < length:
+            handle.seek(min(start + size, length))
+            handle.readline()
+            end = min(handle.tell(), length)
+            ranges.append((start, end))
+            start = end
+    return ranges
+
+
+def _count_lines(lines):
+    """Return an array('Q') of per-code counts for the given lines."""
+    counts = array('Q', [0]) * _table_size
+    for line in lines:
+        counts[parse_status(line)] += 1
+    return counts
+
+
+def _count_mapped(mapped, start, end):
+    """Return an array('Q') of per-code counts for the lines of mapped between start and end.
+
+    Lines are found with mapped.find(), so only one line is copied at a time.
+    """
+    counts = array('Q', [0]) * _table_size
+    find = mapped.find
+    while start < end:
+        stop = find(b'\n', start, end)
+        if stop < 0:
+            stop = end
+        counts[parse_status(mapped[start:stop])] += 1
+        start = stop + 1
+    return counts
+
+
+def _handle_lines(handle, start, end):
+    """Yield the lines of an open file between start and end."""
+    handle.seek(start)
+    while start < end:
+        line = handle.readline(end - start)
+        if not line:
+            break
+        start += len(line)
+        yield line
+
+
+def _count_range(job):
+    """Worker for count_files(), counting one (path, start, end) job."""
+    path, start, end = job
+    if start is None:
+        return _count_lines(read_lines(path))
+
+    with open(path, 'rb') as handle:
+        try:
+            mapped = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, mmap.error):
+            # empty files and some special files can't be mapped
+            return _count_lines(_handle_lines(handle, start, end))
+        try:
+            return _count_mapped(mapped, start, end)
+        finally:
+            mapped.close()
+
+
+def count_files(paths, processes=None, size=None):
+    """Count the status codes in the given logs over a pool of processes.
+
+    Plain files are split with split_ranges() and read memory-mapped, .gz
+    files are handled one per worker. Each worker returns a compact per-code
+    count array, merged into the returned StatusAggregator. ``processes``
+    defaults to the number of CPUs, 1 counts in this process.
+    """
+    jobs = []
+    for path in paths:
+        if path.endswith('.gz'):
+            jobs.append((path, None, None))
+        else:
+            jobs.extend((path, start, end) for start, end in split_ranges(path, size))
+
+    aggregator = StatusAggregator()
+    if processes == 1 or len(jobs) <= 1:
+        for job in jobs:
+            aggregator.merge(_count_range(job))
+        return aggregator
+
+    import multiprocessing
+
+    pool = multiprocessing.Pool(processes)
+    try:
+        for counts in pool.imap_unordered(_count_range, jobs):
+            aggregator.merge(counts)
+    finally:
+        pool.close()
+        pool.join()
+    return aggregator
+
+
+def main(argv=None):
+    """Print status code counts for the given access logs."""
+    import argparse
+
+    parser = argparse.ArgumentParser(prog='python -m http_status.logs', description=main.__doc__)
+    parser.add_argument('paths', nargs='+', metavar='path', help='access log, .gz files are decompressed')
+    parser.add_argument('-f', '--follow', action='store_true',
+                        help='keep counting lines appended to the (single) log, printing counts every --interval')
+    parser.add_argument('-i', '--interval', type=float, default=10.0, help='seconds between reports in follow mode')
+    parser.add_argument('-j', '--jobs', type=int, default=1,
+                        help='number of processes to count with, 0 for one per CPU (default: 1)')
+    args = parser.parse_args(argv)
+
+    if args.follow:
+        if len(args.paths) != 1:
+            parser.error('--follow takes a single log')
+        aggregator = StatusAggregator()
+        report_at = time.time() + args.interval
+        for _ in aggregator.counted(follow(args.paths[0], interval=min(1.0, args.interval))):
+            if time.time() >= report_at:
+                _report(aggregator)
+                report_at = time.time() + args.interval
+    else:
+        aggregator = count_files(args.paths, processes=args.jobs or None)
+        _report(aggregator)
+
+
+def _report(aggregator):
+    """Print the counts of the given aggregator."""
+    for code, code_name, count in aggregator:
+        print('{} {} {}'.format(code, code_name or '', count))
+    for status_class, count in sorted(aggregator.class_counts().items()):
+        print('{} {}'.format(status_class, count))
+    if aggregator.unparsed:
+        print('unparsed {}'.format(aggregator.unparsed))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,195 @@
+#!/usr/bin/env python
+# licensed under the BSD 2-clause license
+
+"""Prometheus text exposition of status counts and latency histograms.
+
+``MetricsRenderer`` writes metrics into one ``bytearray`` that's reused from
+scrape to scrape. The labels of every code, such as
+``class="4xx",code="404",reason="Not Found"``, are rendered once when this
+module is imported, and every series keeps its last rendered line, so a
+series whose value hasn't changed since the last scrape is copied instead of
+formatted again::
+
+    >>> from http_status.prometheus import MetricsRenderer
+    >>> renderer = MetricsRenderer()
+
+    >>> renderer.begin()
+    >>> renderer.counter('http_responses_total', middleware.counts(), help='HTTP responses.')
+    >>> for route, counts in sorted(middleware.routes().items()):
+    ...     renderer.counter('http_route_responses_total', counts, labels={'route': route})
+    >>> renderer.histogram('http_response_seconds', asgi_middleware.histograms)
+    >>> body = renderer.finish()
+
+which renders::
+
+    # HELP http_responses_total HTTP responses.
+    # TYPE http_responses_total counter
+    http_responses_total{class="2xx",code="200",reason="OK"} 1520
+    http_responses_total{class="4xx",code="404",reason="Not Found"} 3
+    # TYPE http_route_responses_total counter
+    http_route_responses_total{route="/users/<id>",class="2xx",code="200",reason="OK"} 1520
+    ...
+
+Every series of a metric must be rendered in consecutive calls, as the
+format requires. ``finish()`` returns a ``memoryview`` of the buffer, which
+must be released before the next ``begin()``.
+"""
+
+from . import _name_table, _table_size, validate_http_code
+from .counter import StatusCounter, minimum
+
+# Histogram bucket bounds in seconds, the Prometheus client defaults.
+default_bounds = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def _escape(value):
+    """Return a label value escaped for the exposition format."""
+    return value.replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _render_labels(labels):
+    """Return a dict of labels as ``name="value"`` fragments joined by commas, sorted by name."""
+    return ','.join('{}="{}"'.format(label, _escape(value)) for label, value in sorted(labels.items()))
+
+
+# Label fragments of every code, e.g. b'class="4xx",code="404",reason="Not Found"', None below 100.
+code_labels = tuple(None if code < 100 else _render_labels({
+    'code': str(code),
+    'reason': _name_table[code] or '',
+    'class': '{}xx'.format(code // 100),
+}).encode('utf-8') for code in range(_table_size))
+
+
+def _format_value(value):
+    """Return a sample value as bytes."""
+    if isinstance(value, float):
+        return repr(value).encode('ascii')
+    return str(value).encode('ascii')
+
+
+def _code_counts(counts):
+    """Return (code, count) pairs from a StatusCounter, a mapping or an iterable of pairs."""
+    if isinstance(counts, StatusCounter):
+        return [(index + minimum, count) for index, count in enumerate(counts.counts()) if count]
+    if hasattr(counts, 'items'):
+        return counts.items()
+    return counts
+
+
+class MetricsRenderer(object):
+    """Renders status metrics into a reusable buffer, reusing the lines of unchanged series."""
+
+    def __init__(self):
+        self.buffer = bytearray()
+        self._position = 0
+        # {series prefix: {code or histogram label: (value, rendered bytes)}}, from previous scrapes
+        self._series = {}
+        # {(name, labels): b'name{labels,'}
+        self._prefixes = {}
+        # names of the metrics already rendered in this scrape
+        self._families = set()
+        # {histogram bounds: how many log-linear buckets are under each bound}
+        self._cutoffs = {}
+
+    def begin(self):
+        """Start a scrape, overwriting the buffer from the start."""
+        self._position = 0
+        self._families.clear()
+
+    def finish(self):
+        """End a scrape and return the rendered metrics as a memoryview of the buffer."""
+        return memoryview(self.buffer)[:self._position]
+
+    def _write(self, data):
+        """Write bytes at the current position of the buffer, only growing it when it's too small."""
+        end = self._position + len(data)
+        self.buffer[self._position:end] = data
+        self._position = end
+
+    def _family(self, name, kind, help):
+        """Write the HELP and TYPE lines of a metric, the first time it's rendered in this scrape."""
+        if name in self._families:
+            return
+        self._families.add(name)
+        if help is not None:
+            self._write('# HELP {} {}\n'.format(name, help.replace('\\', '\\\\').replace('\n', '\\n')).encode('utf-8'))
+        self._write('# TYPE {} {}\n'.format(name, kind).encode('utf-8'))
+
+    def _prefix(self, name, labels):
+        """Return the start of a series line up to its first status label, e.g. b'name{route="/",'."""
+        key = (name, tuple(sorted(labels.items())) if labels else None)
+        prefix = self._prefixes.get(key)
+        if prefix is None:
+            rendered = _render_labels(labels) + ',' if labels else ''
+            prefix = self._prefixes[key] = '{}{{{}'.format(name, rendered).encode('utf-8')
+        return prefix
+
+    def counter(self, name, counts, labels=None, help=None):
+        """Render a counter with one series per code.
+
+        counts is a StatusCounter, a {code: count} mapping or (code, count)
+        pairs, and labels a dict of labels added to every series.
+        """
+        self._family(name, 'counter', help)
+        prefix = self._prefix(name, labels)
+        series = self._series.get(prefix)
+        if series is None:
+            series = self._series[prefix] = {}
+        lines = []
+        append = lines.append
+        for code, count in _code_counts(counts):
+            cached = series.get(code)
+            if cached is None or cached[0] != count:
+                line = b''.join((prefix, code_labels[validate_http_code(code)], b'} ', _format_value(count), b'\n'))
+                cached = series[code] = (count, line)
+            append(cached[1])
+        self._write(b''.join(lines))
+
+    def histogram(self, name, histograms, labels=None, help=None, bounds=default_bounds):
+        """Render the histograms of an asgi.LatencyHistograms, one set of series per class and code.
+
+        Bucket counts are rounded down to the edges of the log-linear buckets
+        below each bound. Histograms with no responses are skipped.
+        """
+        from .asgi import _bucket_bounds, _buckets
+
+        self._family(name, 'histogram', help)
+        bucket_prefix = self._prefix(name + '_bucket', labels)
+        sum_prefix = self._prefix(name + '_sum', labels)
+        count_prefix = self._prefix(name + '_count', labels)
+        cutoffs = self._cutoffs.get(bounds)
+        if cutoffs is None:
+            cutoffs = self._cutoffs[bounds] = tuple(
+                len([bucket for bucket in range(_buckets) if _bucket_bounds(bucket)[1] <= bound]) for bound in bounds)
+
+        series = self._series.get(bucket_prefix)
+        if series is None:
+            series = self._series[bucket_prefix] = {}
+        counts = histograms._counts
+        for row, label in enumerate(histograms.labels):
+            start = row * _buckets
+            total = sum(counts[start:start + _buckets])
+            if not total:
+                continue
+            cumulative = []
+            below = 0
+            done = 0
+            for cutoff in cutoffs:
+                below += sum(counts[start + done:start + cutoff])
+                done = cutoff
+                cumulative.append(below)
+            value = (tuple(cumulative), total, histograms._seconds[row])
+
+            cached = series.get(label)
+            if cached is None or cached[0] != value:
+                if isinstance(label, int):
+                    fragment = code_labels[label]
+                else:
+                    fragment = 'class="{}"'.format(label).encode('ascii')
+                lines = [b''.join((bucket_prefix, fragment, b',le="', repr(bound).encode('ascii'), b'"} ',
+                                   _format_value(count), b'\n')) for bound, count in zip(bounds, cumulative)]
+                lines.append(b''.join((bucket_prefix, fragment, b',le="+Inf"} ', _format_value(total), b'\n')))
+                lines.append(b''.join((sum_prefix, fragment, b'} ', _format_value(value[2]), b'\n')))
+                lines.append(b''.join((count_prefix, fragment, b'} ', _format_value(total), b'\n')))
+                cached = series[label] = (value, b''.join(lines))
+            self._write(cached[1])
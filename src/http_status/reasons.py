@@ -0,0 +1,140 @@
+#!/usr/bin/env python
+# licensed under the BSD 2-clause license
+
+"""Reverse lookup from reason phrase to status code.
+
+Phrases are normalized before lookup, ignoring case, spacing and
+punctuation, so upstream variations of a name all find the same code::
+
+    >>> from http_status import reasons
+    >>> reasons.reason_code('Not Found')
+    404
+    >>> reasons.reason_code(b'NOT_FOUND')
+    404
+    >>> reasons.reason_code('Payload Too Large')
+    413
+
+Lookups are a single dict access on the normalized phrase, however many
+phrases are known. Besides ``name``, the index knows the newer RFC 9110 names
+and a few common variants of the older ones.
+
+Some codes mean the same thing as others: nginx's 494 is a request header
+that's too large, which clients also see as 413 or 431. ``reason_codes()``
+returns every code a phrase may stand for, and ``check_reason()`` tells
+whether a phrase fits the code it arrived with::
+
+    >>> reasons.reason_codes('Request Header Too Large')
+    (494, 413, 431)
+    >>> reasons.check_reason(413, 'Request Header Too Large')
+    'equivalent'
+    >>> reasons.check_reason(200, 'Not Found')
+    'mismatch'
+"""
+
+import string
+
+from . import _name_dict, validate_http_code, MappingProxyType
+
+# Results of check_reason().
+MATCH = 'match'
+EQUIVALENT = 'equivalent'
+MISMATCH = 'mismatch'
+UNKNOWN = 'unknown'
+
+# Characters dropped by normalize(), as bytes and as a str.translate() table.
+_delete = (string.punctuation + string.whitespace).encode('ascii')
+_text_delete = dict.fromkeys(bytearray(_delete))
+
+# Other names in use for codes in name, mostly from RFC 9110.
+_aliases = {
+    302: ('Moved Temporarily',),
+    413: ('Payload Too Large', 'Content Too Large'),
+    414: ('URI Too Long',),
+    416: ('Range Not Satisfiable',),
+    422: ('Unprocessable Content',),
+    425: ('Too Early',),
+    431: ('Request Header Fields Too Large',),
+    511: ('Network Authentication Required',),
+}
+
+# Codes that stand for the same condition as another code, checked by check_reason().
+_equivalents = {
+    413: (494,),
+    431: (494,),
+    494: (413, 431),
+}
+
+
+def normalize(phrase):
+    """Return a reason phrase lowercased and without spaces or punctuation.
+
+    ``str`` phrases give a ``str``, bytes-like ones give ``bytes``.
+    """
+    if isinstance(phrase, (bytes, bytearray, memoryview)):
+        return bytes(phrase).lower().translate(None, _delete)
+    return phrase.lower().translate(_text_delete)
+
+
+# {normalized phrase: codes}, keyed by both the str and bytes forms of each phrase.
+_index = {}
+
+# Public, read-only view of the index above.
+index = MappingProxyType(_index)
+
+
+def add_reason(code, phrase):
+    """Make phrase look up code, after the codes it already stands for."""
+    code = validate_http_code(code)
+    text = normalize(phrase if not isinstance(phrase, bytes) else phrase.decode('latin-1'))
+    codes = _index.get(text, ())
+    if code not in codes:
+        codes += (code,)
+    for key in (text, text.encode('latin-1')):
+        _index[key] = codes
+
+
+def _build_index():
+    """Fill _index from name, the aliases and the equivalent codes."""
+    for code, code_name in _name_dict.items():
+        add_reason(code, code_name)
+    for code, aliases in _aliases.items():
+        for alias in aliases:
+            add_reason(code, alias)
+    for code, code_name in _name_dict.items():
+        for equivalent in _equivalents.get(code, ()):
+            add_reason(equivalent, code_name)
+    for code, aliases in _aliases.items():
+        for equivalent in _equivalents.get(code, ()):
+            for alias in aliases:
+                add_reason(equivalent, alias)
+
+
+_build_index()
+
+
+def reason_codes(phrase):
+    """Return every code a reason phrase stands for, the canonical one first, or () if unknown."""
+    return _index.get(normalize(phrase), ())
+
+
+def reason_code(phrase, default=None):
+    """Return the canonical code for a reason phrase, or default if it's unknown."""
+    codes = _index.get(normalize(phrase))
+    return codes[0] if codes else default
+
+
+def check_reason(code, phrase):
+    """Return how a reason phrase fits the code it arrived with.
+
+    Returns MATCH if the phrase names the code, EQUIVALENT if it names a code
+    meaning the same thing, MISMATCH if it names some other code, and UNKNOWN
+    if it isn't a known phrase.
+    """
+    codes = _index.get(normalize(phrase))
+    if not codes:
+        return UNKNOWN
+    if codes[0] == code:
+        return MATCH
+    if code in codes:
+        return EQUIVALENT
+    return MISMATCH
@@ -0,0 +1,160 @@
+#!/usr/bin/env python
+# licensed under the BSD 2-clause license
+
+"""Registries of status codes, composed into immutable snapshots.
+
+The codes in ``name`` come from several sources. Each source is also
+available as a ``Registry``: ``rfc``, ``microsoft`` (440, 449, 450),
+``nginx`` (444, 494 to 499) and ``apache`` (509). Registries are composed
+into a ``Snapshot``, which precomputes its name and description tables once,
+with later registries overriding earlier ones::
+
+    >>> from http_status import registry, Status
+    >>> cloudflare = registry.Registry('cloudflare', {520: 'Web Server Returned an Unknown Error',
+    ...                                              522: 'Connection Timed Out'})
+    >>> snapshot = registry.Snapshot(registry.rfc, registry.nginx, cloudflare)
+    >>> Status(522, snapshot=snapshot).name
+    'Connection Timed Out'
+    >>> Status(440, snapshot=snapshot)
+    Traceback (most recent call last):
+      ...
+    http_status.InvalidHttpCode: 440 is not a registered HTTP status code
+
+``validate_http_code`` takes a ``snapshot`` argument in the same way.
+
+Snapshots never change, so a long running server can switch every thread to
+a new one by replacing a single reference, without locks. ``activate()`` does
+that for a process-wide snapshot that ``active()`` returns::
+
+    >>> registry.activate(registry.active().extend(cloudflare))
+    >>> Status(520, snapshot=registry.active()).name
+    'Web Server Returned an Unknown Error'
+
+Status objects keep the snapshot they were created with, so their answers
+don't change under them.
+"""
+
+from . import _name_dict, _build_table, validate_http_code, InvalidHttpCode, MappingProxyType
+
+
+class Registry(object):
+    """A named, read-only set of status codes with their names and descriptions."""
+    __slots__ = ('label', 'names', 'descriptions')
+
+    def __init__(self, label, names, descriptions=None):
+        names = dict((validate_http_code(code), code_name) for code, code_name in names.items())
+        descriptions = dict((validate_http_code(code), text) for code, text in (descriptions or {}).items())
+        for code in descriptions:
+            if code not in names:
+                raise ValueError('description given for {}, which has no name'.format(code))
+        object.__setattr__(self, 'label', label)
+        object.__setattr__(self, 'names', MappingProxyType(names))
+        object.__setattr__(self, 'descriptions', MappingProxyType(descriptions))
+
+    def __setattr__(self, attr, value):
+        raise AttributeError('Registry instances are immutable')
+
+    def __repr__(self):
+        return 'Registry({!r}, {} codes)'.format(self.label, len(self.names))
+
+    def __reduce__(self):
+        return Registry, (self.label, dict(self.names), dict(self.descriptions))
+
+
+class Snapshot(object):
+    """An immutable composition of registries, with precomputed lookup tables.
+
+    Later registries override the names and descriptions of earlier ones.
+    """
+    __slots__ = ('registries', 'name_table', 'description_table', 'name', 'description')
+
+    def __init__(self, *registries):
+        names = {}
+        descriptions = {}
+        for entry in registries:
+            for code in entry.names:
+                names[code] = entry.names[code]
+                descriptions.pop(code, None)
+            descriptions.update(entry.descriptions)
+        object.__setattr__(self, 'registries', registries)
+        object.__setattr__(self, 'name_table', _build_table(names))
+        object.__setattr__(self, 'description_table', _build_table(descriptions))
+        object.__setattr__(self, 'name', MappingProxyType(names))
+        object.__setattr__(self, 'description', MappingProxyType(descriptions))
+
+    def __setattr__(self, attr, value):
+        raise AttributeError('Snapshot instances are immutable')
+
+    def extend(self, *registries):
+        """Return a new snapshot with the given registries added on top of these."""
+        return Snapshot(*(self.registries + registries))
+
+    def validate(self, http_code, minimum=100, maximum=599, strict=True, default_http_code=0):
+        """Like validate_http_code(), but codes must also be in this snapshot."""
+        code = validate_http_code(http_code, minimum, maximum, strict, None)
+        if code is None:
+            return default_http_code
+        if self.name_table[code] is None:
+            if strict:
+                raise InvalidHttpCode('{} is not a registered HTTP status code'.format(code))
+            return default_http_code
+        return code
+
+    def __contains__(self, code):
+        return self.validate(code, strict=False, default_http_code=None) is not None
+
+    def __repr__(self):
+        return 'Snapshot({})'.format(', '.join(entry.label for entry in self.registries))
+
+    def __reduce__(self):
+        return Snapshot, self.registries
+
+
+# Vendor codes in name, by vendor. The rest are in rfc.
+_vendor_codes = {
+    'microsoft': (440, 449, 450),
+    'nginx': (444, 494, 495, 496, 497, 499),
+    'apache': (509,),
+}
+
+
+def _split_builtin():
+    """Return the rfc registry and the vendor registries, from name and description."""
+    from . import _description_dict
+    registries = {}
+    vendor = set()
+    for label, codes in _vendor_codes.items():
+        vendor.update(codes)
+        registries[label] = Registry(label, dict((code, _name_dict[code]) for code in codes),
+                                     dict((code, _description_dict[code]) for code in codes
+                                          if code in _description_dict))
+    codes = [code for code in _name_dict if code not in vendor]
+    registries['rfc'] = Registry('rfc', dict((code, _name_dict[code]) for code in codes),
+                                 dict((code, _description_dict[code]) for code in codes
+                                      if code in _description_dict))
+    return registries
+
+
+_builtin = _split_builtin()
+rfc = _builtin['rfc']
+microsoft = _builtin['microsoft']
+nginx = _builtin['nginx']
+apache = _builtin['apache']
+
+# The snapshot matching the built-in name and description tables.
+default = Snapshot(rfc, microsoft, nginx, apache)
+
+_active = default
+
+
+def active():
+    """Return the process-wide snapshot."""
+    return _active
+
+
+def activate(snapshot):
+    """Replace the process-wide snapshot, in a single reference assignment."""
+    global _active
+    if not isinstance(snapshot, Snapshot):
+        raise TypeError('expected a Snapshot, got {!r}'.format(snapshot))
+    _active = snapshot
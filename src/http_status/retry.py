@@ -0,0 +1,290 @@
+#!/usr/bin/env python
+# licensed under the BSD 2-clause license
+
+"""Retry decisions and circuit breaking for HTTP clients, from response codes.
+
+``RetryClassifier`` precomputes what to do with every code into a table of
+flags, so a decision is an index instead of a chain of ifs::
+
+    >>> from http_status.retry import RetryClassifier, CircuitBreaker
+    >>> classifier = RetryClassifier()
+    >>> classifier.retry_delay(503, attempt=1)
+    0.0731
+    >>> classifier.retry_delay(429, attempt=1, retry_after='2')
+    2.0
+    >>> classifier.retry_delay(404, attempt=1) is None
+    True
+
+408, 429, 502, 503 and 504 are retried by default, the codes with
+``Status.retryable``, with exponential backoff and full jitter. A
+``Retry-After`` header is honoured for 429 and 503.
+
+``CircuitBreaker`` stops sending requests to an upstream once too many of
+its responses are failures, 429 and 5xx other than 501 by default, then lets
+a probe request through after ``reset_timeout`` seconds to find out if it
+has recovered::
+
+    >>> breaker = CircuitBreaker(classifier)
+    >>> if breaker.allow():
+    ...     response = session.get(url)
+    ...     breaker.record(response.status_code)
+
+``record(None)`` records a request that got no response at all, such as a
+connection error or a timeout, as a failure.
+
+Failures are counted over fixed windows of ``window`` seconds. Every thread
+counts into its own shard, folded into a shared one when it exits, the
+state changes by replacing a single reference, and probes are handed out by
+an ``itertools.count``, so ``allow()`` and ``record()`` only take a lock to
+start a round of probes and to act on its result. None of them await, so a
+breaker can be shared by the tasks of an event loop and by threads alike.
+
+Only the responses to probes decide whether a half-open breaker closes:
+``record()`` ignores responses in threads, or tasks on Python 3.7 and
+later, that weren't handed a probe by ``allow()`` since it last opened.
+"""
+
+import email.utils
+import itertools
+import random
+import threading
+import time
+
+from . import _code_table, _retryable_codes, _ThreadStates, validate_http_code
+
+try:
+    from contextvars import ContextVar
+except ImportError:
+    ContextVar = None
+
+try:
+    _clock = time.monotonic
+except AttributeError:
+    _clock = time.time
+
+# Decision flags.
+RETRY = 1               # retry the request
+USE_RETRY_AFTER = 2     # wait as long as a Retry-After header asks, if there's one
+FAILURE = 4             # the upstream failed, counted by circuit breakers
+
+# Circuit breaker states.
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half-open'
+
+
+def parse_retry_after(value, now=None):
+    """Return the seconds to wait from a Retry-After header, in seconds or an HTTP date, None if it's invalid."""
+    if isinstance(value, bytes):
+        value = value.decode('latin-1')
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    parsed = email.utils.parsedate_tz(value)
+    if parsed is None:
+        return None
+    seconds = email.utils.mktime_tz(parsed) - (time.time() if now is None else now)
+    return float(max(seconds, 0))
+
+
+class RetryClassifier(object):
+    """What to do with the response of every code, precomputed into a table of decision flags."""
+
+    def __init__(self, retry=_retryable_codes, retry_after=(429, 503), failures=('5xx', 429), exclude=(501,),
+                 attempts=3, base=0.1, cap=10.0, max_retry_after=60.0, random=random.random):
+        """retry, retry_after and failures are codes or class labels such as '5xx', exclude is removed from failures.
+
+        Requests are tried at most attempts times. The backoff before retry n
+        is up to base * 2 ** (n - 1) seconds, at most cap, and responses asking
+        to wait more than max_retry_after seconds aren't retried.
+        """
+        self.attempts = attempts
+        self.base = base
+        self.cap = cap
+        self.max_retry_after = max_retry_after
+        self.random = random
+        table = [FAILURE] + [0] * 599
+        for flag, codes, excluded in ((RETRY, retry, ()), (USE_RETRY_AFTER, retry_after, ()),
+                                      (FAILURE, failures, exclude)):
+            for code, selected in enumerate(_code_table(codes, excluded)):
+                if selected:
+                    table[code] |= flag
+        # decision flags of every code, with invalid codes and None at 0, as failures
+        self.decisions = tuple(table)
+
+    def decision(self, code):
+        """Return the decision flags of a code. Invalid codes and None are failures."""
+        if type(code) is not int or not 100 <= code <= 599:
+            code = validate_http_code(code, strict=False)
+        return self.decisions[code]
+
+    def retry_delay(self, code, attempt, retry_after=None):
+        """Return the seconds to wait before retrying a request, or None if it shouldn't be retried.
+
+        attempt is the number of attempts made so far, and retry_after the
+        value of the Retry-After header of the response, if any.
+        """
+        decision = self.decision(code)
+        if not decision & RETRY or attempt >= self.attempts:
+            return None
+        if retry_after is not None and decision & USE_RETRY_AFTER:
+            seconds = parse_retry_after(retry_after)
+            if seconds is not None:
+                return seconds if seconds <= self.max_retry_after else None
+        return self.random() * min(self.cap, self.base * 2 ** (attempt - 1))
+
+
+# Fields of the per-thread counts of a CircuitBreaker.
+_WINDOW = 0
+_GENERATION = 1
+_REQUESTS = 2
+_FAILURES = 3
+_END = 4                # the time the window ends
+
+
+class _Shard(threading.local):
+    """Per-thread counts of a CircuitBreaker, a list of the fields above, None until the thread first records."""
+    counts = None
+
+
+def _fold(base, counts):
+    """Return the counts of a thread that exited added to base, or the latest of both if they're other windows."""
+    if counts[_WINDOW] is None:
+        return base
+    if counts[_WINDOW] == base[_WINDOW] and counts[_GENERATION] == base[_GENERATION]:
+        base[_REQUESTS] += counts[_REQUESTS]
+        base[_FAILURES] += counts[_FAILURES]
+        return base
+    if base[_WINDOW] is None or (counts[_GENERATION], counts[_WINDOW]) > (base[_GENERATION], base[_WINDOW]):
+        return counts
+    return base
+
+
+class _ThreadProbe(threading.local):
+    """The probe handed out to the calling thread, like a ContextVar where there are none."""
+    probe = None
+
+    def get(self):
+        return self.probe
+
+    def set(self, probe):
+        self.probe = probe
+
+
+class CircuitBreaker(object):
+    """A circuit breaker opening when too many responses of an upstream are failures."""
+
+    def __init__(self, classifier=None, failure_ratio=0.5, minimum_requests=20, window=10.0, reset_timeout=30.0,
+                 probes=1, clock=_clock):
+        """Open once at least failure_ratio of minimum_requests or more in a window failed.
+
+        After reset_timeout seconds open, probes requests are let through;
+        the breaker closes on the first one that succeeds and opens again on
+        the first one that fails.
+        """
+        self.classifier = RetryClassifier() if classifier is None else classifier
+        self.failure_ratio = failure_ratio
+        self.minimum_requests = minimum_requests
+        self.window = window
+        self.reset_timeout = reset_timeout
+        self.probes = probes
+        self.clock = clock
+        self._failures = tuple(bool(flags & FAILURE) for flags in self.classifier.decisions)
+        # (state, time it was entered), replaced as a whole
+        self._state = (CLOSED, 0.0)
+        # bumped when the breaker closes, so counts from before it opened are dropped
+        self._generation = 0
+        self._tickets = itertools.count()
+        self._shards = _ThreadStates(_fold)
+        self._local = _Shard()
+        # the half-open _state the calling task or thread was handed a probe in, if any
+        self._probe = _ThreadProbe() if ContextVar is None else ContextVar('probe', default=None)
+
+    @property
+    def state(self):
+        """Return CLOSED, OPEN or HALF_OPEN."""
+        return self._state[0]
+
+    def allow(self, now=None):
+        """Return whether a request may be sent now."""
+        current = self._state
+        state, since = current
+        if state is CLOSED:
+            return True
+        if now is None:
+            now = self.clock()
+        if now - since >= self.reset_timeout:
+            # open long enough, or probes that never reported back: hand out new probes, once
+            with self._shards.lock:
+                if self._state is current:
+                    self._tickets = itertools.count()
+                    self._state = (HALF_OPEN, now)
+        elif state is OPEN:
+            return False
+        current = self._state
+        if current[0] is not HALF_OPEN or next(self._tickets) >= self.probes:
+            return False
+        self._probe.set(current)
+        return True
+
+    def record(self, code, now=None):
+        """Record the response to a request, or None for a request that got no response."""
+        if type(code) is not int or not 100 <= code <= 599:
+            code = validate_http_code(code, strict=False)
+        failed = self._failures[code]
+        if self._state[0] is not CLOSED:
+            self._record_probe(failed, now)
+            return
+
+        if now is None:
+            now = self.clock()
+        counts = self._local.counts
+        if counts is None or now >= counts[_END] or counts[_GENERATION] != self._generation:
+            counts = self._reset_shard(now)
+        counts[_REQUESTS] += 1
+        if failed:
+            counts[_FAILURES] += 1
+            self._check(counts[_WINDOW], now)
+
+    def _reset_shard(self, now):
+        """Start counting a new window in the shard of the calling thread, and return its counts."""
+        shard = self._local
+        if shard.counts is None:
+            counts = [None, None, 0, 0, None]
+            self._shards.register(shard, counts)
+            shard.counts = counts
+        window = int(now // self.window)
+        shard.counts[:] = [window, self._generation, 0, 0, (window + 1) * self.window]
+        return shard.counts
+
+    def _check(self, window, now):
+        """Open the breaker if the failures of every thread in this window are over the ratio."""
+        generation = self._generation
+        requests = failures = 0
+        shards = self._shards
+        # the base before the live shards, so a thread exiting meanwhile is missed rather than counted twice
+        base = shards.base
+        for counts in list(shards.live.values()) + ([] if base is None else [base]):
+            if counts[_WINDOW] == window and counts[_GENERATION] == generation:
+                requests += counts[_REQUESTS]
+                failures += counts[_FAILURES]
+        if requests >= self.minimum_requests and failures >= self.failure_ratio * requests:
+            self._state = (OPEN, now)
+
+    def _record_probe(self, failed, now):
+        """Close or reopen the breaker on the response to a probe. Responses to other requests are ignored."""
+        current = self._state
+        if current[0] is not HALF_OPEN or self._probe.get() is not current:
+            return
+        self._probe.set(None)
+        if now is None:
+            now = self.clock()
+        # only the first response of a round of probes decides
+        with self._shards.lock:
+            if self._state is not current:
+                return
+            if failed:
+                self._state = (OPEN, now)
+            else:
+                self._generation += 1
+                self._state = (CLOSED, now)
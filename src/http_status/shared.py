@@ -0,0 +1,172 @@
+#!/usr/bin/env python
+# licensed under the BSD 2-clause license
+
+"""Status code counts shared between pre-forked worker processes.
+
+``SharedStatusCounter`` lives in a ``multiprocessing.shared_memory`` block
+with one row of counts per worker. Each row starts on its own page, so
+workers never write to the same cache line and increments need no locks::
+
+    # in the master, before forking
+    >>> from http_status.shared import SharedStatusCounter
+    >>> shared = SharedStatusCounter(workers=32)
+
+    # in each worker, after forking
+    >>> counter = shared.claim()
+    >>> counter.add(200)
+
+    # in the master, e.g. when exporting metrics
+    >>> for code, name, count in shared.snapshot():
+    ...     print(code, name, count)
+    200 OK 1
+
+A worker that crashes leaves its counts behind, and its row is claimed by the
+next worker that calls ``claim()``, which keeps adding to it. Unrelated
+processes can attach to the block by name with ``SharedStatusCounter.attach()``
+and use ``worker(index)`` to pick their row.
+
+Requires Python 3.8 or later.
+"""
+
+import os
+import sys
+from array import array
+from multiprocessing import shared_memory
+
+from . import validate_http_code
+from .counter import StatusCounter, minimum, maximum
+
+_slots = maximum - minimum + 1
+
+# Each row is one page, a cache line holding the owner pid followed by the counts.
+_row_bytes = 4096
+_header_bytes = 64
+_row_words = _row_bytes // 8
+_header_words = _header_bytes // 8
+assert _header_bytes + _slots * 8 <= _row_bytes
+
+
+def _alive(pid):
+    """Return whether a process with the given pid is running."""
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class WorkerStatusCounter(object):
+    """Adds to one worker's row of a SharedStatusCounter."""
+    __slots__ = ('_words', '_base', 'index')
+
+    def __init__(self, words, index):
+        self._words = words
+        self._base = index * _row_words + _header_words - minimum
+        self.index = index
+
+    def add(self, code, count=1):
+        """Count the given status code, raising InvalidHttpCode for invalid ones."""
+        if type(code) is not int or not minimum <= code <= maximum:
+            code = validate_http_code(code, minimum, maximum)
+        self._words[self._base + code] += count
+
+
+class SharedStatusCounter(object):
+    """Status code counts for a fixed number of worker processes, in shared memory."""
+
+    def __init__(self, workers, name=None, _memory=None):
+        if _memory is None:
+            import multiprocessing
+
+            _memory = shared_memory.SharedMemory(name=name, create=True, size=workers * _row_bytes)
+            _memory.buf[:workers * _row_bytes] = bytes(workers * _row_bytes)
+            self._lock = multiprocessing.Lock()
+        else:
+            self._lock = None
+        self._memory = _memory
+        self._words = _memory.buf.cast('Q')
+        self.workers = workers
+
+    @property
+    def name(self):
+        """Return the name of the shared memory block, for attach()."""
+        return self._memory.name
+
+    @classmethod
+    def attach(cls, name, workers):
+        """Attach to a SharedStatusCounter created by another process."""
+        if sys.version_info >= (3, 13):
+            memory = shared_memory.SharedMemory(name=name, track=False)
+        else:
+            memory = shared_memory.SharedMemory(name=name)
+            # stop this process's resource tracker from unlinking the block when it exits
+            from multiprocessing import resource_tracker
+            resource_tracker.unregister(memory._name, 'shared_memory')
+        if memory.size < workers * _row_bytes:
+            memory.close()
+            raise ValueError('shared memory block {!r} is too small for {} workers'.format(name, workers))
+        return cls(workers, _memory=memory)
+
+    def worker(self, index):
+        """Return the counter for the given worker row, from 0 to workers - 1."""
+        if not 0 <= index < self.workers:
+            raise IndexError('worker index {} out of range for {} workers'.format(index, self.workers))
+        self._words[index * _row_words] = os.getpid()
+        return WorkerStatusCounter(self._words, index)
+
+    def claim(self):
+        """Return the counter of a row for this process, claiming a free or abandoned one.
+
+        Only available in the process that created the counter and the
+        processes forked from it. Raises RuntimeError if every row belongs to
+        a running process.
+        """
+        if self._lock is None:
+            raise RuntimeError('claim() needs the lock of the creating process, use worker(index) instead')
+        pid = os.getpid()
+        words = self._words
+        with self._lock:
+            free = None
+            for index in range(self.workers):
+                owner = words[index * _row_words]
+                if owner == pid:
+                    return WorkerStatusCounter(words, index)
+                if free is None and (owner == 0 or not _alive(owner)):
+                    free = index
+            if free is None:
+                raise RuntimeError('all {} worker rows are in use'.format(self.workers))
+            words[free * _row_words] = pid
+        return WorkerStatusCounter(words, free)
+
+    def release(self, index):
+        """Mark a worker row as free, keeping its counts."""
+        self._words[index * _row_words] = 0
+
+    def rows(self):
+        """Return a list of per-worker counts, each an array('Q') indexed by code - 100."""
+        data = self._memory.buf
+        rows = []
+        for index in range(self.workers):
+            start = index * _row_bytes + _header_bytes
+            row = array('Q')
+            row.frombytes(data[start:start + _slots * 8])
+            rows.append(row)
+        return rows
+
+    def snapshot(self):
+        """Return the counts of every worker added together, as a StatusCounter."""
+        totals = array('Q', [sum(column) for column in zip(*self.rows())])
+        counter = StatusCounter()
+        counter._shard()[:] = totals
+        return counter
+
+    def close(self):
+        """Detach from the shared memory block."""
+        self._words.release()
+        self._memory.close()
+
+    def unlink(self):
+        """Free the shared memory block, once every process has closed it."""
+        self._memory.unlink()
@@ -0,0 +1,213 @@
+#!/usr/bin/env python
+# licensed under the BSD 2-clause license
+
+"""Approximate top keys by status, such as routes or clients, in fixed memory.
+
+``StatusSketch`` counts (key, code) pairs in a count-min sketch, and keeps
+the heaviest keys of every status class and of a few codes, so questions
+like "which paths produce the most 5xx" don't need a counter per path::
+
+    >>> from http_status import Status
+    >>> from http_status.sketch import StatusSketch
+    >>> sketch = StatusSketch()
+    >>> sketch.add('/checkout', 503)
+    >>> sketch.add('/search', Status(500), 3)
+    >>> sketch.top('5xx')
+    [('/search', 3), ('/checkout', 1)]
+    >>> sketch.add('10.0.0.7', 429)
+    >>> sketch.top(429, 20)
+    [('10.0.0.7', 1)]
+    >>> sketch.estimate('/search', '5xx'), sketch.estimate('/search', 500)
+    (3, 3)
+
+Counters are raised conservatively, only as far as a pair's new estimate,
+which keeps estimates of light pairs much closer than plain increments.
+Estimates are never below the true count, and with probability at least
+``1 - exp(-depth)`` they're at most ``e / width`` times the total count
+above it, also after merging. ``StatusSketch.from_error(0.001, 0.01)``
+picks the width and depth for a given error and probability. Memory is
+``width * depth`` 64-bit counters plus ``capacity`` keys per heavy-hitter
+list, however many keys there are.
+
+Keys are hashed with MD5, or SHA-2 for more than 4 rows, not ``hash()``,
+so sketches built in different processes with the same width and depth can
+be merged by adding their counters. Top keys are only ever kept in the
+lists of the sketches merged, so a key that was never heavy on any of them
+isn't found in the merge.
+
+Codes are validated with ``validate_http_code``. Heavy keys are kept for
+every class and for 429, 499, 502, 503 and 504 by default.
+"""
+
+import hashlib
+import math
+import operator
+import struct
+from array import array
+
+from . import validate_http_code
+
+# Codes with their own list of heavy keys by default.
+default_codes = (429, 499, 502, 503, 504)
+
+# Status class labels, counted as codes 1 to 5.
+_class_labels = ('1xx', '2xx', '3xx', '4xx', '5xx')
+
+
+# Hash functions by the most rows their digest has 32 bits for.
+_digests = ((4, hashlib.md5), (8, hashlib.sha256), (16, hashlib.sha512))
+_max_depth = 16
+
+
+# {depth: mixers}, built once per depth as they're the same for every sketch.
+_mixer_cache = {}
+
+
+def _mixers(depth):
+    """Return, for each row, a tuple indexed by code of 32-bit values mixed into the hash of a key."""
+    mixers = _mixer_cache.get(depth)
+    if mixers is None:
+        mixers = _mixer_cache[depth] = tuple(
+            tuple(struct.unpack('<I', hashlib.md5('{}:{}'.format(row, code).encode('ascii')).digest()[:4])[0]
+                  for code in range(600)) for row in range(depth))
+    return mixers
+
+
+class StatusSketch(object):
+    """A count-min sketch of (key, status code) pairs with the heaviest keys of every class and a few codes."""
+
+    def __init__(self, width=2048, depth=4, capacity=100, codes=default_codes):
+        if not 1 <= depth <= _max_depth:
+            raise ValueError('depth must be between 1 and {}, not {}'.format(_max_depth, depth))
+        self.width = width
+        self.depth = depth
+        self._digest = [digest for rows, digest in _digests if depth <= rows][0]
+        self._unpack = struct.Struct('<{}I'.format(depth)).unpack
+        self._mixers = _mixers(depth)
+        self.capacity = capacity
+        self.codes = tuple(validate_http_code(code) for code in codes)
+        self.labels = _class_labels + self.codes
+        self.total = 0
+        self._counts = array('Q', [0]) * (width * depth)
+        # {label: {key: estimate}}, and the lowest estimate in each, for the heavy keys
+        self._heavy = dict((label, {}) for label in self.labels)
+        self._thresholds = dict((label, 0) for label in self.labels)
+
+    @classmethod
+    def from_error(cls, epsilon, delta, capacity=100, codes=default_codes):
+        """Return a sketch overestimating by at most epsilon of the total count, with probability 1 - delta."""
+        return cls(int(math.ceil(math.e / epsilon)), int(math.ceil(math.log(1 / delta))), capacity, codes)
+
+    def _hashes(self, key):
+        """Return a 32-bit hash of a key for every row, stable across processes."""
+        if not isinstance(key, bytes):
+            key = (key if isinstance(key, type(u'')) else str(key)).encode('utf-8')
+        return self._unpack(self._digest(key).digest()[:4 * self.depth])
+
+    def _cells(self, hashes, code):
+        """Return the index of the counter of a key, from its hashes, and a code in each row."""
+        width = self.width
+        return [row * width + (hashes[row] ^ mixers[code]) % width for row, mixers in enumerate(self._mixers)]
+
+    def _code(self, code):
+        """Return a valid code, or a class label such as '5xx' as its digit."""
+        if code in _class_labels:
+            return int(code[0])
+        if type(code) is not int or not 100 <= code <= 599:
+            code = validate_http_code(code)
+        return code
+
+    def add(self, key, code, count=1):
+        """Count a response with a code, a Status or any code validate_http_code() accepts, for a key."""
+        if type(code) is not int or not 100 <= code <= 599:
+            code = validate_http_code(code)
+        self.total += count
+        hashes = self._hashes(key)
+        counts = self._counts
+        heavy = self._heavy
+        width = self.width
+        rows = list(zip(range(0, width * self.depth, width), hashes, self._mixers))
+        for label, cell in ((_class_labels[code // 100 - 1], code // 100), (code, code)):
+            cells = [offset + (row_hash ^ mixers[cell]) % width for offset, row_hash, mixers in rows]
+            # conservative update: only raise the counters below the new estimate
+            estimate = min([counts[index] for index in cells]) + count
+            for index in cells:
+                if counts[index] < estimate:
+                    counts[index] = estimate
+            if label in heavy:
+                keys = heavy[label]
+                if key in keys:
+                    keys[key] = estimate
+                else:
+                    self._offer(label, key, estimate)
+
+    def _offer(self, label, key, estimate):
+        """Keep a key in the heavy keys of a label if its estimate is among the highest."""
+        heavy = self._heavy[label]
+        if key in heavy or len(heavy) < self.capacity:
+            heavy[key] = estimate
+            return
+        # estimates only grow, so the cached threshold is never above the lowest one
+        if estimate <= self._thresholds[label]:
+            return
+        lightest = min(heavy, key=heavy.get)
+        if estimate > heavy[lightest]:
+            del heavy[lightest]
+            heavy[key] = estimate
+            lightest = min(heavy, key=heavy.get)
+        self._thresholds[label] = heavy[lightest]
+
+    def estimate(self, key, code):
+        """Return the estimated count of a key for a code or a class label such as '5xx'."""
+        counts = self._counts
+        return min(counts[index] for index in self._cells(self._hashes(key), self._code(code)))
+
+    def top(self, label, count=None):
+        """Return the heaviest (key, estimate) pairs of a class label such as '5xx' or a code, highest first."""
+        code = label if label in _class_labels else self._code(label)
+        try:
+            heavy = self._heavy[code]
+        except KeyError:
+            raise KeyError('no heavy keys for {!r}, use one of {}'.format(label, self.labels))
+        return sorted(heavy.items(), key=lambda item: -item[1])[:count]
+
+    def merge(self, other):
+        """Add the counts and heavy keys of another sketch of the same size and codes to this one."""
+        if (other.width, other.depth, other.codes) != (self.width, self.depth, self.codes):
+            raise ValueError('cannot merge a sketch of {}x{} with codes {} into one of {}x{} with codes {}'.format(
+                other.width, other.depth, other.codes, self.width, self.depth, self.codes))
+        self._counts = array('Q', map(operator.add, self._counts, other._counts))
+        self.total += other.total
+        for label in self.labels:
+            keys = set(self._heavy[label]) | set(other._heavy[label])
+            self._heavy[label] = {}
+            self._thresholds[label] = 0
+            for key in keys:
+                self._offer(label, key, self.estimate(key, label))
+
+    def copy(self):
+        """Return a copy of this sketch."""
+        result = StatusSketch(self.width, self.depth, self.capacity, self.codes)
+        result.total = self.total
+        result._counts[:] = self._counts
+        result._heavy = dict((label, dict(keys)) for label, keys in self._heavy.items())
+        result._thresholds = dict(self._thresholds)
+        return result
+
+    def __add__(self, other):
+        result = self.copy()
+        result.merge(other)
+        return result
+
+    def __getstate__(self):
+        return (self.width, self.depth, self.capacity, self.codes, self.total, self._counts.tobytes(),
+                self._heavy)
+
+    def __setstate__(self, state):
+        width, depth, capacity, codes, total, counts, heavy = state
+        self.__init__(width, depth, capacity, codes)
+        self.total = total
+        self._counts = array('Q', counts)
+        for label, keys in heavy.items():
+            for key, estimate in keys.items():
+                self._offer(label, key, estimate)
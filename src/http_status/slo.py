@@ -0,0 +1,234 @@
+#!/usr/bin/env python
+# licensed under the BSD 2-clause license
+
+"""Sliding-window error rates and SLO burn-rate alerts from response statuses.
+
+``ErrorRateTracker`` counts responses into a ring of fixed-width time
+buckets, by status class and for a few specific codes. Recording is a single
+array increment, and buckets are recycled as time moves on, so nothing is
+allocated per response::
+
+    >>> from http_status.slo import ErrorRateTracker
+    >>> tracker = ErrorRateTracker(objective=0.999, bad=('5xx', 499))
+    >>> tracker.record(200)
+    >>> tracker.record(503)
+    >>> tracker.error_ratio(300), tracker.count(503, 60), tracker.count('2xx', 60)
+    (0.5, 1, 1)
+
+``bad`` lists the codes that use up the error budget, as class labels such
+as ``'5xx'`` or single codes, so whether 499 "Client Closed Request" counts
+as an error is up to the caller. ``exclude`` takes codes back out, e.g.
+``bad=('5xx',), exclude=(501,)``.
+
+Burn rates compare the error ratio to the one the objective allows. The
+tracker keeps running totals for every alert window as buckets expire, so
+``firing()`` costs the same however many responses were recorded::
+
+    >>> [alert.name for alert in tracker.firing()]
+    ['page']
+
+The default alerts are the multi-window ones of the Google SRE workbook
+that fit in an hour: a burn rate of 14.4 over both 1 hour and 5 minutes.
+Queries of other windows add up the buckets, up to ``window`` seconds.
+
+A tracker belongs to one thread or event loop, like ``asgi.LatencyHistograms``.
+"""
+
+import time
+from array import array
+
+from . import _code_table, validate_http_code
+
+try:
+    _clock = time.monotonic
+except AttributeError:
+    _clock = time.time
+
+# Labels of the class columns, the invalid codes then one per status class.
+_class_labels = ('invalid', '1xx', '2xx', '3xx', '4xx', '5xx')
+
+# Columns of every bucket before the class columns.
+_TOTAL = 0
+_BAD = 1
+_first_class = 2
+
+# Codes with their own columns by default.
+default_codes = (429, 499, 502, 503, 504)
+
+
+class BurnRateAlert(object):
+    """An alert firing when the burn rate reaches threshold over both a long and a short window."""
+    __slots__ = ('name', 'long_window', 'short_window', 'threshold')
+
+    def __init__(self, name, long_window, short_window, threshold):
+        self.name = name
+        self.long_window = long_window
+        self.short_window = short_window
+        self.threshold = threshold
+
+    def __repr__(self):
+        return 'BurnRateAlert({!r}, {!r}, {!r}, {!r})'.format(self.name, self.long_window, self.short_window,
+                                                           self.threshold)
+
+
+# 2% of a 30 day budget in an hour.
+default_alerts = (BurnRateAlert('page', 3600, 300, 14.4),)
+
+
+class ErrorRateTracker(object):
+    """Response counts over a sliding time window, by status class, code and whether they're errors."""
+
+    def __init__(self, objective=0.999, bad=('5xx',), exclude=(), codes=default_codes, alerts=default_alerts,
+                 window=None, resolution=10, clock=_clock):
+        """Track responses for an availability objective such as 0.999.
+
+        window is the longest window in seconds that can be queried, by
+        default the longest alert window, and resolution the width of a bucket.
+        """
+        if not 0 < objective < 1:
+            raise ValueError('objective must be between 0 and 1, not {!r}'.format(objective))
+        self.objective = objective
+        self.codes = tuple(validate_http_code(code) for code in codes)
+        self.labels = _class_labels + self.codes
+        self.alerts = tuple(alerts)
+        self.resolution = resolution
+        self.clock = clock
+        if window is None:
+            window = max([alert.long_window for alert in self.alerts] or [3600])
+        self.window = window
+        self._size = self._buckets(window)
+        self._columns = _first_class + len(self.labels)
+        # the columns of the closed buckets
+        self._counts = array('Q', [0]) * (self._size * self._columns)
+        # the epoch of every bucket, -1 for buckets never used
+        self._epochs = array('q', [-1]) * self._size
+        self._epoch = None
+        # counts of the current bucket by code, 0 for invalid codes, folded into columns when it closes
+        self._live = array('Q', [0]) * 600
+        # the time the current bucket closes
+        self._next = float('-inf')
+        self._bad_codes = tuple(code for code, is_bad in enumerate(_code_table(bad, exclude)) if is_bad)
+
+        # {window in buckets: index into _closed}, for the alert windows
+        windows = sorted(set(self._buckets(seconds) for alert in self.alerts
+                             for seconds in (alert.long_window, alert.short_window)))
+        for buckets in windows:
+            if buckets > self._size:
+                raise ValueError('alert window of {} seconds is longer than the window of {} seconds'.format(
+                    buckets * resolution, window))
+        self._windows = dict((buckets, index) for index, buckets in enumerate(windows))
+        # running (total, bad) of the closed buckets in each alert window, those before the current one
+        self._closed = array('Q', [0]) * (2 * len(windows))
+
+    def _buckets(self, seconds):
+        """Return the number of buckets covering a window in seconds."""
+        return max(1, int(-(-seconds // self.resolution)))
+
+    def _fold(self):
+        """Return the columns of the current bucket, from its counts by code."""
+        live = self._live
+        row = [sum(live), sum(map(live.__getitem__, self._bad_codes)), live[0]]
+        row.extend(sum(live[first:first + 100]) for first in range(100, 600, 100))
+        row.extend(live[code] for code in self.codes)
+        return row
+
+    def _advance(self, epoch):
+        """Move the current bucket to the given epoch, expiring buckets out of the alert windows."""
+        current = self._epoch
+        if current is not None and epoch <= current:
+            return
+        size = self._size
+        columns = self._columns
+        counts = self._counts
+        epochs = self._epochs
+        closed = self._closed
+        if current is not None and epoch - current < size:
+            offset = current % size * columns
+            counts[offset:offset + columns] = array('Q', self._fold())
+        self._live[:] = array('Q', [0]) * 600
+        if current is None or epoch - current >= size:
+            # everything has expired
+            counts[:] = array('Q', [0]) * len(counts)
+            epochs[:] = array('q', [-1]) * size
+            closed[:] = array('Q', [0]) * len(closed)
+        else:
+            for current in range(current, epoch):
+                # close the current bucket, and expire the oldest one of each window
+                offset = current % size * columns
+                total = counts[offset + _TOTAL]
+                bad = counts[offset + _BAD]
+                for buckets, index in self._windows.items():
+                    closed[2 * index] += total
+                    closed[2 * index + 1] += bad
+                    oldest = current + 1 - buckets
+                    if oldest >= 0 and epochs[oldest % size] == oldest:
+                        offset = oldest % size * columns
+                        closed[2 * index] -= counts[offset + _TOTAL]
+                        closed[2 * index + 1] -= counts[offset + _BAD]
+                slot = (current + 1) % size
+                if epochs[slot] != -1:
+                    counts[slot * columns:(slot + 1) * columns] = array('Q', [0]) * columns
+                    epochs[slot] = -1
+        epochs[epoch % size] = epoch
+        self._epoch = epoch
+        self._next = (epoch + 1) * self.resolution
+
+    def record(self, code, now=None):
+        """Record a response. Invalid codes are counted as 'invalid', never as errors."""
+        if now is None:
+            now = self.clock()
+        if now >= self._next:
+            self._advance(int(now // self.resolution))
+        if type(code) is not int or not 100 <= code <= 599:
+            code = validate_http_code(code, strict=False)
+        self._live[code] += 1
+
+    def _sum(self, column, seconds, now):
+        """Return the sum of a column over the last seconds."""
+        self._advance(int((self.clock() if now is None else now) // self.resolution))
+        buckets = self._buckets(seconds)
+        if buckets > self._size:
+            raise ValueError('cannot query {} seconds, the window is {} seconds'.format(seconds, self.window))
+        size = self._size
+        columns = self._columns
+        counts = self._counts
+        epochs = self._epochs
+        total = self._fold()[column]
+        for epoch in range(self._epoch - buckets + 1, self._epoch):
+            slot = epoch % size
+            if epochs[slot] == epoch:
+                total += counts[slot * columns + column]
+        return total
+
+    def totals(self, seconds, now=None):
+        """Return the number of (responses, errors) over the last seconds."""
+        self._advance(int((self.clock() if now is None else now) // self.resolution))
+        index = self._windows.get(self._buckets(seconds))
+        if index is None:
+            return self._sum(_TOTAL, seconds, now), self._sum(_BAD, seconds, now)
+        live = self._live
+        return (self._closed[2 * index] + sum(live),
+                self._closed[2 * index + 1] + sum(map(live.__getitem__, self._bad_codes)))
+
+    def count(self, key, seconds, now=None):
+        """Return the number of responses over the last seconds of a class label such as '5xx' or a tracked code."""
+        try:
+            row = self.labels.index(key)
+        except ValueError:
+            raise KeyError('no counts for {!r}, use one of {}'.format(key, self.labels))
+        return self._sum(_first_class + row, seconds, now)
+
+    def error_ratio(self, seconds, now=None):
+        """Return the fraction of responses over the last seconds that were errors, 0.0 without responses."""
+        total, bad = self.totals(seconds, now)
+        return float(bad) / total if total else 0.0
+
+    def burn_rate(self, seconds, now=None):
+        """Return how many times faster than the objective allows the error budget was used over the last seconds."""
+        return self.error_ratio(seconds, now) / (1 - self.objective)
+
+    def firing(self, now=None):
+        """Return the alerts whose burn rate reached their threshold over both of their windows."""
+        return [alert for alert in self.alerts
+                if self.burn_rate(alert.long_window, now) >= alert.threshold
+                and self.burn_rate(alert.short_window, now) >= alert.threshold]
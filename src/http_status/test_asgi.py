@@ -0,0 +1,127 @@
+#!/usr/bin/env python
+# licensed under the BSD 2-clause license
+
+import pickle
+import sys
+from unittest import TestCase, main, skipIf
+
+if sys.version_info >= (3, 7):
+    import asyncio
+    from http_status.asgi import LatencyHistograms, StatusLatencyMiddleware, _bucket, _bucket_bounds
+
+
+class Clock(object):
+    """A clock that advances by 20ms every time it's read."""
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        self.now += 0.02
+        return self.now
+
+
+def make_app(status=None, error=None):
+    async def app(scope, receive, send):
+        if status is not None:
+            await send({'type': 'http.response.start', 'status': status, 'headers': []})
+            await send({'type': 'http.response.body', 'body': b'body'})
+        if error is not None:
+            raise error
+    return app
+
+
+@skipIf(sys.version_info < (3, 7), 'needs asyncio.run')
+class LatencyHistogramsTest(TestCase):
+    def test_buckets(self):
+        for micros in (0, 1, 15, 16, 17, 31, 32, 1000, 123456, 10 ** 9):
+            low, high = _bucket_bounds(_bucket(micros / 1000000.0))
+            self.assertTrue(low <= micros / 1000000.0 < high, micros)
+            self.assertLessEqual(high - low, max(low / 16, 1e-6) + 1e-12)
+        self.assertEqual(_bucket(-1), 0)
+        self.assertEqual(_bucket(10 ** 9), _bucket(10 ** 8))
+
+    def test_record(self):
+        histograms = LatencyHistograms()
+        histograms.record(503, 0.25)
+        histograms.record('503', 0.5)
+        histograms.record(200, 0.001)
+        histograms.record(999, 0.001)
+        histograms.record('garbage', 0.001)
+        self.assertEqual(histograms.count('5xx'), 2)
+        self.assertEqual(histograms.count(503), 2)
+        self.assertEqual(histograms.count('2xx'), 1)
+        self.assertEqual(histograms.count('invalid'), 2)
+        self.assertAlmostEqual(histograms.total_seconds(503), 0.75)
+        self.assertAlmostEqual(histograms.quantile(503, 0.5), 0.25, delta=0.25 / 16)
+        self.assertAlmostEqual(histograms.quantile('5xx', 1.0), 0.5, delta=0.5 / 16)
+        self.assertIsNone(histograms.quantile(429, 0.5))
+        self.assertEqual([count for _, _, count in histograms.buckets(503)], [1, 1])
+        with self.assertRaises(KeyError):
+            histograms.count(404)
+
+    def test_merge(self):
+        first = LatencyHistograms()
+        second = LatencyHistograms()
+        first.record(502, 0.1)
+        second.record(502, 0.2)
+        merged = first + second
+        self.assertEqual(merged.count(502), 2)
+        self.assertEqual(first.count(502), 1)
+        first.merge(pickle.loads(pickle.dumps(second)))
+        self.assertEqual(first.count('5xx'), 2)
+        with self.assertRaises(ValueError):
+            first.merge(LatencyHistograms(codes=(404,)))
+
+    def test_snapshot(self):
+        histograms = LatencyHistograms(codes=(404,))
+        histograms.record(404, 0.01)
+        snapshot = histograms.snapshot()
+        histograms.record(404, 0.01)
+        self.assertEqual(snapshot.count(404), 1)
+        self.assertEqual(snapshot.labels, ('invalid', '1xx', '2xx', '3xx', '4xx', '5xx', 404))
+
+
+@skipIf(sys.version_info < (3, 7), 'needs asyncio.run')
+class StatusLatencyMiddlewareTest(TestCase):
+    def call(self, app, scope_type='http'):
+        messages = []
+
+        async def receive():
+            return {'type': 'http.request'}
+
+        async def send(message):
+            messages.append(message)
+
+        asyncio.run(app({'type': scope_type}, receive, send))
+        return messages
+
+    def test_records(self):
+        app = StatusLatencyMiddleware(make_app(429), clock=Clock())
+        messages = self.call(app)
+        self.assertEqual([message['type'] for message in messages], ['http.response.start', 'http.response.body'])
+        self.assertEqual(app.histograms.count(429), 1)
+        self.assertAlmostEqual(app.histograms.total_seconds('4xx'), 0.02)
+
+    def test_errors(self):
+        app = StatusLatencyMiddleware(make_app(error=RuntimeError('boom')))
+        with self.assertRaises(RuntimeError):
+            self.call(app)
+        self.assertEqual(app.histograms.count('5xx'), 1)
+        app = StatusLatencyMiddleware(make_app(error=asyncio.CancelledError()))
+        with self.assertRaises(asyncio.CancelledError):
+            self.call(app)
+        self.assertEqual(app.histograms.count(499), 1)
+
+    def test_odd_codes(self):
+        app = StatusLatencyMiddleware(make_app(999))
+        self.call(app)
+        self.assertEqual(app.histograms.count('invalid'), 1)
+
+    def test_other_scopes(self):
+        app = StatusLatencyMiddleware(make_app())
+        self.call(app, 'lifespan')
+        self.assertEqual(sum(app.histograms.count(label) for label in app.histograms.labels), 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,83 @@
+#!/usr/bin/env python
+# licensed under the BSD 2-clause license
+
+from array import array
+from unittest import TestCase, main, skipIf
+from http_status import batch, name, description, CACHEABLE, RETRYABLE, status_flags
+
+
+class BatchTestCase(TestCase):
+    codes = [200, 404, 404, 499, 480, 0, 777, '503']
+    classes = [2, 4, 4, 4, 4, 0, 0, 5]
+    valid = [True, True, True, True, True, False, False, True]
+
+
+class PurePythonBatchTest(BatchTestCase):
+    def test_status_class(self):
+        self.assertEqual(batch.status_class(self.codes), self.classes)
+
+    def test_valid_mask(self):
+        self.assertEqual(batch.valid_mask(self.codes), self.valid)
+        self.assertEqual(batch.valid_mask([450, 550], maximum=500), [True, False])
+
+    def test_name_index(self):
+        names = [batch.name_labels[i] for i in batch.name_index(self.codes)]
+        self.assertEqual(names, [name.get(int(code)) for code in self.codes])
+
+    def test_description_index(self):
+        descriptions = [batch.description_labels[i] for i in batch.description_index(self.codes)]
+        self.assertEqual(descriptions, [description.get(int(code)) for code in self.codes])
+
+    def test_status_flags(self):
+        self.assertEqual(batch.status_flags(self.codes), [status_flags[int(code)] if valid else 0
+                                                          for code, valid in zip(self.codes, self.valid)])
+        self.assertEqual(batch.has_flag(self.codes, CACHEABLE), [True, True, True, False, False, False, False, False])
+        self.assertEqual(batch.has_flag(self.codes, CACHEABLE | RETRYABLE)[-1], True)
+
+    def test_histogram(self):
+        counts = batch.histogram(array('H', [200, 404, 404, 999]))
+        self.assertEqual(len(counts), 600)
+        self.assertEqual(counts[404], 2)
+        self.assertEqual(counts[200], 1)
+        self.assertEqual(counts[0], 1)
+        self.assertEqual(sum(counts), 4)
+
+
+@skipIf(batch.numpy is None, 'NumPy is not installed')
+class NumpyBatchTest(BatchTestCase):
+    def setUp(self):
+        self.array = batch.numpy.array([int(code) for code in self.codes], dtype=batch.numpy.int32)
+
+    def test_status_class(self):
+        self.assertEqual(batch.status_class(self.array).tolist(), self.classes)
+
+    def test_valid_mask(self):
+        self.assertEqual(batch.valid_mask(self.array).tolist(), self.valid)
+
+    def test_name_index(self):
+        self.assertEqual(batch.name_index(self.array).tolist(), batch.name_index(self.codes))
+        self.assertEqual(batch.description_index(self.array).tolist(), batch.description_index(self.codes))
+
+    def test_status_flags(self):
+        self.assertEqual(batch.status_flags(self.array).tolist(), batch.status_flags(self.codes))
+        self.assertEqual(batch.has_flag(self.array, RETRYABLE).tolist(), batch.has_flag(self.codes, RETRYABLE))
+
+    def test_histogram(self):
+        self.assertEqual(batch.histogram(self.array).tolist(), batch.histogram(self.codes))
+
+    def test_dtypes(self):
+        codes = [200, 404, 404, 999]
+        for dtype in ('int16', 'int32', 'int64', 'uint16', 'uint32', 'uint64'):
+            array = batch.numpy.array(codes, dtype=dtype)
+            self.assertEqual(batch.histogram(array).tolist(), batch.histogram(codes), dtype)
+            self.assertEqual(batch.status_class(array).tolist(), batch.status_class(codes), dtype)
+            self.assertEqual(batch.valid_mask(array).tolist(), batch.valid_mask(codes), dtype)
+            self.assertEqual(batch.name_index(array).tolist(), batch.name_index(codes), dtype)
+
+    def test_float_array(self):
+        with self.assertRaises(TypeError):
+            batch.status_class(batch.numpy.array([200.0]))
+
+
+if __name__ == '__main__':
+    main()
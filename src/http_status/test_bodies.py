@@ -0,0 +1,82 @@
+#!/usr/bin/env python
+# licensed under the BSD 2-clause license
+
+import gzip
+import io
+import json
+from unittest import TestCase, main
+from http_status import registry, description, InvalidHttpCode
+from http_status.bodies import ErrorBodyCache
+
+
+def gunzip(data):
+    return gzip.GzipFile(fileobj=io.BytesIO(data)).read()
+
+
+class ErrorBodyCacheTest(TestCase):
+    def setUp(self):
+        self.cache = ErrorBodyCache()
+
+    def test_json(self):
+        body = self.cache.get(503, 'json')
+        self.assertEqual(json.loads(bytes(body.body).decode('utf-8')),
+                         {'code': 503, 'name': 'Service Unavailable',
+                          'description': description[503]})
+        self.assertEqual(body.content_length, len(body.body))
+        self.assertEqual(dict(body.headers)['Content-Length'], str(body.content_length))
+        self.assertEqual(dict(body.headers)['Content-Type'], 'application/json')
+
+    def test_html(self):
+        body = self.cache.get('418')
+        self.assertIn(b'<h1>418 I&#x27;m a Teapot</h1>', bytes(body.body))
+        self.assertTrue(body.body.readonly)
+        self.assertTrue(body.etag.startswith('"') and body.etag.endswith('"'))
+
+    def test_cached(self):
+        self.assertIs(self.cache.get(404), self.cache.get(404))
+        self.assertIs(self.cache.get(404, 'json'), self.cache.get('404', 'json'))
+        self.assertIsNot(self.cache.get(404), self.cache.get(404, 'json'))
+        self.assertNotEqual(self.cache.get(404).etag, self.cache.get(404, 'json').etag)
+
+    def test_gzip(self):
+        plain = self.cache.get(500, 'json')
+        compressed = self.cache.get(500, 'json', 'gzip')
+        self.assertEqual(gunzip(bytes(compressed.body)), bytes(plain.body))
+        self.assertEqual(dict(compressed.headers)['Content-Encoding'], 'gzip')
+        self.assertNotEqual(compressed.etag, plain.etag)
+        # compression is deterministic, so ETags are stable across processes
+        self.assertEqual(ErrorBodyCache().get(500, 'json', 'gzip').etag, compressed.etag)
+
+    def test_errors(self):
+        with self.assertRaises(InvalidHttpCode):
+            self.cache.get(600)
+        with self.assertRaises(ValueError):
+            self.cache.get(404, 'xml')
+        with self.assertRaises(ValueError):
+            self.cache.get(404, encoding='compress')
+
+    def test_set_template(self):
+        html = self.cache.get(404)
+        json_body = self.cache.get(404, 'json')
+        self.cache.set_template('text', '{code} {name}\n', 'text/plain')
+        self.assertEqual(bytes(self.cache.get(404, 'text').body), b'404 Not Found\n')
+        self.assertIs(self.cache.get(404), html)
+        self.cache.set_template('html', '<p>{name}</p>', 'text/html')
+        self.assertEqual(bytes(self.cache.get(404).body), b'<p>Not Found</p>')
+        self.assertIs(self.cache.get(404, 'json'), json_body)
+
+    def test_snapshot(self):
+        html = self.cache.get(404)
+        cloudflare = registry.Registry('cloudflare', {522: 'Connection Timed Out'})
+        self.cache.set_snapshot(registry.default.extend(cloudflare))
+        self.assertIn(b'Connection Timed Out', bytes(self.cache.get(522).body))
+        self.assertIsNot(self.cache.get(404), html)
+
+    def test_warm(self):
+        self.cache.warm(encodings=(None, 'gzip'))
+        named = [code for code in range(400, 600) if code in registry.default.name]
+        self.assertEqual(len(self.cache._bodies), 4 * len(named))
+
+
+if __name__ == '__main__':
+    main()
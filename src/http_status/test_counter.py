@@ -0,0 +1,93 @@
+#!/usr/bin/env python
+# licensed under the BSD 2-clause license
+
+import gc
+import pickle
+import threading
+from unittest import TestCase, main
+from http_status import StatusCounter, InvalidHttpCode
+
+
+class StatusCounterTest(TestCase):
+    def test_add(self):
+        counter = StatusCounter()
+        counter.add(200)
+        counter.add('404', 3)
+        counter.add(b'404')
+        self.assertEqual(list(counter), [(200, 'OK', 1), (404, 'Not Found', 4)])
+        self.assertEqual(counter[404], 4)
+        self.assertEqual(counter[500], 0)
+        self.assertEqual(counter.total(), 5)
+        self.assertEqual(counter.classes(), {'2xx': 1, '4xx': 4})
+
+    def test_invalid(self):
+        counter = StatusCounter()
+        for code in (99, 600, 'abc', None):
+            with self.assertRaises(InvalidHttpCode):
+                counter.add(code)
+        with self.assertRaises(ValueError):
+            counter.add(200, -1)
+        self.assertEqual(counter.total(), 0)
+
+    def test_update(self):
+        self.assertEqual(StatusCounter([200, 200, 480]), StatusCounter({200: 2, 480: 1}))
+        self.assertEqual(list(StatusCounter([480])), [(480, None, 1)])
+
+    def test_merge_subtract(self):
+        first = StatusCounter({200: 5, 404: 1})
+        second = StatusCounter({200: 2, 503: 1})
+        self.assertEqual(first + second, StatusCounter({200: 7, 404: 1, 503: 1}))
+        self.assertEqual(first - second, StatusCounter({200: 3, 404: 1}))
+        first -= second
+        first.add(503)
+        self.assertEqual(first, StatusCounter({200: 3, 404: 1, 503: 1}))
+        first += second
+        self.assertEqual(first[200], 5)
+
+    def test_clear(self):
+        counter = StatusCounter({200: 5})
+        counter.clear()
+        self.assertEqual(counter.total(), 0)
+        counter.add(200)
+        self.assertEqual(counter[200], 1)
+
+    def test_serialization(self):
+        counter = StatusCounter({200: 2 ** 40, 404: 1, 599: 7})
+        data = counter.to_bytes()
+        self.assertEqual(len(data), 6 + 3 * 10)
+        self.assertEqual(StatusCounter.from_bytes(data), counter)
+        self.assertEqual(pickle.loads(pickle.dumps(counter)), counter)
+        with self.assertRaises(ValueError):
+            StatusCounter.from_bytes(data[:-1])
+
+    def test_threads(self):
+        counter = StatusCounter()
+        codes = [200, 201, 404, 500]
+
+        def work():
+            for _ in range(2000):
+                for code in codes:
+                    counter.add(code)
+
+        threads = [threading.Thread(target=work) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        counter.subtract(StatusCounter())
+        for thread in threads:
+            thread.join()
+        self.assertEqual(counter.counts()[200 - 100], 16000)
+        self.assertEqual(counter.total(), 16000 * len(codes))
+
+    def test_exited_threads(self):
+        counter = StatusCounter()
+        for _ in range(50):
+            thread = threading.Thread(target=counter.add, args=(503,))
+            thread.start()
+            thread.join()
+        gc.collect()
+        self.assertLessEqual(len(counter._shards.live), 1)
+        self.assertEqual(counter[503], 50)
+
+
+if __name__ == '__main__':
+    main()
@@ -4,9 +4,15 @@
 
 __author__ = 'Chad Nelson'
 
-import six
+import copy
+import os
+import pickle
+import subprocess
+import sys
+from http_status import six
 from unittest import TestCase, main
-from http_status import Status, NoneStatus, InvalidHttpCode
+import http_status
+from http_status import Status, NoneStatus, InvalidHttpCode, validate_http_code
 
 
 class HTTPStatusTestCase(TestCase):
@@ -71,6 +77,25 @@ class StatusTest(HTTPStatusTestCase):
         self.assertEqual(HTTP_Status.__unicode__(verbose=True), self.correct_unicode_verbose)
         self.assertEqual(HTTP_Status.__unicode__(verbose=False), self.correct_unicode)
 
+    def test__unicode__without_name(self):
+        HTTP_Status = Status(code=self.undefined_code, name_fail=self.alt_name_fail)
+        self.assertEqual(HTTP_Status.__unicode__(), six.u('HTTP {} {}').format(self.undefined_code, self.alt_name_fail))
+        HTTP_Status = Status(code=419)  # named, but without a description
+        self.assertEqual(HTTP_Status.__unicode__(verbose=True),
+                         six.u('HTTP 419 Authentication Timeout: {}').format(self.default_description_fail))
+
+    def test_pickle(self):
+        HTTP_Status = Status(code=self.correct_code, name_fail=self.alt_name_fail)
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            unpickled = pickle.loads(pickle.dumps(HTTP_Status, protocol))
+            self.assertEqual(unpickled.code, self.correct_code)
+            self.assertEqual(unpickled.name_fail, self.alt_name_fail)
+
+    def test_extra_attributes(self):
+        HTTP_Status = Status(code=self.correct_code)
+        HTTP_Status.extra = 'extra'
+        self.assertEqual(HTTP_Status.extra, 'extra')
+
 
 class NoneStatusTest(HTTPStatusTestCase):
     def test_code_match(self):
@@ -79,5 +104,261 @@ class NoneStatusTest(HTTPStatusTestCase):
         self.assertEqual(HTTP_NoneStatus.code, HTTP_Status.code)
 
 
+class StatusOfTest(HTTPStatusTestCase):
+    def test_interned(self):
+        HTTP_Status = Status.of(self.correct_code)
+        self.assertIs(HTTP_Status, Status.of(self.correct_code))
+        self.assertIsInstance(HTTP_Status, Status)
+        self.assertEqual(HTTP_Status.code, self.correct_code)
+        self.assertEqual(HTTP_Status.name, self.correct_name)
+        self.assertEqual(HTTP_Status.description, self.correct_description)
+        self.assertEqual(HTTP_Status.__unicode__(verbose=True), self.correct_unicode_verbose)
+
+    def test_string_code(self):
+        self.assertIs(Status.of(str(self.correct_code)), Status.of(self.correct_code))
+
+    def test_immutable(self):
+        HTTP_Status = Status.of(self.correct_code)
+        with self.assertRaises(AttributeError):
+            HTTP_Status.code = self.default_code
+        with self.assertRaises(AttributeError):
+            HTTP_Status.name_fail = self.alt_name_fail
+
+    def test_undefined_code(self):
+        self.assertEqual(Status.of(self.undefined_code).name, self.default_name_fail)
+        self.assertIsNone(NoneStatus.of(self.undefined_code).name)
+        self.assertIsInstance(NoneStatus.of(self.undefined_code), NoneStatus)
+        self.assertIsNot(NoneStatus.of(self.correct_code), Status.of(self.correct_code))
+
+    def test_invalid_code(self):
+        for code in (self.exceeds_max_code, self.below_min_code, self.non_numeric_code, [self.correct_code]):
+            with self.assertRaises(InvalidHttpCode):
+                Status.of(code)
+
+    def test_pickle(self):
+        for cls in (Status, NoneStatus):
+            HTTP_Status = cls.of(self.correct_code)
+            for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+                self.assertIs(pickle.loads(pickle.dumps(HTTP_Status, protocol)), HTTP_Status)
+
+    def test_copy(self):
+        HTTP_Status = Status.of(self.correct_code)
+        self.assertIs(copy.copy(HTTP_Status), HTTP_Status)
+        self.assertIs(copy.deepcopy(HTTP_Status), HTTP_Status)
+
+    def test_of_interned(self):
+        HTTP_Status = NoneStatus.of(self.correct_code)
+        self.assertIs(HTTP_Status.of(self.default_code), NoneStatus.of(self.default_code))
+        self.assertIs(type(HTTP_Status).of(self.default_code), NoneStatus.of(self.default_code))
+
+    def test_no_instance_dict(self):
+        HTTP_Status = Status.of(self.correct_code)
+        self.assertEqual(type(HTTP_Status).__dictoffset__, 0)
+        self.assertFalse(hasattr(HTTP_Status, '__dict__'))
+
+    def test_mutable_status(self):
+        HTTP_Status = Status(code=self.correct_code)
+        HTTP_Status.code = self.default_code
+        self.assertEqual(HTTP_Status.code, self.default_code)
+
+
+class ValidateTest(HTTPStatusTestCase):
+    def test_fast_path_types(self):
+        for code in (404, '404', b'404', six.u('404')):
+            self.assertEqual(validate_http_code(code), self.correct_code)
+            self.assertIs(type(validate_http_code(code)), int)
+
+    def test_slow_path_types(self):
+        for code in (404.0, ' 404', b'404\n', bytearray(b'404'), memoryview(b'404')):
+            self.assertEqual(validate_http_code(code), self.correct_code)
+
+    def test_bounds(self):
+        self.assertEqual(validate_http_code(b'450', maximum=499), 450)
+        self.assertEqual(validate_http_code(b'550', maximum=499, strict=False), 0)
+        with self.assertRaises(InvalidHttpCode):
+            validate_http_code(b'550', maximum=499)
+
+    def test_invalid_non_strict(self):
+        for code in (self.exceeds_max_code, self.below_min_code, self.non_numeric_code, b'099', b'4x4',
+                     memoryview(b'abc'), None):
+            self.assertEqual(validate_http_code(code, strict=False, default_http_code=-1), -1)
+
+    def test_invalid_strict(self):
+        for code in (self.exceeds_max_code, b'099', b'4x4', None):
+            with self.assertRaises(InvalidHttpCode):
+                validate_http_code(code)
+
+
+class TableTest(HTTPStatusTestCase):
+    def test_read_only(self):
+        with self.assertRaises(TypeError):
+            http_status.name[self.undefined_code] = self.alt_name_fail
+        with self.assertRaises(TypeError):
+            http_status.description[self.undefined_code] = self.alt_description_fail
+
+    def test_tables_match_views(self):
+        for code in range(len(http_status._name_table)):
+            self.assertEqual(http_status._name_table[code], http_status.name.get(code))
+            self.assertEqual(http_status._description_table[code], http_status.description.get(code))
+
+    def test_lookup(self):
+        self.assertEqual(http_status.name[self.correct_code], self.correct_name)
+        self.assertEqual(http_status.description[self.correct_code], self.correct_description)
+        self.assertNotIn(self.undefined_code, http_status.name)
+
+
+class FlagsTest(HTTPStatusTestCase):
+    def test_properties(self):
+        self.assertTrue(Status(200).cacheable)
+        self.assertFalse(Status(302).cacheable)
+        self.assertFalse(Status(204).may_have_body)
+        self.assertFalse(Status(304).may_have_body)
+        self.assertFalse(Status(101).may_have_body)
+        self.assertTrue(Status(404).may_have_body)
+        self.assertTrue(Status(503).retryable)
+        self.assertFalse(Status(501).retryable)
+        self.assertTrue(Status(307).preserves_method)
+        self.assertTrue(Status.of(308).preserves_method)
+        self.assertFalse(Status(302).preserves_method)
+        self.assertTrue(Status(self.undefined_code).is_error)
+        self.assertFalse(Status(399).is_error)
+
+    def test_flags(self):
+        self.assertEqual(Status(308).flags, http_status.CACHEABLE | http_status.MAY_HAVE_BODY |
+                         http_status.PRESERVES_METHOD)
+        self.assertEqual(Status(self.below_min_code, strict=False).flags, 0)
+        self.assertEqual(len(http_status.status_flags), len(http_status._name_table))
+
+
+class IntLikeTest(HTTPStatusTestCase):
+    def test_compare(self):
+        status = Status(self.correct_code)
+        self.assertEqual(status, self.correct_code)
+        self.assertEqual(self.correct_code, status)
+        self.assertEqual(status, NoneStatus(self.correct_code))
+        self.assertEqual(status, Status.of(self.correct_code))
+        self.assertNotEqual(status, Status(self.default_code))
+        self.assertNotEqual(status, str(self.correct_code))
+        self.assertTrue(Status(200) < Status(404) <= 404 < Status(500))
+        self.assertTrue(Status(500) > 404 >= Status(404))
+        with self.assertRaises(TypeError):
+            Status(200) < '404'
+
+    def test_sort(self):
+        codes = [503, 200, 404, 200]
+        self.assertEqual(sorted(Status(code) for code in codes), sorted(codes))
+
+    def test_hash(self):
+        counts = {Status.of(200): 1}
+        self.assertEqual(counts[200], 1)
+        self.assertEqual({404: 'x'}[Status(404)], 'x')
+        self.assertEqual(len(set([Status(404), Status.of(404), NoneStatus(404), 404])), 1)
+
+    def test_hashed_frozen(self):
+        status = Status(self.correct_code)
+        statuses = set([status])
+        with self.assertRaises(AttributeError):
+            status.code = self.default_code
+        self.assertIn(status, statuses)
+        status = copy.copy(status)
+        status.code = self.default_code
+        self.assertEqual(status, self.default_code)
+        self.assertEqual(http_status.pack_status(status), self.default_code)
+
+    def test_compare_float(self):
+        for status in (Status(self.correct_code), Status.of(self.correct_code)):
+            self.assertEqual(status, float(self.correct_code))
+            self.assertEqual(float(self.correct_code), status)
+            self.assertTrue(status < self.correct_code + 0.5)
+
+    def test_int(self):
+        status = Status(self.correct_code)
+        self.assertEqual(int(status), self.correct_code)
+        self.assertEqual(http_status._name_table[status], self.correct_name)
+        self.assertEqual(list(range(1000))[status], self.correct_code)
+        self.assertEqual(validate_http_code(status), self.correct_code)
+        self.assertEqual(int(Status(self.exceeds_max_code, strict=False)), 0)
+        self.assertEqual(status.name, self.correct_name)
+
+    def test_interned_are_ints(self):
+        status = Status.of(self.correct_code)
+        self.assertIsInstance(status, int)
+        self.assertIsInstance(status, Status)
+        self.assertEqual(status, self.correct_code)
+        self.assertEqual(status, Status(self.correct_code))
+        self.assertTrue(status < Status(500))
+        self.assertEqual(status.name, self.correct_name)
+        self.assertTrue(repr(status).startswith('<http_status.Status object'))
+
+
+class SubStatus(Status):
+    pass
+
+
+class PackTest(HTTPStatusTestCase):
+    def assertSameStatus(self, first, second):
+        self.assertIs(type(first), type(second))
+        self.assertEqual(first.__dict__, second.__dict__)
+
+    def test_pack(self):
+        self.assertEqual(http_status.pack_status(Status(self.correct_code)), self.correct_code)
+        self.assertEqual(http_status.pack_status(self.correct_code), self.correct_code | 1 << 12)
+        self.assertTrue(http_status.pack_status(Status(self.correct_code, strict=False)) < 1 << 16)
+        for status in (Status(self.correct_code), Status(self.exceeds_max_code, strict=False),
+                       NoneStatus(self.undefined_code)):
+            self.assertSameStatus(http_status.unpack_status(http_status.pack_status(status)), status)
+        for status in (Status.of(self.correct_code), NoneStatus.of(self.correct_code)):
+            self.assertIs(http_status.unpack_status(http_status.pack_status(status)), status)
+
+    def test_unpackable(self):
+        extra = Status(self.correct_code)
+        extra.route = '/'
+        for status in (Status(self.correct_code, name_fail=self.alt_name_fail), SubStatus(self.correct_code), extra):
+            with self.assertRaises(ValueError):
+                http_status.pack_status(status)
+            unpickled = pickle.loads(pickle.dumps(status))
+            self.assertSameStatus(unpickled, status)
+        with self.assertRaises(ValueError):
+            http_status.unpack_status(1 << 15)
+        with self.assertRaises(InvalidHttpCode):
+            http_status.unpack_status(self.exceeds_max_code)
+
+    def test_pickle_is_compact(self):
+        status = Status(self.correct_code)
+        self.assertLess(len(pickle.dumps(status, 2)), len(pickle.dumps(status.__dict__, 2)))
+        self.assertSameStatus(pickle.loads(pickle.dumps(status, 2)), status)
+        self.assertSameStatus(copy.copy(status), status)
+
+    def test_bulk(self):
+        statuses = [Status.of(200), Status(self.correct_code), NoneStatus(self.undefined_code),
+                    Status(self.below_min_code, strict=False), NoneStatus.of(500)]
+        data = http_status.encode_statuses(statuses + [self.correct_code])
+        self.assertEqual(len(data), 2 * (len(statuses) + 1))
+        decoded = http_status.decode_statuses(data)
+        self.assertIs(decoded[0], statuses[0])
+        self.assertIs(decoded[4], statuses[4])
+        self.assertIs(decoded[5], Status.of(self.correct_code))
+        for first, second in zip(decoded[1:4], statuses[1:4]):
+            self.assertSameStatus(first, second)
+        self.assertEqual(http_status.decode_statuses(b''), [])
+        with self.assertRaises(InvalidHttpCode):
+            http_status.encode_statuses([self.exceeds_max_code])
+
+
+class LazyLoadTest(HTTPStatusTestCase):
+    def test_import_loads_no_extras(self):
+        code = ('import sys, http_status; '
+                'print(sorted(m for m in sys.modules if m == "six" or m.startswith("http_status.")))')
+        src = os.path.dirname(os.path.dirname(os.path.abspath(http_status.__file__)))
+        output = subprocess.check_output([sys.executable, '-c', code], cwd=src)
+        self.assertEqual(output.strip(), b'[]' if sys.version_info >= (3, 7) else output.strip())
+
+    def test_lazy_attributes(self):
+        self.assertEqual(http_status.description[self.correct_code], self.correct_description)
+        self.assertIs(http_status.wire, __import__('http_status.wire').wire)
+        with self.assertRaises(AttributeError):
+            http_status.no_such_attribute
+
+
 if __name__ == '__main__':
     main()
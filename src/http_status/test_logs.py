@@ -0,0 +1,132 @@
+#!/usr/bin/env python
+# licensed under the BSD 2-clause license
+
+import gzip
+import os
+import shutil
+import tempfile
+from unittest import TestCase, main
+from http_status import logs
+
+
+class LogTestCase(TestCase):
+    nginx_line = (b'127.0.0.1 - - [10/Oct/2014:13:55:36 +0000] "GET /index.html HTTP/1.1" 499 0 "-" '
+                  b'"Mozilla/5.0"\n')
+    apache_line = b'10.0.0.2 - frank [10/Oct/2014:13:55:36 -0700] "GET /a\\" b HTTP/1.0" 200 2326\n'
+    bad_lines = [
+        b'\n',
+        b'garbage\n',
+        b'127.0.0.1 - - [10/Oct/2014:13:55:36 +0000] "-" 9999 0\n',
+        b'127.0.0.1 - - [10/Oct/2014:13:55:36 +0000] "GET / HTTP/1.1" 777 0\n',
+        b'127.0.0.1 - - [10/Oct/2014:13:55:36 +0000] "GET / HTTP/1.1" 600 0\n',
+        b'127.0.0.1 - - [10/Oct/2014:13:55:36 +0000] "GET / HTTP/1.1" 04 0\n',
+    ]
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'access.log')
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+
+class ParseTest(LogTestCase):
+    def test_nginx(self):
+        self.assertEqual(logs.parse_status(self.nginx_line), 499)
+
+    def test_apache_escaped_quote(self):
+        self.assertEqual(logs.parse_status(self.apache_line), 200)
+
+    def test_crlf(self):
+        self.assertEqual(logs.parse_status(b'10.0.0.2 - - [10/Oct/2014:13:55:36 -0700] "GET / HTTP/1.0" 204\r\n'), 204)
+
+    def test_bad_lines(self):
+        for line in self.bad_lines:
+            self.assertEqual(logs.parse_status(line), 0)
+
+
+class AggregatorTest(LogTestCase):
+    def test_feed(self):
+        with gzip.open(self.path + '.gz', 'wb') as handle:
+            handle.writelines([self.nginx_line, self.apache_line, self.apache_line] + self.bad_lines)
+        aggregator = logs.StatusAggregator()
+        aggregator.feed(logs.read_lines(self.path + '.gz'))
+        self.assertEqual(list(aggregator), [(200, 'OK', 2), (499, 'Client Closed Request', 1)])
+        self.assertEqual(aggregator.class_counts(), {'2xx': 2, '4xx': 1})
+        self.assertEqual(aggregator.unparsed, len(self.bad_lines))
+        self.assertEqual(aggregator.total, 3 + len(self.bad_lines))
+
+    def test_add(self):
+        aggregator = logs.StatusAggregator()
+        aggregator.add(404)
+        aggregator.add(777)
+        aggregator.add('garbage', 2)
+        self.assertEqual(list(aggregator), [(404, 'Not Found', 1)])
+        self.assertEqual(aggregator.unparsed, 3)
+
+
+class CountFilesTest(LogTestCase):
+    def setUp(self):
+        LogTestCase.setUp(self)
+        self.lines = ([self.nginx_line, self.apache_line] * 50) + self.bad_lines
+        with open(self.path, 'wb') as handle:
+            handle.writelines(self.lines)
+        with gzip.open(self.path + '.gz', 'wb') as handle:
+            handle.writelines(self.lines)
+
+    def test_split_ranges(self):
+        ranges = logs.split_ranges(self.path, size=100)
+        self.assertGreater(len(ranges), 1)
+        self.assertEqual(ranges[0][0], 0)
+        self.assertEqual(ranges[-1][1], os.path.getsize(self.path))
+        with open(self.path, 'rb') as handle:
+            data = handle.read()
+        for start, end in ranges:
+            self.assertEqual(data[end - 1:end], b'\n')
+
+    def test_matches_feed(self):
+        expected = logs.StatusAggregator()
+        expected.feed(self.lines * 2)
+        for processes in (1, 2):
+            aggregator = logs.count_files([self.path, self.path + '.gz'], processes=processes, size=100)
+            self.assertEqual(aggregator.counts, expected.counts)
+
+    def test_missing_final_newline(self):
+        with open(self.path, 'wb') as handle:
+            handle.write(self.nginx_line + self.apache_line.rstrip(b'\n'))
+        aggregator = logs.count_files([self.path], processes=1)
+        self.assertEqual(aggregator.total, 2)
+        self.assertEqual(aggregator.unparsed, 0)
+
+
+class FollowTest(LogTestCase):
+    def test_rotation(self):
+        with open(self.path, 'wb') as handle:
+            handle.write(self.nginx_line)
+        lines = logs.follow(self.path, interval=0.01, from_start=True)
+        self.assertEqual(next(lines), self.nginx_line)
+
+        os.rename(self.path, self.path + '.1')
+        with open(self.path, 'wb') as handle:
+            handle.write(self.apache_line)
+        self.assertEqual(next(lines), self.apache_line)
+
+    def test_truncation_and_partial_lines(self):
+        with open(self.path, 'wb') as handle:
+            handle.write(self.nginx_line)
+        lines = logs.follow(self.path, interval=0.01)
+
+        with open(self.path, 'ab') as handle:
+            handle.write(self.apache_line[:10])
+            handle.flush()
+            handle.write(self.apache_line[10:])
+        self.assertEqual(next(lines), self.apache_line)
+
+        with open(self.path, 'wb') as handle:
+            handle.write(b'x\n')
+        self.assertEqual(next(lines), b'x\n')
+        lines.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,92 @@
+#!/usr/bin/env python
+# licensed under the BSD 2-clause license
+
+import sys
+from unittest import TestCase, main, skipIf
+from http_status import InvalidHttpCode, StatusCounter
+from http_status.prometheus import MetricsRenderer, code_labels
+
+if sys.version_info >= (3, 7):
+    from http_status.asgi import LatencyHistograms
+
+
+def render(renderer, *calls):
+    renderer.begin()
+    for method, args, kwargs in calls:
+        getattr(renderer, method)(*args, **kwargs)
+    body = renderer.finish()
+    text = body.tobytes().decode('utf-8')
+    body.release()
+    return text
+
+
+class MetricsRendererTest(TestCase):
+    def test_code_labels(self):
+        self.assertEqual(code_labels[404], b'class="4xx",code="404",reason="Not Found"')
+        self.assertEqual(code_labels[299], b'class="2xx",code="299",reason=""')
+        self.assertIsNone(code_labels[99])
+
+    def test_counter(self):
+        text = render(MetricsRenderer(), ('counter', ('http_responses_total', StatusCounter({200: 5, 404: 1})),
+                                          {'help': 'HTTP responses.'}))
+        self.assertEqual(text, '# HELP http_responses_total HTTP responses.\n'
+                               '# TYPE http_responses_total counter\n'
+                               'http_responses_total{class="2xx",code="200",reason="OK"} 5\n'
+                               'http_responses_total{class="4xx",code="404",reason="Not Found"} 1\n')
+
+    def test_labels(self):
+        renderer = MetricsRenderer()
+        text = render(renderer,
+                      ('counter', ('responses', {200: 1}), {'labels': {'route': '/a'}}),
+                      ('counter', ('responses', [(503, 2)]), {'labels': {'route': 'say "hi"\\\n'}}))
+        self.assertEqual(text, '# TYPE responses counter\n'
+                               'responses{route="/a",class="2xx",code="200",reason="OK"} 1\n'
+                               'responses{route="say \\"hi\\"\\\\\\n",class="5xx",code="503",'
+                               'reason="Service Unavailable"} 2\n')
+
+    def test_invalid_code(self):
+        with self.assertRaises(InvalidHttpCode):
+            render(MetricsRenderer(), ('counter', ('responses', {42: 1}), {}))
+
+    def test_unchanged_series_reused(self):
+        renderer = MetricsRenderer()
+        counts = {200: 5, 404: 1}
+        first = render(renderer, ('counter', ('responses', counts), {}))
+        line = renderer._series[b'responses{'][200][1]
+        counts[404] = 2
+        second = render(renderer, ('counter', ('responses', counts), {}))
+        self.assertIs(renderer._series[b'responses{'][200][1], line)
+        self.assertEqual(second, first.replace('} 1\n', '} 2\n'))
+
+    def test_buffer_reused(self):
+        renderer = MetricsRenderer()
+        render(renderer, ('counter', ('responses', {200: 5, 404: 1, 503: 7}), {}))
+        buffer = renderer.buffer
+        size = len(buffer)
+        text = render(renderer, ('counter', ('responses', {200: 5}), {}))
+        self.assertIs(renderer.buffer, buffer)
+        self.assertEqual(len(buffer), size)
+        self.assertEqual(text, '# TYPE responses counter\nresponses{class="2xx",code="200",reason="OK"} 5\n')
+
+    @skipIf(sys.version_info < (3, 7), 'needs http_status.asgi')
+    def test_histogram(self):
+        histograms = LatencyHistograms(codes=(503,))
+        histograms.record(503, 0.2)
+        histograms.record(503, 0.003)
+        histograms.record(503, 20.0)
+        text = render(MetricsRenderer(), ('histogram', ('latency', histograms), {'bounds': (0.01, 1.0)}))
+        self.assertEqual(text, '# TYPE latency histogram\n'
+                               'latency_bucket{class="5xx",le="0.01"} 1\n'
+                               'latency_bucket{class="5xx",le="1.0"} 2\n'
+                               'latency_bucket{class="5xx",le="+Inf"} 3\n'
+                               'latency_sum{class="5xx"} 20.203\n'
+                               'latency_count{class="5xx"} 3\n'
+                               'latency_bucket{class="5xx",code="503",reason="Service Unavailable",le="0.01"} 1\n'
+                               'latency_bucket{class="5xx",code="503",reason="Service Unavailable",le="1.0"} 2\n'
+                               'latency_bucket{class="5xx",code="503",reason="Service Unavailable",le="+Inf"} 3\n'
+                               'latency_sum{class="5xx",code="503",reason="Service Unavailable"} 20.203\n'
+                               'latency_count{class="5xx",code="503",reason="Service Unavailable"} 3\n')
+
+
+if __name__ == '__main__':
+    main()
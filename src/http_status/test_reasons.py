@@ -0,0 +1,63 @@
+#!/usr/bin/env python
+# licensed under the BSD 2-clause license
+
+from unittest import TestCase, main
+from http_status import name, reasons, InvalidHttpCode
+
+
+class ReasonsTest(TestCase):
+    def setUp(self):
+        self.index = dict(reasons._index)
+
+    def tearDown(self):
+        reasons._index.clear()
+        reasons._index.update(self.index)
+
+    def test_every_name(self):
+        for code, code_name in name.items():
+            self.assertEqual(reasons.reason_code(code_name), code)
+            self.assertEqual(reasons.reason_code(code_name.encode('latin-1')), code)
+            self.assertEqual(reasons.check_reason(code, code_name), reasons.MATCH)
+
+    def test_normalize(self):
+        self.assertEqual(reasons.normalize('Request-URI Too Long'), 'requesturitoolong')
+        self.assertEqual(reasons.normalize(b'NOT_FOUND'), b'notfound')
+        self.assertEqual(reasons.normalize(bytearray(b'Not Found')), b'notfound')
+        for phrase in ('NOT FOUND', 'not_found', ' Not-Found ', b'not found', memoryview(b'NotFound')):
+            self.assertEqual(reasons.reason_code(phrase), 404)
+
+    def test_aliases(self):
+        self.assertEqual(reasons.reason_code('Content Too Large'), 413)
+        self.assertEqual(reasons.reason_code('Unprocessable Content'), 422)
+        self.assertEqual(reasons.reason_code('Request Header Fields Too Large'), 431)
+
+    def test_equivalents(self):
+        self.assertEqual(reasons.reason_codes('Request Header Too Large'), (494, 413, 431))
+        self.assertEqual(reasons.reason_codes('Payload Too Large'), (413, 494))
+        self.assertEqual(reasons.reason_codes('Header Fields Too Large'), (431, 494))
+        self.assertEqual(reasons.check_reason(413, 'Request Header Too Large'), reasons.EQUIVALENT)
+        self.assertEqual(reasons.check_reason(494, b'Request Entity Too Large'), reasons.EQUIVALENT)
+        self.assertEqual(reasons.check_reason(413, 'Header Fields Too Large'), reasons.MISMATCH)
+
+    def test_unknown(self):
+        self.assertIsNone(reasons.reason_code('Not A Reason'))
+        self.assertEqual(reasons.reason_code('Not A Reason', 0), 0)
+        self.assertEqual(reasons.reason_codes(''), ())
+        self.assertEqual(reasons.check_reason(200, 'Not A Reason'), reasons.UNKNOWN)
+        self.assertEqual(reasons.check_reason(200, 'Not Found'), reasons.MISMATCH)
+
+    def test_add_reason(self):
+        reasons.add_reason(599, 'Network Connect Timeout Error')
+        self.assertEqual(reasons.reason_code(b'network connect timeout error'), 599)
+        reasons.add_reason(598, 'Not Found')
+        self.assertEqual(reasons.reason_codes('Not Found'), (404, 598))
+        with self.assertRaises(InvalidHttpCode):
+            reasons.add_reason(600, 'Too High')
+
+    def test_index_is_read_only(self):
+        with self.assertRaises(TypeError):
+            reasons.index['notfound'] = (200,)
+
+
+if __name__ == '__main__':
+    main()
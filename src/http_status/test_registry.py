@@ -0,0 +1,89 @@
+#!/usr/bin/env python
+# licensed under the BSD 2-clause license
+
+import pickle
+from unittest import TestCase, main
+import http_status
+from http_status import registry, Status, NoneStatus, InvalidHttpCode, validate_http_code
+
+cloudflare = registry.Registry('cloudflare', {520: 'Web Server Returned an Unknown Error', 522: 'Connection Timed Out'},
+                               {522: 'The origin server did not answer in time.'})
+
+
+class RegistryTest(TestCase):
+    def setUp(self):
+        self.snapshot = registry.Snapshot(registry.rfc, registry.nginx, cloudflare)
+
+    def tearDown(self):
+        registry.activate(registry.default)
+
+    def test_default_matches_tables(self):
+        self.assertEqual(dict(registry.default.name), dict(http_status.name))
+        self.assertEqual(dict(registry.default.description), dict(http_status.description))
+        self.assertEqual(registry.default.name_table, http_status._name_table)
+        self.assertIs(registry.active(), registry.default)
+
+    def test_vendor_registries(self):
+        self.assertEqual(sorted(registry.microsoft.names), [440, 449, 450])
+        self.assertEqual(sorted(registry.nginx.names), [444, 494, 495, 496, 497, 499])
+        self.assertEqual(sorted(registry.apache.names), [509])
+        self.assertNotIn(494, registry.rfc.names)
+        self.assertIn(404, registry.rfc.names)
+
+    def test_status(self):
+        status = Status(522, snapshot=self.snapshot)
+        self.assertEqual(status.name, 'Connection Timed Out')
+        self.assertEqual(status.description, 'The origin server did not answer in time.')
+        self.assertEqual(status.__unicode__(), 'HTTP 522 Connection Timed Out')
+        self.assertEqual(Status(520, snapshot=self.snapshot).description, 'No HTTP Description')
+        self.assertIsNone(NoneStatus(520, snapshot=self.snapshot).description)
+        with self.assertRaises(InvalidHttpCode):
+            Status(440, snapshot=self.snapshot)
+        self.assertEqual(Status(440, strict=False, snapshot=self.snapshot).code, 0)
+        with self.assertRaises(InvalidHttpCode):
+            status.code = 521
+
+    def test_validate(self):
+        self.assertEqual(validate_http_code('522', snapshot=self.snapshot), 522)
+        self.assertEqual(validate_http_code(440, strict=False, default_http_code=None, snapshot=self.snapshot), None)
+        self.assertEqual(validate_http_code(999, strict=False, snapshot=self.snapshot), 0)
+        with self.assertRaises(InvalidHttpCode):
+            validate_http_code(480, snapshot=registry.default)
+        self.assertIn(404, self.snapshot)
+        self.assertNotIn(440, self.snapshot)
+        self.assertNotIn('nope', self.snapshot)
+
+    def test_override(self):
+        renamed = registry.Registry('renamed', {404: 'Nothing Here'})
+        snapshot = self.snapshot.extend(renamed)
+        self.assertEqual(snapshot.name[404], 'Nothing Here')
+        self.assertNotIn(404, snapshot.description)
+        self.assertEqual(self.snapshot.name[404], 'Not Found')
+        self.assertEqual(http_status.name[404], 'Not Found')
+
+    def test_immutable(self):
+        with self.assertRaises(AttributeError):
+            self.snapshot.name_table = ()
+        with self.assertRaises(AttributeError):
+            cloudflare.label = 'other'
+        with self.assertRaises(TypeError):
+            cloudflare.names[521] = 'Web Server Is Down'
+        with self.assertRaises(ValueError):
+            registry.Registry('bad', {}, {520: 'No name'})
+        with self.assertRaises(InvalidHttpCode):
+            registry.Registry('bad', {600: 'Too High'})
+
+    def test_activate(self):
+        registry.activate(registry.active().extend(cloudflare))
+        self.assertEqual(Status(520, snapshot=registry.active()).name, 'Web Server Returned an Unknown Error')
+        with self.assertRaises(TypeError):
+            registry.activate(None)
+
+    def test_pickle(self):
+        status = pickle.loads(pickle.dumps(Status(522, snapshot=self.snapshot)))
+        self.assertEqual(status.name, 'Connection Timed Out')
+        self.assertEqual(dict(status.snapshot.name), dict(self.snapshot.name))
+
+
+if __name__ == '__main__':
+    main()
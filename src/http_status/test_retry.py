@@ -0,0 +1,185 @@
+#!/usr/bin/env python
+# licensed under the BSD 2-clause license
+
+import email.utils
+import gc
+import threading
+from unittest import TestCase, main
+from http_status import Status
+from http_status.retry import (CircuitBreaker, RetryClassifier, parse_retry_after, CLOSED, FAILURE, HALF_OPEN,
+                               OPEN, RETRY, USE_RETRY_AFTER)
+
+
+class Clock(object):
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class RetryClassifierTest(TestCase):
+    def setUp(self):
+        self.classifier = RetryClassifier(random=lambda: 0.5)
+
+    def test_decisions(self):
+        decision = self.classifier.decision
+        self.assertEqual(decision(200), 0)
+        self.assertEqual(decision(404), 0)
+        self.assertEqual(decision(408), RETRY)
+        self.assertEqual(decision(429), RETRY | USE_RETRY_AFTER | FAILURE)
+        self.assertEqual(decision(500), FAILURE)
+        self.assertEqual(decision(501), 0)
+        self.assertEqual(decision(Status(503)), RETRY | USE_RETRY_AFTER | FAILURE)
+        self.assertEqual(decision(Status.of(504)), RETRY | FAILURE)
+        self.assertEqual(decision(None), FAILURE)
+        self.assertEqual(decision('999'), FAILURE)
+
+    def test_custom(self):
+        classifier = RetryClassifier(retry=('5xx',), failures=('5xx',), exclude=(501, 505))
+        self.assertEqual(classifier.decision(500), RETRY | FAILURE)
+        self.assertEqual(classifier.decision(505), RETRY)
+        self.assertEqual(classifier.decision(429), USE_RETRY_AFTER)
+
+    def test_backoff(self):
+        delay = self.classifier.retry_delay
+        self.assertEqual(delay(503, 1), 0.05)
+        self.assertEqual(delay(503, 2), 0.1)
+        self.assertIsNone(delay(503, 3))
+        self.assertIsNone(delay(404, 1))
+        self.assertEqual(RetryClassifier(attempts=10, cap=1.0, random=lambda: 1.0).retry_delay(502, 9), 1.0)
+
+    def test_retry_after(self):
+        delay = self.classifier.retry_delay
+        self.assertEqual(delay(429, 1, retry_after='2'), 2.0)
+        self.assertEqual(delay(503, 1, retry_after=b' 30 '), 30.0)
+        self.assertIsNone(delay(429, 1, retry_after='120'))
+        self.assertEqual(delay(429, 1, retry_after='soon'), 0.05)
+        # only 429 and 503 honour Retry-After
+        self.assertEqual(delay(502, 1, retry_after='2'), 0.05)
+
+    def test_parse_retry_after(self):
+        self.assertEqual(parse_retry_after('Wed, 21 Oct 2015 07:28:00 GMT', now=1445412450.0), 30.0)
+        self.assertEqual(parse_retry_after('Wed, 21 Oct 2015 07:28:00 GMT', now=1445412500.0), 0.0)
+        date = email.utils.formatdate(1445412480.0, usegmt=True)
+        self.assertEqual(parse_retry_after(date, now=1445412470.0), 10.0)
+        self.assertIsNone(parse_retry_after('tomorrow'))
+
+
+class CircuitBreakerTest(TestCase):
+    def setUp(self):
+        self.clock = Clock()
+        self.breaker = CircuitBreaker(minimum_requests=10, clock=self.clock)
+
+    def test_opens(self):
+        breaker = self.breaker
+        for index in range(9):
+            breaker.record(503)
+        self.assertEqual(breaker.state, CLOSED)
+        breaker.record(200)
+        self.assertEqual(breaker.state, CLOSED)
+        breaker.record(None)
+        self.assertEqual(breaker.state, OPEN)
+        self.assertFalse(breaker.allow())
+
+    def test_ratio(self):
+        breaker = self.breaker
+        for index in range(20):
+            breaker.record(200)
+            breaker.record(404)
+            breaker.record(503 if index % 2 else 501)
+        self.assertEqual(breaker.state, CLOSED)
+
+    def test_window(self):
+        breaker = self.breaker
+        for index in range(10):
+            self.clock.now = index * 2.0
+            breaker.record(500)
+        # 5 failures in each of two windows
+        self.assertEqual(breaker.state, CLOSED)
+
+    def test_half_open(self):
+        breaker = self.breaker
+        for index in range(10):
+            breaker.record(502)
+        self.clock.now = 29.0
+        self.assertFalse(breaker.allow())
+        breaker.record(200)
+        self.assertEqual(breaker.state, OPEN)
+        self.clock.now = 30.0
+        self.assertTrue(breaker.allow())
+        self.assertEqual(breaker.state, HALF_OPEN)
+        self.assertFalse(breaker.allow())
+        breaker.record(504)
+        self.assertEqual(breaker.state, OPEN)
+        self.assertFalse(breaker.allow())
+
+        self.clock.now = 60.0
+        self.assertTrue(breaker.allow())
+        breaker.record(200)
+        self.assertEqual(breaker.state, CLOSED)
+        self.assertTrue(breaker.allow())
+        # the failures from before the breaker opened are forgotten
+        breaker.record(502)
+        self.assertEqual(breaker.state, CLOSED)
+
+    def test_lost_probe(self):
+        breaker = self.breaker
+        for index in range(10):
+            breaker.record(502)
+        self.clock.now = 30.0
+        self.assertTrue(breaker.allow())
+        self.assertFalse(breaker.allow())
+        self.clock.now = 60.0
+        self.assertTrue(breaker.allow())
+
+    def test_late_response(self):
+        breaker = self.breaker
+        for index in range(10):
+            breaker.record(502)
+        self.clock.now = 30.0
+        self.assertTrue(breaker.allow())
+        # a response to a request sent before the breaker opened, in another thread
+        thread = threading.Thread(target=breaker.record, args=(200,))
+        thread.start()
+        thread.join()
+        self.assertEqual(breaker.state, HALF_OPEN)
+        breaker.record(503)
+        self.assertEqual(breaker.state, OPEN)
+
+    def test_concurrent_probes(self):
+        breaker = CircuitBreaker(minimum_requests=10, probes=2, clock=self.clock)
+        for index in range(10):
+            breaker.record(502)
+        self.clock.now = 30.0
+        allowed = []
+        threads = [threading.Thread(target=lambda: allowed.append(breaker.allow())) for index in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(allowed.count(True), 2)
+
+    def test_threads(self):
+        breaker = CircuitBreaker(minimum_requests=200, failure_ratio=0.5, clock=self.clock)
+
+        def work():
+            for index in range(30):
+                breaker.record(500)
+                breaker.record(200)
+
+        threads = [threading.Thread(target=work) for index in range(4)]
+        for thread in threads[:3]:
+            thread.start()
+            thread.join()
+        gc.collect()
+        # the shards of the exited threads are folded together, and still counted
+        self.assertEqual(len(breaker._shards.live), 0)
+        self.assertEqual(breaker.state, CLOSED)
+        threads[3].start()
+        threads[3].join()
+        self.assertEqual(breaker.state, OPEN)
+
+
+if __name__ == '__main__':
+    main()
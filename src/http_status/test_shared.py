@@ -0,0 +1,75 @@
+#!/usr/bin/env python
+# licensed under the BSD 2-clause license
+
+import multiprocessing
+import sys
+from unittest import TestCase, main, skipIf
+from http_status import InvalidHttpCode
+
+try:
+    from http_status.shared import SharedStatusCounter
+except ImportError:
+    SharedStatusCounter = None
+
+
+def _work(shared, codes):
+    counter = shared.claim()
+    for code in codes:
+        counter.add(code)
+
+
+@skipIf(SharedStatusCounter is None, 'multiprocessing.shared_memory is not available')
+@skipIf(sys.platform == 'win32', 'needs fork')
+class SharedStatusCounterTest(TestCase):
+    def setUp(self):
+        self.shared = SharedStatusCounter(workers=2)
+
+    def tearDown(self):
+        self.shared.close()
+        self.shared.unlink()
+
+    def run_worker(self, codes):
+        process = multiprocessing.get_context('fork').Process(target=_work, args=(self.shared, codes))
+        process.start()
+        process.join()
+        self.assertEqual(process.exitcode, 0)
+
+    def test_workers(self):
+        for _ in range(2):
+            self.run_worker([200, 200, 404])
+        snapshot = self.shared.snapshot()
+        self.assertEqual(list(snapshot), [(200, 'OK', 4), (404, 'Not Found', 2)])
+        self.assertEqual([list(row[:1]) for row in self.shared.rows()], [[0], [0]])
+        self.assertEqual(sum(row[100] for row in self.shared.rows()), 4)
+
+    def test_dead_workers_rows_are_reused(self):
+        # more worker runs than rows, as when workers are restarted
+        for _ in range(5):
+            self.run_worker([503])
+        self.assertEqual(self.shared.snapshot()[503], 5)
+
+    def test_claim_is_per_process(self):
+        first = self.shared.claim()
+        self.assertEqual(self.shared.claim().index, first.index)
+
+    def test_attach(self):
+        other = SharedStatusCounter.attach(self.shared.name, workers=2)
+        try:
+            other.worker(1).add('500', 3)
+            with self.assertRaises(InvalidHttpCode):
+                other.worker(1).add(600)
+            with self.assertRaises(IndexError):
+                other.worker(2)
+            with self.assertRaises(RuntimeError):
+                other.claim()
+        finally:
+            other.close()
+            if sys.version_info < (3, 13):
+                # attach() unregistered the block from the tracker this process shares with the creator
+                from multiprocessing import resource_tracker
+                resource_tracker.register(self.shared._memory._name, 'shared_memory')
+        self.assertEqual(self.shared.snapshot()[500], 3)
+
+
+if __name__ == '__main__':
+    main()
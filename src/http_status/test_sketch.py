@@ -0,0 +1,100 @@
+#!/usr/bin/env python
+# licensed under the BSD 2-clause license
+
+import pickle
+import random
+from collections import Counter
+from unittest import TestCase, main
+from http_status import InvalidHttpCode, Status
+from http_status.sketch import StatusSketch
+
+
+class StatusSketchTest(TestCase):
+    def test_add(self):
+        sketch = StatusSketch()
+        sketch.add('/checkout', 503)
+        sketch.add('/search', Status(500), 3)
+        sketch.add('/search', Status.of(503))
+        sketch.add(b'10.0.0.7', '429')
+        sketch.add('/', 200, 10)
+        self.assertEqual(sketch.total, 16)
+        self.assertEqual(sketch.top('5xx'), [('/search', 4), ('/checkout', 1)])
+        self.assertEqual(sketch.top(503, 1), [('/checkout', 1)])
+        self.assertEqual(sketch.top(Status(429)), [(b'10.0.0.7', 1)])
+        self.assertEqual(sketch.top('2xx'), [('/', 10)])
+        self.assertEqual(sketch.estimate('/search', '5xx'), 4)
+        self.assertEqual(sketch.estimate('/search', 500), 3)
+        self.assertEqual(sketch.estimate('/missing', 500), 0)
+
+    def test_invalid(self):
+        sketch = StatusSketch()
+        with self.assertRaises(InvalidHttpCode):
+            sketch.add('/', 42)
+        with self.assertRaises(InvalidHttpCode):
+            sketch.add('/', 'abc')
+        with self.assertRaises(KeyError):
+            sketch.top(500)
+        with self.assertRaises(ValueError):
+            StatusSketch(depth=17)
+
+    def test_from_error(self):
+        sketch = StatusSketch.from_error(0.01, 0.01)
+        self.assertEqual((sketch.width, sketch.depth), (272, 5))
+        sketch.add('/', 500)
+        self.assertEqual(sketch.estimate('/', 500), 1)
+
+    def test_accuracy(self):
+        generator = random.Random(3)
+        sketch = StatusSketch(width=512, capacity=20)
+        exact = Counter()
+        for index in range(20000):
+            path = '/item/{}'.format(int(generator.paretovariate(1.2)))
+            code = generator.choice((200, 200, 200, 404, 500, 503))
+            sketch.add(path, code)
+            exact[path, code // 100] += 1
+        for (path, digit), count in exact.items():
+            estimate = sketch.estimate(path, '{}xx'.format(digit))
+            self.assertGreaterEqual(estimate, count)
+            self.assertLessEqual(estimate - count, 2.72 / 512 * sketch.total)
+        heaviest = sorted((count, path) for (path, digit), count in exact.items() if digit == 5)[-10:]
+        self.assertEqual(set(path for path, estimate in sketch.top('5xx', 10)),
+                         set(path for count, path in heaviest))
+
+    def test_eviction(self):
+        sketch = StatusSketch(capacity=2)
+        for path, count in (('/a', 5), ('/b', 1), ('/c', 3), ('/d', 2)):
+            sketch.add(path, 500, count)
+        self.assertEqual(sketch.top('5xx'), [('/a', 5), ('/c', 3)])
+
+    def test_merge(self):
+        first = StatusSketch(capacity=2)
+        second = StatusSketch(capacity=2)
+        first.add('/a', 500, 5)
+        first.add('/b', 500, 4)
+        second.add('/b', 500, 3)
+        second.add('/c', 502, 6)
+        merged = first + second
+        self.assertEqual(merged.total, 18)
+        self.assertEqual(merged.top('5xx'), [('/b', 7), ('/c', 6)])
+        self.assertEqual(merged.top(502), [('/c', 6)])
+        self.assertEqual(first.total, 9)
+        first.merge(second)
+        self.assertEqual(first.top('5xx'), merged.top('5xx'))
+        with self.assertRaises(ValueError):
+            first.merge(StatusSketch(width=1024))
+
+    def test_pickle(self):
+        sketch = StatusSketch(width=256, depth=6, capacity=5)
+        for index in range(50):
+            sketch.add('/item/{}'.format(index % 7), 500 + index % 5)
+        copy = pickle.loads(pickle.dumps(sketch))
+        self.assertEqual(copy.top('5xx'), sketch.top('5xx'))
+        self.assertEqual(copy.estimate('/item/3', 503), sketch.estimate('/item/3', 503))
+        self.assertEqual(copy.total, 50)
+        copy = sketch.copy()
+        copy.add('/item/3', 503)
+        self.assertEqual(copy.estimate('/item/3', 503), sketch.estimate('/item/3', 503) + 1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,100 @@
+#!/usr/bin/env python
+# licensed under the BSD 2-clause license
+
+import random
+from unittest import TestCase, main
+from http_status import InvalidHttpCode, Status
+from http_status.slo import BurnRateAlert, ErrorRateTracker
+
+
+class ErrorRateTrackerTest(TestCase):
+    def test_counts(self):
+        tracker = ErrorRateTracker(codes=(503,))
+        for code in (200, 200, 503, Status.of(502), '404', 42):
+            tracker.record(code, now=100.0)
+        self.assertEqual(tracker.totals(60, now=100.0), (6, 2))
+        self.assertEqual(tracker.count('2xx', 60, now=100.0), 2)
+        self.assertEqual(tracker.count('5xx', 60, now=100.0), 2)
+        self.assertEqual(tracker.count(503, 60, now=100.0), 1)
+        self.assertEqual(tracker.count('invalid', 60, now=100.0), 1)
+        self.assertEqual(tracker.error_ratio(300, now=100.0), 2 / 6.0)
+        with self.assertRaises(KeyError):
+            tracker.count(504, 60, now=100.0)
+
+    def test_bad_codes(self):
+        tracker = ErrorRateTracker(bad=('5xx', 499), exclude=(501,))
+        for code in (499, 500, 501, 404):
+            tracker.record(code, now=0.0)
+        self.assertEqual(tracker.totals(300, now=0.0), (4, 2))
+        with self.assertRaises(InvalidHttpCode):
+            ErrorRateTracker(bad=(700,))
+
+    def test_expiry(self):
+        tracker = ErrorRateTracker()
+        tracker.record(500, now=0.0)
+        tracker.record(200, now=250.0)
+        self.assertEqual(tracker.totals(300, now=299.0), (2, 1))
+        self.assertEqual(tracker.totals(300, now=305.0), (1, 0))
+        self.assertEqual(tracker.totals(3600, now=3599.0), (2, 1))
+        self.assertEqual(tracker.totals(3600, now=3605.0), (1, 0))
+        self.assertEqual(tracker.totals(3600, now=100000.0), (0, 0))
+        tracker.record(500, now=100001.0)
+        self.assertEqual(tracker.totals(300, now=100002.0), (1, 1))
+
+    def test_matches_recount(self):
+        generator = random.Random(7)
+        tracker = ErrorRateTracker(bad=('5xx', 499))
+        events = []
+        now = 0.0
+        for step in range(5000):
+            now += generator.expovariate(1 / 2.0)
+            code = generator.choice((200, 200, 404, 499, 503))
+            tracker.record(code, now=now)
+            events.append((now, code))
+            if step % 250 == 0:
+                for seconds in (60, 300, 3600):
+                    start = (int(now // 10) - seconds // 10 + 1) * 10
+                    window = [code for time, code in events if time >= start]
+                    bad = len([code for code in window if code >= 499])
+                    self.assertEqual(tracker.totals(seconds, now=now), (len(window), bad))
+
+    def test_burn_rate(self):
+        tracker = ErrorRateTracker(objective=0.99)
+        for index in range(95):
+            tracker.record(200, now=0.0)
+        for index in range(5):
+            tracker.record(503, now=0.0)
+        self.assertAlmostEqual(tracker.burn_rate(3600, now=0.0), 5.0)
+        self.assertEqual(tracker.firing(now=0.0), [])
+        for index in range(20):
+            tracker.record(503, now=3000.0)
+        # 25 errors in 120 responses over the hour, 20 errors in 20 responses over 5 minutes
+        self.assertAlmostEqual(tracker.burn_rate(3600, now=3000.0), 25 / 1.2)
+        self.assertEqual([alert.name for alert in tracker.firing(now=3000.0)], ['page'])
+        self.assertEqual(tracker.firing(now=3400.0), [])
+
+    def test_alerts(self):
+        alerts = (BurnRateAlert('fast', 600, 60, 10), BurnRateAlert('slow', 1800, 300, 2))
+        tracker = ErrorRateTracker(objective=0.9, alerts=alerts)
+        self.assertEqual(tracker.window, 1800)
+        tracker.record(500, now=0.0)
+        tracker.record(200, now=0.0)
+        self.assertEqual([alert.name for alert in tracker.firing(now=0.0)], ['slow'])
+        with self.assertRaises(ValueError):
+            tracker.totals(3600)
+        with self.assertRaises(ValueError):
+            ErrorRateTracker(alerts=alerts, window=600)
+        with self.assertRaises(ValueError):
+            ErrorRateTracker(objective=1)
+
+    def test_clock(self):
+        now = [50.0]
+        tracker = ErrorRateTracker(clock=lambda: now[0])
+        tracker.record(200)
+        now[0] = 4000.0
+        tracker.record(Status(500))
+        self.assertEqual(tracker.totals(3600), (1, 1))
+
+
+if __name__ == '__main__':
+    main()
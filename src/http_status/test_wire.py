@@ -0,0 +1,148 @@
+#!/usr/bin/env python
+# licensed under the BSD 2-clause license
+
+from unittest import TestCase, main
+from http_status import wire, InvalidHttpCode, Status
+
+
+class WireTest(TestCase):
+    def test_status_line(self):
+        self.assertEqual(wire.status_line(404), b'HTTP/1.1 404 Not Found\r\n')
+        self.assertEqual(wire.status_line('502', version='1.0'), b'HTTP/1.0 502 Bad Gateway\r\n')
+        self.assertEqual(wire.status_line(480), b'HTTP/1.1 480 \r\n')
+        self.assertIs(wire.status_line(404), wire.status_line(404))
+
+    def test_invalid(self):
+        with self.assertRaises(InvalidHttpCode):
+            wire.status_line(99)
+        with self.assertRaises(ValueError):
+            wire.status_line(200, version='2')
+
+    def test_wsgi_status(self):
+        self.assertEqual(wire.wsgi_status(200), '200 OK')
+        self.assertEqual(wire.wsgi_status(Status(418).code), "418 I'm a Teapot")
+
+    def test_write_status_line(self):
+        buffer = bytearray(64)
+        offset = wire.write_status_line(buffer, 0, 200)
+        offset = wire.write_status_line(memoryview(buffer), offset, 304, version='1.0')
+        self.assertEqual(bytes(buffer[:offset]), b'HTTP/1.1 200 OK\r\nHTTP/1.0 304 Not Modified\r\n')
+        self.assertEqual(len(buffer), 64)
+
+
+class ParseTest(TestCase):
+    pipelined = (b'HTTP/1.1 200 OK\r\nContent-Length: 0\r\n\r\n'
+                 b'HTTP/1.1 502 Upstream Down\r\nContent-Length: 0\r\n\r\n'
+                 b'HTTP/1.1 099 Odd\r\nContent-Length: 0\r\n\r\n'
+                 b'HTTP/1.0 480\n\n')
+
+    def test_parse(self):
+        self.assertEqual(wire.parse_status_line(b'HTTP/1.1 502 Bad Gateway\r\n'), (502, (1, 1), True, 26))
+        self.assertEqual(wire.parse_status_line(b'HTTP/1.0 404 not found\n'), (404, (1, 0), False, 23))
+        self.assertEqual(wire.parse_status_line(b'HTTP/1.1 480\r\n'), (480, (1, 1), True, 14))
+        self.assertEqual(wire.parse_status_line(b'HTTP/1.1 200 \r\n'), (200, (1, 1), False, 15))
+        self.assertEqual(wire.parse_status_line(b'HTTP/1.1 480 \r\n'), (480, (1, 1), True, 15))
+        self.assertEqual(wire.parse_status_line(b'HTTP/1.1 480 Odd\r\n'), (480, (1, 1), False, 18))
+
+    def test_buffer_types(self):
+        data = b'..HTTP/1.1 404 Not Found\r\nServer: x\r\n'
+        for buffer in (data, bytearray(data), memoryview(data)):
+            self.assertEqual(wire.parse_status_line(buffer, 2), (404, (1, 1), True, 26))
+
+    def test_incomplete(self):
+        self.assertIsNone(wire.parse_status_line(b'HTTP/1.1 200 O'))
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            wire.parse_status_line(b'HTTP/1.1 OK\r\n')
+        with self.assertRaises(InvalidHttpCode):
+            wire.parse_status_line(b'HTTP/1.1 099 Odd\r\n')
+
+    def test_scan(self):
+        expected = [(0, 200, (1, 1), True), (38, 502, (1, 1), False), (126, 480, (1, 0), True)]
+        self.assertEqual(list(wire.scan_status_lines(self.pipelined)), expected)
+        self.assertEqual(list(wire.scan_status_lines(memoryview(self.pipelined), 38)), expected[1:])
+
+    def test_scan_framing(self):
+        data = (b'HTTP/1.1 200 OK\r\nContent-Length: 19\r\n\r\nHTTP/1.1 404 Body\r\n'
+                b'HTTP/1.1 100 Continue\r\n\r\n'
+                b'HTTP/1.1 304 Not Modified\r\ncontent-length: 10\r\n\r\n'
+                b'HTTP/1.1 200 OK\r\nTransfer-Encoding: chunked\r\n\r\n0\r\n\r\n'
+                b'HTTP/1.1 404 Not Found\r\n\r\n')
+        expected = [(0, 200, (1, 1), True), (58, 100, (1, 1), True), (83, 304, (1, 1), True),
+                    (132, 200, (1, 1), True)]
+        self.assertEqual(list(wire.scan_status_lines(data)), expected)
+
+    def test_scan_stops(self):
+        for data in (b'HTTP/1.1 200 OK\r\n\r\nHTTP/1.1 404 Not Found\r\n\r\n',
+                     b'HTTP/1.1 200 OK\r\nContent-Length: 4\r\n\r\nabc',
+                     b'HTTP/1.1 200 OK\r\nContent-Length: 0\r\n',
+                     b'HTTP/1.1 200 OK\r\nContent-Length: 0\r\n\r\nxHTTP/1.1 404 Not Found\r\n\r\n'):
+            self.assertEqual(list(wire.scan_status_lines(data)), [(0, 200, (1, 1), True)])
+
+
+# HPACK Huffman codes of the digits, as bit strings, RFC 7541 appendix B.
+huffman_digits = dict((bits, str(digit)) for digit, bits in enumerate(
+    ('00000', '00001', '00010', '011001', '011010', '011011', '011100', '011101', '011110', '011111')))
+
+
+def decode_literal(data):
+    """Decode an HPACK/QPACK string literal of a status code, not longer than 126 bytes."""
+    huffman, length = data[0] & 0x80, data[0] & 0x7f
+    value = bytes(data[1:1 + length])
+    if not huffman:
+        return value.decode('ascii')
+    bits = ''.join('{:08b}'.format(byte) for byte in bytearray(value))
+    decoded = ''
+    while bits and bits.strip('1'):
+        for size in (5, 6):
+            if bits[:size] in huffman_digits:
+                decoded += huffman_digits[bits[:size]]
+                bits = bits[size:]
+                break
+        else:
+            raise ValueError(bits)
+    return decoded
+
+
+class PseudoHeaderTest(TestCase):
+    def test_hpack_indexed(self):
+        self.assertEqual(wire.hpack_status(200), b'\x88')
+        self.assertEqual(wire.hpack_status('500'), b'\x8e')
+        self.assertEqual([wire.hpack_statuses[code][0] & 0x7f for code in (200, 204, 206, 304, 400, 404, 500)],
+                         list(range(8, 15)))
+
+    def test_qpack_indexed(self):
+        self.assertEqual(wire.qpack_status(103), b'\xd8')
+        self.assertEqual(wire.qpack_status(503), b'\xdc')
+        # indexes of 63 and above continue past the 6-bit prefix
+        self.assertEqual(wire.qpack_status(100), b'\xff\x00')
+        self.assertEqual(wire.qpack_status(500), b'\xff\x08')
+
+    def test_literals(self):
+        # RFC 7541 C.6.1, the Huffman coded value of :status 302
+        self.assertEqual(wire.hpack_status(302), b'\x08\x82\x64\x02')
+        self.assertEqual(wire.qpack_status(418), b'\x5f\x09\x03418')
+        for code in range(100, 600):
+            if code not in (200, 204, 206, 304, 400, 404, 500):
+                field = wire.hpack_statuses[code]
+                self.assertEqual(field[:1], b'\x08')
+                self.assertEqual(decode_literal(bytearray(field[1:])), str(code))
+            field = wire.qpack_statuses[code]
+            if field[:2] == b'\x5f\x09':
+                self.assertEqual(decode_literal(bytearray(field[2:])), str(code))
+
+    def test_integer(self):
+        # RFC 7541 C.1.2, 1337 with a 5-bit prefix
+        self.assertEqual(bytes(wire._encode_integer(1337, 5, 0)), b'\x1f\x9a\x0a')
+
+    def test_status(self):
+        self.assertEqual(Status.of(404).hpack, b'\x8d')
+        self.assertEqual(Status(302).qpack, b'\xff\x03')
+        self.assertIsNone(Status(0, strict=False).hpack)
+        with self.assertRaises(InvalidHttpCode):
+            wire.qpack_status(600)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,128 @@
+#!/usr/bin/env python
+# licensed under the BSD 2-clause license
+
+import gc
+import threading
+from unittest import TestCase, main
+from http_status.wsgi import StatusMiddleware
+
+
+def make_app(status, route=None):
+    def app(environ, start_response):
+        if route is not None:
+            environ['http_status.route'] = route
+        start_response(status, [('Content-Type', 'text/plain')])
+        return [b'body']
+    return app
+
+
+def lazy_app(environ, start_response):
+    start_response('201 Created', [])
+    yield b'created'
+
+
+class Clock(object):
+    """A clock that advances by a quarter second every time it's read."""
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        self.now += 0.25
+        return self.now
+
+
+def call(app, environ=None):
+    responses = []
+
+    def start_response(status, headers, exc_info=None):
+        responses.append(status)
+
+    body = b''.join(app(environ if environ is not None else {}, start_response))
+    return responses[-1], body
+
+
+class StatusMiddlewareTest(TestCase):
+    def test_counts(self):
+        app = StatusMiddleware(make_app('404 Not Found'), clock=Clock())
+        self.assertEqual(call(app), ('404 Not Found', b'body'))
+        call(app)
+        self.assertEqual(list(app.counts()), [(404, 'Not Found', 2)])
+        self.assertEqual(app.latency(), {404: (2, 0.5)})
+        self.assertEqual(app.mismatches().total(), 0)
+        self.assertEqual(app.routes(), {})
+
+    def test_empty(self):
+        app = StatusMiddleware(make_app('200 OK'))
+        self.assertEqual(app.counts().total(), 0)
+        self.assertEqual(app.latency(), {})
+        self.assertEqual(app.invalid(), 0)
+
+    def test_mismatches(self):
+        app = StatusMiddleware(make_app('200 Fine'))
+        call(app)
+        StatusMiddleware.__call__(app, {}, lambda *args: None)
+        self.assertEqual(app.counts()[200], 2)
+        self.assertEqual(app.mismatches()[200], 2)
+        unnamed = StatusMiddleware(make_app('480 Custom'))
+        call(unnamed)
+        self.assertEqual(unnamed.counts()[480], 1)
+        self.assertEqual(unnamed.mismatches().total(), 0)
+
+    def test_invalid(self):
+        app = StatusMiddleware(make_app('999 Odd'))
+        call(app)
+        call(app)
+        self.assertEqual(app.invalid(), 2)
+        self.assertEqual(app.counts().total(), 0)
+        app = StatusMiddleware(make_app('2000 Odd'))
+        call(app)
+        self.assertEqual(app.invalid(), 1)
+        self.assertEqual(app.counts().total(), 0)
+
+    def test_routes(self):
+        app = StatusMiddleware(make_app('200 OK', route='/users/<id>'))
+        call(app)
+        call(app)
+        routes = app.routes()
+        self.assertEqual(list(routes), ['/users/<id>'])
+        self.assertEqual(routes['/users/<id>'][200], 2)
+
+    def test_custom_route(self):
+        app = StatusMiddleware(make_app('200 OK'), route=lambda environ: environ.get('PATH_INFO'))
+        call(app, {'PATH_INFO': '/health'})
+        self.assertEqual(app.routes()['/health'][200], 1)
+
+    def test_lazy_start_response(self):
+        app = StatusMiddleware(lazy_app, clock=Clock())
+        self.assertEqual(call(app), ('201 Created', b'created'))
+        self.assertEqual(app.latency(), {201: (1, 0.25)})
+
+    def test_threads(self):
+        app = StatusMiddleware(make_app('503 Service Unavailable'))
+
+        def work():
+            for _ in range(100):
+                call(app)
+
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(app.counts()[503], 400)
+        self.assertEqual(app.latency()[503][0], 400)
+
+    def test_exited_threads(self):
+        app = StatusMiddleware(make_app('200 OK', route='/'))
+        for _ in range(20):
+            thread = threading.Thread(target=call, args=(app,))
+            thread.start()
+            thread.join()
+        gc.collect()
+        self.assertLessEqual(len(app._shards.live), 1)
+        self.assertEqual(app.counts()[200], 20)
+        self.assertEqual(app.routes()['/'][200], 20)
+
+
+if __name__ == '__main__':
+    main()
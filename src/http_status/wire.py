@@ -0,0 +1,259 @@
+#!/usr/bin/env python
+# licensed under the BSD 2-clause license
+
+"""Status lines on the wire: pre-rendered for writing responses, and parsed from raw bytes.
+
+Status lines for every code from 100 to 599 are built once, when this module
+is imported, so responses don't need to format them per request::
+
+    >>> from http_status import wire
+    >>> wire.status_line(404)
+    b'HTTP/1.1 404 Not Found\\r\\n'
+    >>> wire.wsgi_status(404)
+    '404 Not Found'
+
+Lines are ``bytes``, so they can be copied straight into a response buffer::
+
+    >>> buffer = bytearray(4096)
+    >>> offset = wire.write_status_line(buffer, 0, 503)
+
+Codes without a name get an empty reason phrase, e.g. ``b'HTTP/1.1 480 \\r\\n'``.
+
+Status lines of upstream responses can be parsed straight from ``bytes``,
+``bytearray`` or ``memoryview`` buffers, without decoding them::
+
+    >>> wire.parse_status_line(b'HTTP/1.1 502 Bad Gateway\\r\\n')
+    (502, (1, 1), True, 26)
+
+For HTTP/2 and HTTP/3, the ``:status`` pseudo-header of every code is
+pre-encoded for HPACK and QPACK. Codes in the static tables use the indexed
+representation, others a literal with the static ``:status`` name and a
+Huffman coded value where that's shorter::
+
+    >>> wire.hpack_status(404)
+    b'\\x8d'
+    >>> wire.hpack_status(302)
+    b'\\x08\\x82d\\x02'
+    >>> wire.qpack_status(503)
+    b'\\xdc'
+
+These are field representations that don't touch the dynamic table, so they
+can be copied into any header block.
+"""
+
+import re
+
+from . import _name_table, _table_size, validate_http_code, InvalidHttpCode
+
+
+def _build_lines(template, encode=True):
+    """Return a tuple indexed by code of template rendered for codes 100 to 599, None below that."""
+    lines = [None] * _table_size
+    for code in range(100, _table_size):
+        line = template.format(code=code, reason=_name_table[code] or '')
+        lines[code] = line.encode('latin-1') if encode else line
+    return tuple(lines)
+
+
+# Status lines indexed by code.
+http10_status_lines = _build_lines('HTTP/1.0 {code} {reason}\r\n')
+http11_status_lines = _build_lines('HTTP/1.1 {code} {reason}\r\n')
+
+# WSGI status strings indexed by code, e.g. '404 Not Found'.
+wsgi_statuses = _build_lines('{code} {reason}', encode=False)
+
+_status_lines = {
+    '1.0': http10_status_lines,
+    '1.1': http11_status_lines,
+}
+
+
+def status_line(code, version='1.1'):
+    """Return the status line for the given code and HTTP version ('1.0' or '1.1') as bytes."""
+    try:
+        lines = _status_lines[version]
+    except KeyError:
+        raise ValueError('no status lines for HTTP version {!r}'.format(version))
+    return lines[validate_http_code(code)]
+
+
+def wsgi_status(code):
+    """Return the WSGI status string for the given code."""
+    return wsgi_statuses[validate_http_code(code)]
+
+
+def write_status_line(buffer, offset, code, version='1.1'):
+    """Write the status line for code into a bytearray or writable memoryview at offset.
+
+    Returns the offset just past the written line.
+    """
+    line = status_line(code, version)
+    end = offset + len(line)
+    buffer[offset:end] = line
+    return end
+
+
+# Names as bytes, for comparing reason phrases without decoding them.
+_reason_phrases = tuple(None if code_name is None else code_name.encode('latin-1') for code_name in _name_table)
+
+# Works on any buffer, so memoryviews are matched in place.
+_status_line = re.compile(br'HTTP/([0-9])\.([0-9]) ([0-9]{3})(?: ([^\r\n]*))?\r?\n')
+_newline = re.compile(br'\n')
+
+# The header fields framing a response body, or the empty line ending the headers, from the newline before them.
+_framing = re.compile(br'\n(?:content-length:[ \t]*([0-9]+)|(transfer-encoding):)|\n\r?\n', re.IGNORECASE)
+
+
+def _parse_match(data, match):
+    """Return (code, version, reason_matches, end) for a _status_line match."""
+    # the fields before the reason phrase are at fixed positions, 'HTTP/1.1 404 '
+    offset = match.start()
+    code = data[offset + 9] * 100 + data[offset + 10] * 10 + data[offset + 11] - 5328
+    if code < 100 or code > 599:
+        raise InvalidHttpCode('{} is not a valid HTTP status code'.format(code))
+    version = (data[offset + 5] - 48, data[offset + 7] - 48)
+
+    reason = _reason_phrases[code]
+    reason_end = match.end(4)
+    if reason is None:
+        matches = reason_end < 0 or reason_end == offset + 13
+    elif reason_end - offset - 13 != len(reason):
+        matches = False
+    elif type(data) is memoryview:
+        matches = data[offset + 13:reason_end] == reason
+    else:
+        matches = data.startswith(reason, offset + 13)
+    return code, version, matches, match.end()
+
+
+def parse_status_line(data, offset=0):
+    """Parse the HTTP/1.x status line starting at offset in a bytes-like buffer.
+
+    Returns ``(code, version, reason_matches, end)``, where version is a tuple
+    such as ``(1, 1)``, reason_matches tells whether the reason phrase is the
+    one in ``name`` for the code (an empty phrase matches codes without a
+    name), and end is the offset just past the line. Returns None if the
+    buffer doesn't hold a full line yet.
+
+    Raises ValueError if the data isn't a status line, and InvalidHttpCode if
+    the code is outside 100 to 599.
+    """
+    match = _status_line.match(data, offset)
+    if match is None:
+        if _newline.search(data, offset) is None:
+            return None
+        raise ValueError('no HTTP status line at offset {}'.format(offset))
+    return _parse_match(data, match)
+
+
+def scan_status_lines(data, offset=0):
+    """Yield ``(offset, code, version, reason_matches)`` for every response in a buffer of pipelined responses.
+
+    The first response starts at offset, and the next one after the body of
+    each, by its Content-Length. Responses with a 1xx code, 204 or 304 have
+    no body. Scanning stops at data that isn't a status line, at an
+    incomplete response, and after a response whose body has to be read to
+    find its end: one with a Transfer-Encoding such as chunked, or without a
+    Content-Length. Responses to HEAD requests have no body either, which
+    can't be told from the response, so buffers holding them can't be
+    scanned. Responses with invalid codes are skipped.
+    """
+    length = len(data)
+    while offset < length:
+        match = _status_line.match(data, offset)
+        if match is None:
+            return
+        try:
+            code, version, reason_matches, end = _parse_match(data, match)
+        except InvalidHttpCode:
+            code = None
+            end = match.end()
+        else:
+            yield offset, code, version, reason_matches
+
+        content_length = None
+        for field in _framing.finditer(data, end - 1):
+            if field.group(2) is not None:
+                return
+            if field.group(1) is None:
+                break
+            content_length = field.group(1)
+        else:
+            # the headers aren't complete
+            return
+        offset = field.end()
+        if code is not None and (code < 200 or code == 204 or code == 304):
+            continue
+        if content_length is None:
+            return
+        offset += int(content_length)
+
+
+# HPACK (RFC 7541) and QPACK (RFC 9204) static table indexes of :status fields.
+_hpack_static = {200: 8, 204: 9, 206: 10, 304: 11, 400: 12, 404: 13, 500: 14}
+_qpack_static = {103: 24, 200: 25, 304: 26, 404: 27, 503: 28, 100: 63, 204: 64,
+                 206: 65, 302: 66, 400: 67, 403: 68, 421: 69, 425: 70, 500: 71}
+
+# HPACK Huffman codes of the digits, (code, bit length), RFC 7541 appendix B.
+_huffman_digits = ((0x0, 5), (0x1, 5), (0x2, 5), (0x19, 6), (0x1a, 6),
+                   (0x1b, 6), (0x1c, 6), (0x1d, 6), (0x1e, 6), (0x1f, 6))
+
+
+def _encode_integer(value, prefix_bits, flags):
+    """Return value as an HPACK/QPACK integer with an N-bit prefix, flags set in the first byte."""
+    limit = (1 << prefix_bits) - 1
+    if value < limit:
+        return bytearray((flags | value,))
+    encoded = bytearray((flags | limit,))
+    value -= limit
+    while value >= 128:
+        encoded.append(value & 0x7f | 0x80)
+        value >>= 7
+    encoded.append(value)
+    return encoded
+
+
+def _encode_code(code):
+    """Return a code as an HPACK/QPACK string literal, Huffman coded if that's shorter."""
+    digits = str(code)
+    bits = length = 0
+    for digit in digits:
+        value, size = _huffman_digits[ord(digit) - 48]
+        bits = bits << size | value
+        length += size
+    padding = -length % 8
+    # pad to a whole byte with the most significant bits of EOS, all ones
+    bits = bits << padding | (1 << padding) - 1
+    huffman = bytearray((bits >> shift) & 0xff for shift in range(length + padding - 8, -1, -8))
+    if len(huffman) < len(digits):
+        return bytes(_encode_integer(len(huffman), 7, 0x80) + huffman)
+    return bytes(_encode_integer(len(digits), 7, 0)) + digits.encode('ascii')
+
+
+def _build_fields(static, indexed, literal):
+    """Return a tuple indexed by code of encoded :status fields, None below 100."""
+    fields = [None] * _table_size
+    for code in range(100, _table_size):
+        if code in static:
+            fields[code] = bytes(indexed(static[code]))
+        else:
+            fields[code] = bytes(literal) + _encode_code(code)
+    return tuple(fields)
+
+
+# Encoded :status fields indexed by code. Literals are HPACK "without indexing",
+# and QPACK literals with a static name reference, both naming the first :status entry.
+hpack_statuses = _build_fields(_hpack_static, lambda index: _encode_integer(index, 7, 0x80),
+                               _encode_integer(_hpack_static[200], 4, 0x00))
+qpack_statuses = _build_fields(_qpack_static, lambda index: _encode_integer(index, 6, 0xc0),
+                               _encode_integer(_qpack_static[103], 4, 0x50))
+
+
+def hpack_status(code):
+    """Return the HPACK encoded :status field for the given code."""
+    return hpack_statuses[validate_http_code(code)]
+
+
+def qpack_status(code):
+    """Return the QPACK encoded :status field line for the given code."""
+    return qpack_statuses[validate_http_code(code)]
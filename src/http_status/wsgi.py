@@ -0,0 +1,220 @@
+#!/usr/bin/env python
+# licensed under the BSD 2-clause license
+
+"""WSGI middleware counting response status codes, per route, with their latency.
+
+Wrap any WSGI application, such as a Flask or Django one::
+
+    >>> from http_status.wsgi import StatusMiddleware
+    >>> app.wsgi_app = StatusMiddleware(app.wsgi_app)
+
+    >>> list(app.wsgi_app.counts())
+    [(200, 'OK', 1520), (404, 'Not Found', 3)]
+    >>> app.wsgi_app.latency()
+    {200: (1520, 3.0412), 404: (3, 0.0021)}
+
+Status strings such as ``'404 Not Found'`` are turned into codes with a
+single dict lookup. Strings whose reason phrase isn't the one in ``name``
+are parsed the slow way, and counted by ``mismatches()``.
+
+Routes are read from the environ after the application returns, from the
+``'http_status.route'`` key by default, so the application should store its
+route template there, e.g. in a Flask ``before_request`` hook::
+
+    request.environ['http_status.route'] = request.url_rule.rule
+
+Latency is the time until the application returns its response iterable,
+or until the first chunk of the body for applications that only call
+``start_response`` then.
+
+Every thread records into its own arrays, which reads add together, so
+requests never take a lock. The arrays of a thread are folded into shared
+ones when it exits.
+"""
+
+import operator
+import threading
+import time
+from array import array
+
+from . import _name_table, _ThreadStates, validate_http_code
+from .counter import StatusCounter, minimum, maximum
+from .wire import wsgi_statuses
+
+_slots = maximum - minimum + 1
+
+# {status string: index into the count arrays} for the status string of every code, e.g. '404 Not Found'.
+_status_indexes = dict((status, code - minimum) for code, status in enumerate(wsgi_statuses) if status is not None)
+
+try:
+    _clock = time.perf_counter
+except AttributeError:
+    _clock = time.time
+
+
+class _Shard(threading.local):
+    """Per-thread counts of a StatusMiddleware, None until the thread first records."""
+    counts = None
+
+
+def _fold(base, shard):
+    """Add the counts of a shard of a thread that exited to base, and return it."""
+    for attr in ('counts', 'seconds', 'mismatches', 'invalid'):
+        base[attr] = array(base[attr].typecode, map(operator.add, base[attr], shard[attr]))
+    routes = base['routes']
+    for route, counts in shard['routes'].items():
+        routes[route] = array('Q', map(operator.add, routes[route], counts)) if route in routes else counts
+    return base
+
+
+class StatusMiddleware(object):
+    """WSGI middleware counting status codes, per route and mismatched, and their latency."""
+
+    def __init__(self, app, route='http_status.route', clock=_clock):
+        """Wrap app. route is the environ key holding the route, or a function taking the environ."""
+        self.app = app
+        self.route = route
+        self.clock = clock
+        self._shards = _ThreadStates(_fold)
+        self._local = _Shard()
+
+    def __call__(self, environ, start_response):
+        clock = self.clock
+        start = clock()
+        statuses = []
+
+        def _start_response(status, headers, exc_info=None):
+            statuses.append(status)
+            return start_response(status, headers, exc_info)
+
+        result = self.app(environ, _start_response)
+        if not statuses:
+            return self._record_on_first_chunk(result, statuses, start, environ)
+        elapsed = clock() - start
+
+        # the common case, inlined: a known status string on a thread that has recorded before
+        index = _status_indexes.get(statuses[-1])
+        shard = self._local
+        counts = shard.counts
+        if index is None or counts is None:
+            self._record(statuses[-1], elapsed, environ)
+            return result
+        counts[index] += 1
+        shard.seconds[index] += elapsed
+        route = self.route
+        route = environ.get(route) if route.__class__ is str else route(environ)
+        if route is not None:
+            self._record_route(shard, route, index)
+        return result
+
+    def _record_on_first_chunk(self, result, statuses, start, environ):
+        """Yield the body of an application that calls start_response lazily, recording once it has."""
+        try:
+            recorded = False
+            for chunk in result:
+                if not recorded and statuses:
+                    self._record(statuses[-1], self.clock() - start, environ)
+                    recorded = True
+                yield chunk
+            if not recorded and statuses:
+                self._record(statuses[-1], self.clock() - start, environ)
+        finally:
+            if hasattr(result, 'close'):
+                result.close()
+
+    def _shard(self):
+        """Return the shard of the calling thread, creating it on first use."""
+        shard = self._local
+        if shard.counts is None:
+            shard.counts = array('Q', [0]) * _slots
+            shard.seconds = array('d', [0.0]) * _slots
+            shard.mismatches = array('Q', [0]) * _slots
+            shard.routes = {}
+            shard.invalid = array('Q', [0])
+            # the same arrays, without the owner register() adds to the shard
+            self._shards.register(shard, dict(shard.__dict__))
+        return shard
+
+    def _record(self, status, elapsed, environ):
+        """Count a response with the given status string."""
+        shard = self._local
+        if shard.counts is None:
+            shard = self._shard()
+        index = _status_indexes.get(status)
+        if index is None:
+            # the code must be followed by a space and a reason phrase, or be the whole status
+            code = validate_http_code(status[:3], minimum, maximum, strict=False) if status[3:4] in (' ', '') else 0
+            if not code:
+                shard.invalid[0] += 1
+                return
+            if _name_table[code] is not None and status[4:] != _name_table[code]:
+                shard.mismatches[code - minimum] += 1
+            index = code - minimum
+
+        shard.counts[index] += 1
+        shard.seconds[index] += elapsed
+        route = self.route
+        route = environ.get(route) if route.__class__ is str else route(environ)
+        if route is not None:
+            self._record_route(shard, route, index)
+
+    def _record_route(self, shard, route, index):
+        """Count a response to a route."""
+        counts = shard.routes.get(route)
+        if counts is None:
+            counts = shard.routes[route] = array('Q', [0]) * _slots
+        counts[index] += 1
+
+    def _sum(self, attr):
+        """Return the given per-thread arrays added together."""
+        total = None
+        with self._shards.lock:
+            for shard in self._shards.states():
+                values = shard[attr]
+                total = array(values.typecode, values if total is None else map(operator.add, total, values))
+        return total
+
+    def _counter(self, counts):
+        """Return an array of counts as a StatusCounter."""
+        counter = StatusCounter()
+        if counts is not None:
+            counter._shard()[:] = counts
+        return counter
+
+    def counts(self):
+        """Return the number of responses per code, as a StatusCounter."""
+        return self._counter(self._sum('counts'))
+
+    def mismatches(self):
+        """Return the number of responses per code whose reason phrase wasn't the one in name."""
+        return self._counter(self._sum('mismatches'))
+
+    def invalid(self):
+        """Return the number of responses with a status outside 100 to 599."""
+        with self._shards.lock:
+            return sum(shard['invalid'][0] for shard in self._shards.states())
+
+    def routes(self):
+        """Return a dict of {route: StatusCounter} for responses whose route was known."""
+        with self._shards.lock:
+            # copied under the lock, as exiting threads fold their routes into the base ones
+            shard_routes = [list(shard['routes'].items()) for shard in self._shards.states()]
+        routes = {}
+        for items in shard_routes:
+            for route, counts in items:
+                counter = routes.get(route)
+                if counter is None:
+                    counter = routes[route] = StatusCounter()
+                total = counter._shard()
+                for index, count in enumerate(counts):
+                    if count:
+                        total[index] += count
+        return routes
+
+    def latency(self):
+        """Return a dict of {code: (responses, total seconds)} for every code seen."""
+        counts = self._sum('counts')
+        seconds = self._sum('seconds')
+        if counts is None:
+            return {}
+        return dict((index + minimum, (count, seconds[index])) for index, count in enumerate(counts) if count)